@@ -50,11 +50,15 @@
 
 
 import os
+import atexit
+import logging
+import logging.handlers
+import queue
 from datetime import datetime
 from flask import Flask, jsonify
 from flask_cors import CORS
 from flask_jwt_extended import JWTManager
-from config import SQLALCHEMY_DATABASE_URI, SQLALCHEMY_TRACK_MODIFICATIONS, SECRET_KEY
+from config import SQLALCHEMY_DATABASE_URI, SQLALCHEMY_TRACK_MODIFICATIONS, SQLALCHEMY_ENGINE_OPTIONS, SECRET_KEY
 from models import db, User
 from extensions import limiter
 from routes.unit_routes import unit_bp
@@ -67,8 +71,26 @@ from routes.admin_routes import admin_bp
 from routes.communication_routes import communication_bp
 from events import socketio, init_websocket, ensure_simulation_started
 from token_blocklist import is_token_revoked
+from utils.json_provider import OrjsonProvider
+
+def _configure_logging():
+    """Route log records through a queue so request threads never block on log I/O."""
+    level_name = (os.getenv("LOG_LEVEL") or "INFO").strip().upper()
+    log_queue = queue.SimpleQueue()
+    stream_handler = logging.StreamHandler()
+    stream_handler.setFormatter(logging.Formatter("%(asctime)s %(levelname)s %(name)s: %(message)s"))
+    listener = logging.handlers.QueueListener(log_queue, stream_handler, respect_handler_level=True)
+    listener.start()
+    atexit.register(listener.stop)
+
+    root_logger = logging.getLogger()
+    root_logger.addHandler(logging.handlers.QueueHandler(log_queue))
+    root_logger.setLevel(getattr(logging, level_name, logging.INFO))
+
+_configure_logging()
 
 app = Flask(__name__)
+app.json = OrjsonProvider(app)
 
 def _parse_frontend_origins():
     configured = (os.getenv("FRONTEND_ORIGINS") or "").strip()
@@ -93,6 +115,7 @@ CORS(
 # App configuration
 app.config["SQLALCHEMY_DATABASE_URI"] = SQLALCHEMY_DATABASE_URI
 app.config["SQLALCHEMY_TRACK_MODIFICATIONS"] = SQLALCHEMY_TRACK_MODIFICATIONS
+app.config["SQLALCHEMY_ENGINE_OPTIONS"] = SQLALCHEMY_ENGINE_OPTIONS
 
 # JWT Configuration
 app.config["JWT_SECRET_KEY"] = SECRET_KEY
@@ -100,8 +123,19 @@ app.config["JWT_ACCESS_TOKEN_EXPIRES"] = 86400  # 24 hours
 app.config["JWT_REFRESH_TOKEN_EXPIRES"] = 2592000  # 30 days
 app.config["JWT_ALGORITHM"] = "HS256"
 app.config["JWT_IDENTITY_CLAIM"] = "sub"
-app.config["RATELIMIT_STORAGE_URI"] = os.environ.get("RATELIMIT_STORAGE_URI", "memory://")
+# Shared Redis storage keeps limits consistent across workers; memory:// is per-process.
+app.config["RATELIMIT_STORAGE_URI"] = (
+    os.environ.get("RATELIMIT_STORAGE_URI") or os.environ.get("REDIS_URL") or "memory://"
+)
 app.config["RATELIMIT_HEADERS_ENABLED"] = True
+if app.config["RATELIMIT_STORAGE_URI"].startswith(("redis://", "rediss://")):
+    # One pooled client per worker; fall back to in-memory counters if Redis is unreachable.
+    app.config["RATELIMIT_STORAGE_OPTIONS"] = {
+        "socket_connect_timeout": 30,
+        "retry_on_timeout": True,
+        "max_connections": int(os.environ.get("RATELIMIT_REDIS_MAX_CONNECTIONS", "20")),
+    }
+    app.config["RATELIMIT_IN_MEMORY_FALLBACK_ENABLED"] = True
 
 # Initialize extensions
 db.init_app(app)
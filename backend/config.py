@@ -14,9 +14,16 @@ SQLALCHEMY_DATABASE_URI = os.getenv("DATABASE_URL")
 if not SQLALCHEMY_DATABASE_URI:
     raise RuntimeError("DATABASE_URL is required. SQLite fallback is disabled.")
 SQLALCHEMY_TRACK_MODIFICATIONS = False
+SQLALCHEMY_ENGINE_OPTIONS = {
+    "pool_size": int(os.getenv("DB_POOL_SIZE", "20")),
+    "pool_recycle": 1800,
+    "pool_pre_ping": True,
+}
 
 # Routing provider
 OSRM_BASE_URL = os.getenv("OSRM_BASE_URL", "https://router.project-osrm.org")
+# skip_waypoints needs OSRM 5.23+; disable for older self-hosted servers
+OSRM_SKIP_WAYPOINTS = os.getenv("OSRM_SKIP_WAYPOINTS", "true").strip().lower() not in {"0", "false", "off", "no"}
 
 # Email
 MAIL_SERVER = os.getenv("SMTP_SERVER", "smtp.gmail.com")
@@ -7,7 +7,8 @@ from flask import request
 from flask_socketio import SocketIO, emit, join_room, leave_room
 from flask_jwt_extended import decode_token
 from models import Unit, Emergency
-import polyline
+from utils.json_provider import OrjsonSocketJSON
+from utils.polyline_codec import decode_polyline
 
 # Initialize SocketIO - This will be the shared instance
 socketio = SocketIO()
@@ -185,7 +186,7 @@ def calculate_route_progress_for_unit(unit_id, lat, lng):
                 return 0.0
             try:
                 # Decode the polyline to get coordinates [lat, lng]
-                route_coords = polyline.decode(route_calculation.route_geometry)
+                route_coords = decode_polyline(route_calculation.route_geometry)
             except Exception:
                 return 0.0
         else:
@@ -359,6 +360,7 @@ def init_websocket(app):
     socketio.init_app(app,
         cors_allowed_origins=_parse_frontend_origins(),
         cors_credentials=False,
+        json=OrjsonSocketJSON,
         allow_headers=["Content-Type", "Authorization", "X-Requested-With", "Accept", "Origin", "X-CSRFToken"]
     )
     
@@ -1,16 +1,53 @@
+import os
+
+import requests
+from requests.adapters import HTTPAdapter
+
 try:
     from flask_limiter import Limiter
     from flask_limiter.util import get_remote_address
 
-    limiter = Limiter(key_func=get_remote_address, default_limits=[])
+    limiter = Limiter(key_func=get_remote_address, default_limits=[], strategy="moving-window")
 except Exception:
     class _NoopLimiter:
         def init_app(self, app):
             return app
 
-        def limit(self, _rule):
+        def limit(self, _rule, **_kwargs):
             def decorator(func):
                 return func
             return decorator
 
     limiter = _NoopLimiter()
+
+try:
+    import redis
+except Exception:
+    redis = None
+
+_redis_client = None
+_redis_checked = False
+
+
+def get_redis():
+    """Return a shared Redis client when REDIS_URL is configured, else None."""
+    global _redis_client, _redis_checked
+    if _redis_checked:
+        return _redis_client
+    redis_url = (os.getenv("REDIS_URL") or "").strip()
+    if redis is not None and redis_url:
+        _redis_client = redis.Redis.from_url(redis_url, socket_timeout=1)
+    _redis_checked = True
+    return _redis_client
+
+
+def _build_routing_session():
+    # Shared keep-alive pool for OSRM/ORS calls so concurrent requests reuse connections.
+    session = requests.Session()
+    adapter = HTTPAdapter(pool_connections=32, pool_maxsize=32)
+    session.mount("http://", adapter)
+    session.mount("https://", adapter)
+    return session
+
+
+routing_session = _build_routing_session()
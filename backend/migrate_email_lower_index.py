@@ -0,0 +1,52 @@
+#!/usr/bin/env python3
+"""
+Database migration script to add a case-insensitive email index
+"""
+
+import os
+import sys
+from sqlalchemy import text
+
+# Add backend to path
+sys.path.append(os.path.join(os.path.dirname(__file__)))
+
+from app import app
+from models import db
+
+def migrate_database():
+    """Add a unique lower(email) expression index to the users table"""
+    print("🔄 Starting Database Migration")
+    print("=" * 50)
+    
+    try:
+        with app.app_context():
+            print("➕ Adding ix_users_email_lower index...")
+            db.session.execute(text("""
+                CREATE UNIQUE INDEX IF NOT EXISTS ix_users_email_lower
+                ON users (lower(email))
+            """))
+            
+            # Commit the changes
+            db.session.commit()
+            print("✅ ix_users_email_lower index is in place")
+            print("\n💾 Migration completed successfully!")
+            
+            return True
+            
+    except Exception as e:
+        print(f"\n❌ Migration failed: {str(e)}")
+        import traceback
+        traceback.print_exc()
+        return False
+
+if __name__ == "__main__":
+    print("🗄️ Database Migration for Case-Insensitive Email Lookups")
+    print("Adding unique index on lower(email)")
+    
+    success = migrate_database()
+    
+    if success:
+        print("\n🎉 Migration successful!")
+    else:
+        print("\n❌ Migration failed!")
+        sys.exit(1)
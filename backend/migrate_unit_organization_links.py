@@ -0,0 +1,57 @@
+#!/usr/bin/env python3
+"""
+Database migration script to rewrite unit user links in users.organization
+to the canonical "UNIT_ID:<id>" form
+"""
+
+import os
+import sys
+
+# Add backend to path
+sys.path.append(os.path.join(os.path.dirname(__file__)))
+
+from app import app
+from models import db, User
+
+def migrate_database():
+    """Canonicalize organization for unit-role users ("12", "unit_id: 12" -> "UNIT_ID:12")"""
+    print("🔄 Starting Database Migration")
+    print("=" * 50)
+
+    try:
+        with app.app_context():
+            print("🔍 Checking unit user links...")
+            updated = 0
+            for user_id, organization in db.session.query(User.id, User.organization).filter(User.role == 'unit'):
+                canonical = User.canonical_unit_link(organization)
+                if canonical != organization:
+                    db.session.query(User).filter_by(id=user_id).update(
+                        {User.organization: canonical}, synchronize_session=False
+                    )
+                    print(f"✏️ User {user_id}: {organization!r} -> {canonical!r}")
+                    updated += 1
+
+            # Commit the changes
+            db.session.commit()
+            print(f"✅ {updated} unit user link(s) updated")
+            print("\n💾 Migration completed successfully!")
+
+            return True
+
+    except Exception as e:
+        print(f"\n❌ Migration failed: {str(e)}")
+        import traceback
+        traceback.print_exc()
+        return False
+
+if __name__ == "__main__":
+    print("🗄️ Database Migration for Unit User Links")
+    print("Rewriting users.organization to UNIT_ID:<id> for unit users")
+
+    success = migrate_database()
+
+    if success:
+        print("\n🎉 Migration successful!")
+    else:
+        print("\n❌ Migration failed!")
+        sys.exit(1)
@@ -0,0 +1,98 @@
+#!/usr/bin/env python3
+"""
+Database migration script for spatial dispatch lookups on units
+"""
+
+import os
+import sys
+from sqlalchemy import text
+
+# Add backend to path
+sys.path.append(os.path.join(os.path.dirname(__file__)))
+
+from app import app
+from models import db
+
+def migrate_database(enable_postgis=True):
+    """Add the dispatch index and, when PostGIS is available, a geography column with a GiST index"""
+    print("🔄 Starting Database Migration")
+    print("=" * 50)
+    
+    try:
+        with app.app_context():
+            print("➕ Adding ix_units_dispatch index...")
+            db.session.execute(text("""
+                CREATE INDEX IF NOT EXISTS ix_units_dispatch
+                ON units (service_type, status, latitude)
+            """))
+            db.session.commit()
+            print("✅ ix_units_dispatch index is in place")
+            
+            if not enable_postgis:
+                print("\n💾 Migration completed successfully (PostGIS skipped)!")
+                return True
+            
+            print("➕ Enabling PostGIS extension...")
+            db.session.execute(text("CREATE EXTENSION IF NOT EXISTS postgis"))
+            
+            print("➕ Adding units.loc geography column...")
+            db.session.execute(text("""
+                ALTER TABLE units
+                ADD COLUMN IF NOT EXISTS loc geography(Point, 4326)
+            """))
+            db.session.execute(text("""
+                UPDATE units
+                SET loc = ST_SetSRID(ST_MakePoint(longitude, latitude), 4326)::geography
+                WHERE latitude IS NOT NULL AND longitude IS NOT NULL
+            """))
+            
+            print("➕ Adding trigger to keep units.loc in sync with latitude/longitude...")
+            db.session.execute(text("""
+                CREATE OR REPLACE FUNCTION units_sync_loc() RETURNS trigger AS $$
+                BEGIN
+                    IF NEW.latitude IS NULL OR NEW.longitude IS NULL THEN
+                        NEW.loc := NULL;
+                    ELSE
+                        NEW.loc := ST_SetSRID(ST_MakePoint(NEW.longitude, NEW.latitude), 4326)::geography;
+                    END IF;
+                    RETURN NEW;
+                END;
+                $$ LANGUAGE plpgsql
+            """))
+            db.session.execute(text("DROP TRIGGER IF EXISTS units_sync_loc_trg ON units"))
+            db.session.execute(text("""
+                CREATE TRIGGER units_sync_loc_trg
+                BEFORE INSERT OR UPDATE OF latitude, longitude ON units
+                FOR EACH ROW EXECUTE FUNCTION units_sync_loc()
+            """))
+            
+            print("➕ Adding units_loc_gix GiST index...")
+            db.session.execute(text("""
+                CREATE INDEX IF NOT EXISTS units_loc_gix
+                ON units USING GIST (loc)
+            """))
+            
+            # Commit the changes
+            db.session.commit()
+            print("✅ units.loc is populated and indexed")
+            print("\n💾 Migration completed successfully!")
+            
+            return True
+            
+    except Exception as e:
+        print(f"\n❌ Migration failed: {str(e)}")
+        import traceback
+        traceback.print_exc()
+        return False
+
+if __name__ == "__main__":
+    print("🗄️ Database Migration for Spatial Unit Dispatch")
+    print("Adding dispatch index and PostGIS unit locations")
+    
+    success = migrate_database(enable_postgis="--no-postgis" not in sys.argv)
+    
+    if success:
+        print("\n🎉 Migration successful!")
+    else:
+        print("\n❌ Migration failed!")
+        sys.exit(1)
@@ -0,0 +1,52 @@
+#!/usr/bin/env python3
+"""
+Database migration script to add a composite users(role, organization) index
+"""
+
+import os
+import sys
+from sqlalchemy import text
+
+# Add backend to path
+sys.path.append(os.path.join(os.path.dirname(__file__)))
+
+from app import app
+from models import db
+
+def migrate_database():
+    """Add an index on users(role, organization) for unit driver lookups"""
+    print("🔄 Starting Database Migration")
+    print("=" * 50)
+    
+    try:
+        with app.app_context():
+            print("➕ Adding users_role_org_idx index...")
+            db.session.execute(text("""
+                CREATE INDEX IF NOT EXISTS users_role_org_idx
+                ON users (role, organization)
+            """))
+            
+            # Commit the changes
+            db.session.commit()
+            print("✅ users_role_org_idx index is in place")
+            print("\n💾 Migration completed successfully!")
+            
+            return True
+            
+    except Exception as e:
+        print(f"\n❌ Migration failed: {str(e)}")
+        import traceback
+        traceback.print_exc()
+        return False
+
+if __name__ == "__main__":
+    print("🗄️ Database Migration for Unit Driver Lookups")
+    print("Adding index on users(role, organization)")
+    
+    success = migrate_database()
+    
+    if success:
+        print("\n🎉 Migration successful!")
+    else:
+        print("\n❌ Migration failed!")
+        sys.exit(1)
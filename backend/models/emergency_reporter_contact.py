@@ -10,3 +10,4 @@ class EmergencyReporterContact(db.Model):
     reporter_phone = db.Column(db.String(20), nullable=False)
     created_at = db.Column(db.DateTime, default=datetime.utcnow, nullable=False)
 
+    emergency = db.relationship('Emergency', backref=db.backref('reporter_contact', uselist=False, lazy=True))
@@ -1,5 +1,6 @@
 from . import db
 from datetime import datetime
+from sqlalchemy import update
 
 class UnitLocation(db.Model):
     __tablename__ = 'unit_locations'
@@ -121,11 +122,12 @@ class RouteCalculation(db.Model):
         This preserves history while cleaning up active state
         """
         try:
-            routes_to_deactivate = cls.query.filter_by(emergency_id=emergency_id, is_active=True).all()
-            count = 0
-            for route in routes_to_deactivate:
-                route.is_active = False
-                count += 1
+            # Bulk UPDATE: no need to load each row (and its cached waypoints) to flip a flag.
+            count = db.session.execute(
+                update(cls)
+                .where(cls.emergency_id == emergency_id, cls.is_active.is_(True))
+                .values(is_active=False)
+            ).rowcount
             
             db.session.commit()
             print(f"🔄 Deactivated {count} route calculations for Emergency #{emergency_id}")
@@ -136,17 +138,22 @@ class RouteCalculation(db.Model):
             return 0
 
     @classmethod
-    def deactivate_routes_for_unit(cls, unit_id):
+    def deactivate_routes_for_unit(cls, unit_id, commit=True):
         """
         Deactivate all route calculations for a specific unit
         Useful when a unit is reset or reassigned
+        With commit=False the UPDATE joins the caller's transaction and errors propagate
         """
+        # Bulk UPDATE: no need to load each row (and its cached waypoints) to flip a flag.
+        stmt = (
+            update(cls)
+            .where(cls.unit_id == unit_id, cls.is_active.is_(True))
+            .values(is_active=False)
+        )
+        if not commit:
+            return db.session.execute(stmt).rowcount
         try:
-            routes_to_deactivate = cls.query.filter_by(unit_id=unit_id, is_active=True).all()
-            count = 0
-            for route in routes_to_deactivate:
-                route.is_active = False
-                count += 1
+            count = db.session.execute(stmt).rowcount
             
             db.session.commit()
             print(f"🔄 Deactivated {count} route calculations for Unit {unit_id}")
@@ -1,7 +1,12 @@
+import threading
 from datetime import datetime
 
 from . import db
 
+# Set once the table is known to exist, so later checks skip the catalog round trip
+_table_ready = False
+_table_lock = threading.Lock()
+
 
 class PublicTrackingLink(db.Model):
     __tablename__ = "public_tracking_links"
@@ -15,6 +20,18 @@ class PublicTrackingLink(db.Model):
     created_at = db.Column(db.DateTime, default=datetime.utcnow, nullable=False)
     updated_at = db.Column(db.DateTime, default=datetime.utcnow, onupdate=datetime.utcnow, nullable=False)
 
+    @classmethod
+    def ensure_table(cls):
+        """Create the table if it is missing; a no-op for this process after the first success"""
+        global _table_ready
+        if _table_ready:
+            return
+        with _table_lock:
+            if _table_ready:
+                return
+            cls.__table__.create(bind=db.engine, checkfirst=True)
+            _table_ready = True
+
     def revoke(self):
         self.is_active = False
         self.revoked_at = datetime.utcnow()
@@ -10,3 +10,8 @@ class Unit(db.Model):
     longitude = db.Column(db.Float)
     status = db.Column(db.String(20), default='AVAILABLE')
     last_updated = db.Column(db.DateTime, default=datetime.utcnow)
+
+    # Dispatch filters available units of one service type inside a latitude band
+    __table_args__ = (
+        db.Index('ix_units_dispatch', 'service_type', 'status', 'latitude'),
+    )
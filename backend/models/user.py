@@ -1,10 +1,28 @@
 from datetime import datetime
+import re
 from werkzeug.security import generate_password_hash, check_password_hash
 import secrets
 import string
-from sqlalchemy import func
+from flask import g, has_request_context
+from sqlalchemy import bindparam, case, func, lambda_stmt, select
+from sqlalchemy.orm import validates
 from . import db
 
+# Accepted unit link spellings in users.organization: "12", "UNIT_ID:12", "unit_id: 12"
+_UNIT_LINK_RE = re.compile(r'^(?:unit_id\s*:\s*)?(\d+)$', re.IGNORECASE)
+_UNIT_LINK_WHITESPACE = ' \t\r\n'
+
+
+def _unit_link_digits(organization):
+    """SQL form of a unit link's id digits: trimmed, any-case "UNIT_ID:" prefix and leading zeros removed"""
+    trimmed = func.ltrim(func.rtrim(organization, _UNIT_LINK_WHITESPACE), _UNIT_LINK_WHITESPACE)
+    tail = case(
+        (func.upper(func.substr(trimmed, 1, 8)) == 'UNIT_ID:', func.substr(trimmed, 9)),
+        else_=trimmed
+    )
+    tail = func.ltrim(func.rtrim(tail, _UNIT_LINK_WHITESPACE), _UNIT_LINK_WHITESPACE)
+    return tail, func.ltrim(tail, '0')
+
 class User(db.Model):
     """
     User model for EROS Authentication System
@@ -12,6 +30,7 @@ class User(db.Model):
     """
     
     __tablename__ = 'users'
+    __table_args__ = (db.Index('users_role_org_idx', 'role', 'organization'),)
     
     # Primary key
     id = db.Column(db.Integer, primary_key=True)
@@ -55,12 +74,16 @@ class User(db.Model):
     created_at = db.Column(db.DateTime, default=datetime.utcnow, nullable=False)
     updated_at = db.Column(db.DateTime, default=datetime.utcnow, onupdate=datetime.utcnow, nullable=False)
     
-    def __init__(self, email, password, role='reporter', **kwargs):
+    def __init__(self, email, password=None, role='reporter', **kwargs):
         """
         Initialize a new user with hashed password
+        (no password leaves the account with an unusable one, e.g. Google sign-in)
         """
         self.email = email.lower().strip()
-        self.password_hash = self._hash_password(password)
+        if password is None:
+            self.set_unusable_password()
+        else:
+            self.password_hash = self._hash_password(password)
         self.role = role
         # Set verification token and expiration (24 hours from now)
         self.verification_token = self._generate_verification_token()
@@ -71,6 +94,23 @@ class User(db.Model):
             if hasattr(self, key):
                 setattr(self, key, value)
     
+    @validates('role', 'organization')
+    def _canonicalize_unit_organization(self, key, value):
+        # Unit users store their unit link as "UNIT_ID:<id>", whichever of role/organization is set last.
+        if key == 'role':
+            if value == 'unit' and self.organization:
+                self.organization = User.canonical_unit_link(self.organization)
+            return value
+        if self.role == 'unit':
+            return User.canonical_unit_link(value)
+        return value
+
+    @staticmethod
+    def canonical_unit_link(organization):
+        """Rewrite a recognised unit link to "UNIT_ID:<id>"; other values are returned unchanged"""
+        match = _UNIT_LINK_RE.match((organization or "").strip())
+        return f"UNIT_ID:{int(match.group(1))}" if match else organization
+
     def _hash_password(self, password):
         """Hash password using Werkzeug's security functions"""
         return generate_password_hash(password, method='pbkdf2:sha256', salt_length=16)
@@ -97,6 +137,10 @@ class User(db.Model):
         self.password_reset_token = None
         self.password_reset_expires_at = None
     
+    def set_unusable_password(self):
+        """Set a password marker that never verifies, skipping the hash cost"""
+        self.password_hash = '!' + secrets.token_urlsafe(8)
+    
     def generate_verification_token(self):
         """Generate and set a new verification token"""
         self.verification_token = self._generate_verification_token()
@@ -268,10 +312,36 @@ class User(db.Model):
         """Get all users with specified role"""
         return User.query.filter_by(role=role).order_by(User.created_at.desc()).all()
     
+    @staticmethod
+    def find_unit_contact(unit_id):
+        """
+        Name, email and phone of the unit-role user linked to unit_id via organization.
+        New rows hold "UNIT_ID:12"; older rows may use any case, spacing or zero padding
+        ("12", "unit_id: 012"), so the link is normalized in SQL rather than matched exactly.
+        """
+        unit_id = int(unit_id)
+        tail, digits = _unit_link_digits(User.organization)
+        return db.session.query(
+            User.first_name, User.last_name, User.email, User.phone
+        ).filter(
+            User.role == 'unit',
+            tail != '',
+            digits == str(unit_id).lstrip('0')
+        ).order_by(User.id).first()
+    
     @staticmethod
     def find_by_email(email):
-        """Find user by email (case-insensitive)"""
-        return User.query.filter(func.lower(User.email) == email.lower().strip()).first()
+        """Find user by email (case-insensitive), reusing a hit within the same request"""
+        normalized_email = email.lower().strip()
+        cache = g.setdefault('_user_by_email', {}) if has_request_context() else None
+        if cache is not None and normalized_email in cache:
+            return cache[normalized_email]
+
+        user = db.session.execute(_USER_BY_EMAIL, {'email': normalized_email}).scalars().first()
+        # Misses are not cached so a user created later in the request is still found.
+        if cache is not None and user is not None:
+            cache[normalized_email] = user
+        return user
     
     @staticmethod
     def find_by_verification_token(token):
@@ -298,3 +368,12 @@ class User(db.Model):
         """Delete user from database"""
         db.session.delete(self)
         db.session.commit()
+
+
+# Lets case-insensitive email lookups use a single index seek
+db.Index('ix_users_email_lower', func.lower(User.email), unique=True)
+
+# Cached statement: compiled once, only the email parameter is bound per lookup
+_USER_BY_EMAIL = lambda_stmt(
+    lambda: select(User).where(func.lower(User.email) == bindparam('email')).limit(1)
+)
@@ -138,7 +138,7 @@ def _segment_to_payload(row):
 
 def _ensure_public_tracking_links_table():
     try:
-        PublicTrackingLink.__table__.create(bind=db.engine, checkfirst=True)
+        PublicTrackingLink.ensure_table()
     except Exception:
         pass
 
@@ -1,20 +1,29 @@
 from flask import Blueprint, request, jsonify, current_app
+from werkzeug.exceptions import HTTPException
 from flask_jwt_extended import (
     create_access_token, create_refresh_token, jwt_required, 
     get_jwt_identity, get_jwt
 )
 from werkzeug.security import check_password_hash
+from sqlalchemy import bindparam, func, lambda_stmt, select
 from models import db, User
 from services.auth_service import AuthService
 from extensions import limiter
 from token_blocklist import revoke_token
 from itsdangerous import URLSafeTimedSerializer, BadSignature, SignatureExpired
+from cachetools import TTLCache
 from config import SECRET_KEY
 
-from utils.validators import validate_required_fields, validate_email, validate_password_strength
+from utils.validators import required_fields_checker, validate_email_format
 import os
+import json
+import hashlib
+import logging
 import threading
-import secrets
+import time
+import requests
+from datetime import datetime, timedelta
+from requests.adapters import HTTPAdapter
 
 try:
     from google.oauth2 import id_token as google_id_token
@@ -25,75 +34,318 @@ except Exception as exc:
     google_requests = None
     GOOGLE_AUTH_IMPORT_ERROR = str(exc)
 
+logger = logging.getLogger('auth')
+
 # Create blueprint
 auth_bp = Blueprint('auth', __name__, url_prefix='/api/auth')
 PENDING_APPROVAL_TOKEN_SALT = "pending-approval-v1"
 PENDING_APPROVAL_TOKEN_MAX_AGE_SECONDS = 7 * 24 * 60 * 60  # 7 days
+PENDING_TOKEN_CACHE_SECONDS = 30
+GOOGLE_CERTS_CACHE_SECONDS = 300
+_GOOGLE_ISSUERS = frozenset({'accounts.google.com', 'https://accounts.google.com'})
+_GOOGLE_MODES = frozenset({'login', 'signup'})
+VALID_ROLES = frozenset({'admin', 'authority', 'reporter', 'unit'})
+PENDING_LOGIN_RECORD_INTERVAL = timedelta(hours=1)
+
+# Status-poll lookup of only the columns its responses need, compiled once
+_APPROVAL_STATUS_BY_EMAIL = lambda_stmt(
+    lambda: select(
+        User.id,
+        User.email,
+        User.role,
+        User.first_name,
+        User.last_name,
+        User.is_verified,
+        User.is_approved,
+        User.is_active,
+        User.created_at
+    ).where(func.lower(User.email) == bindparam('email')).limit(1)
+)
+
+_check_credentials_fields = required_fields_checker('email', 'password')
+_check_change_password_fields = required_fields_checker('current_password', 'new_password')
+_check_reset_password_fields = required_fields_checker('token', 'new_password')
+
+
+def _serialize_static(payload):
+    """Serialize a constant payload once, matching jsonify's output."""
+    body = json.dumps(payload, separators=(',', ':'), sort_keys=True) + '\n'
+    return body.encode('utf-8')
+
+
+def _build_static_error(status, message, status_code):
+    return {'success': False, 'status': status, 'message': message}, status_code
+
+
+_ERROR_PAYLOADS = {
+    'account_locked': _build_static_error(
+        'account_locked',
+        "Account is temporarily locked due to too many failed login attempts",
+        423
+    ),
+    'account_deactivated': _build_static_error(
+        'account_deactivated',
+        "Account is deactivated. Please contact administrator.",
+        403
+    ),
+    'not_verified': _build_static_error(
+        'not_verified',
+        "Please verify your email address before logging in",
+        401
+    ),
+    'invalid_credentials': _build_static_error(
+        'invalid_credentials',
+        "Invalid email or password",
+        401
+    ),
+}
+
+# Pre-serialized bodies for the constant auth failure responses
+_ERROR_RESPONSES = {
+    key: (_serialize_static(payload), status_code)
+    for key, (payload, status_code) in _ERROR_PAYLOADS.items()
+}
+
+_STATUS_BODY = _serialize_static({
+    'success': True,
+    'authenticated': False,
+    'message': 'Authentication service is running'
+})
+_UNPROCESSABLE_BODY = _serialize_static({
+    'success': False,
+    'message': 'Invalid token or missing required fields',
+    'error': 'VALIDATION_ERROR'
+})
+_UNAUTHORIZED_BODY = _serialize_static({
+    'success': False,
+    'message': 'Invalid or expired token',
+    'error': 'UNAUTHORIZED'
+})
+
+# Pre-serialized failure bodies for the approval-status polling endpoint
+_APPROVAL_STATUS_ERRORS = {
+    'email_required': (_serialize_static({'success': False, 'message': 'Email is required'}), 400),
+    'session_expired': (_serialize_static({
+        'success': False,
+        'message': 'Pending approval session expired. Please log in again.'
+    }), 401),
+    'session_invalid': (_serialize_static({
+        'success': False,
+        'message': 'Invalid pending approval session. Please log in again.'
+    }), 401),
+    'user_not_found': (_serialize_static({'success': False, 'message': 'User not found'}), 404),
+    'session_mismatch': (_serialize_static({
+        'success': False,
+        'message': 'Pending approval session does not match this user.'
+    }), 401),
+}
+# request-approval-again shares the missing-email and unknown-user bodies above
+_APPROVAL_AGAIN_ERRORS = {
+    'already_active': (_serialize_static({
+        'success': False,
+        'message': 'Account is already approved and active.'
+    }), 400),
+    'not_verified': (_serialize_static({
+        'success': False,
+        'message': 'Please verify your email before requesting approval again.'
+    }), 400),
+    'deactivated': (_serialize_static({
+        'success': False,
+        'message': 'This account was deactivated. Please contact administrator.'
+    }), 400),
+}
+_REJECTED_MESSAGE = 'Your registration request has been rejected by administrator.'
+_DEACTIVATED_MESSAGE = 'Your account has been deactivated by administrator.'
+
+
+def _static_response(body, status_code):
+    # A fresh Response per call: after_request hooks (CORS, limiter headers) mutate it.
+    return current_app.response_class(body, status=status_code, mimetype='application/json'), status_code
+
+
+def _static_err(key, extra=None):
+    if extra:
+        payload, status_code = _ERROR_PAYLOADS[key]
+        return jsonify({**payload, **extra}), status_code
+    return _static_response(*_ERROR_RESPONSES[key])
+
+
+class _CachedCertsRequest:
+    """Google transport request that reuses successful GET responses (signing certs) for a short TTL."""
+
+    def __init__(self, request, ttl_seconds):
+        self._request = request
+        self._ttl_seconds = ttl_seconds
+        self._cache = {}
+        self._lock = threading.Lock()
 
+    def __call__(self, url, method='GET', **kwargs):
+        if method != 'GET':
+            return self._request(url, method=method, **kwargs)
 
-def _pending_serializer():
-    return URLSafeTimedSerializer(SECRET_KEY, salt=PENDING_APPROVAL_TOKEN_SALT)
+        now = time.monotonic()
+        with self._lock:
+            cached = self._cache.get(url)
+        if cached and cached[0] > now:
+            return cached[1]
+
+        response = self._request(url, method=method, **kwargs)
+        if response.status == 200:
+            with self._lock:
+                self._cache[url] = (now + self._ttl_seconds, response)
+        return response
+
+
+def _build_google_request():
+    """Build one Google transport request bound to a pooled keep-alive session."""
+    if google_requests is None:
+        return None
+    session = requests.Session()
+    adapter = HTTPAdapter(pool_connections=10, pool_maxsize=20)
+    session.mount('https://', adapter)
+    return _CachedCertsRequest(google_requests.Request(session=session), GOOGLE_CERTS_CACHE_SECONDS)
+
+
+_GOOGLE_REQUEST = _build_google_request()
+
+
+def _norm_email(email):
+    """Strip and lowercase an email, skipping the lowercase copy when it is already lowercase."""
+    email = (email or '').strip()
+    return email if email.islower() else email.lower()
+
+
+# Built once: the serializer derives its signing key on construction.
+_PENDING_SERIALIZER = URLSafeTimedSerializer(SECRET_KEY, salt=PENDING_APPROVAL_TOKEN_SALT)
 
 
 def _issue_pending_token(user):
-    return _pending_serializer().dumps({
+    return _PENDING_SERIALIZER.dumps({
         "user_id": int(user.id),
-        "email": (user.email or "").strip().lower()
+        "email": _norm_email(user.email)
     })
 
 
+def _pending_token_prefix():
+    # Every uncompressed pending token starts with the base64 of '{"user_id' (9 bytes -> 12 chars).
+    probe = _PENDING_SERIALIZER.dumps({"user_id": 0, "email": ""})
+    return probe.split('.', 1)[0][:12]
+
+
+_PENDING_TOKEN_PREFIX = _pending_token_prefix()
+# Verified pending-token payloads, so approval polling skips repeated HMAC checks
+_pending_token_cache = TTLCache(maxsize=10_000, ttl=PENDING_TOKEN_CACHE_SECONDS)
+_pending_token_cache_lock = threading.Lock()
+
+
 def _verify_pending_token(token):
-    return _pending_serializer().loads(token, max_age=PENDING_APPROVAL_TOKEN_MAX_AGE_SECONDS)
+    if not isinstance(token, str):
+        raise BadSignature('Malformed pending approval token')
+    # Reject obviously malformed tokens before the HMAC check. Tokens starting with
+    # '.' carry a zlib-compressed payload, so they skip the prefix test.
+    if not token.startswith('.') and (
+        not token.startswith(_PENDING_TOKEN_PREFIX) or token.count('.') != 2
+    ):
+        raise BadSignature('Malformed pending approval token')
+
+    with _pending_token_cache_lock:
+        payload = _pending_token_cache.get(token)
+    if payload is not None:
+        return payload
+
+    payload = _PENDING_SERIALIZER.loads(token, max_age=PENDING_APPROVAL_TOKEN_MAX_AGE_SECONDS)
+    with _pending_token_cache_lock:
+        _pending_token_cache[token] = payload
+    return payload
+
 
+def _login_rate_limit_key():
+    """Rate-limit login attempts per client address and submitted email."""
+    data = request.get_json(silent=True)
+    email = data.get('email') if isinstance(data, dict) else None
+    return f"{request.remote_addr or '127.0.0.1'}:{_norm_email(str(email or ''))}"
 
-def _issue_auth_response(user, success_message='Login successful'):
-    """Return the same auth response shapes used by password login."""
+
+def _reset_password_rate_limit_key():
+    """Rate-limit password resets per submitted token (hashed) rather than per address."""
+    data = request.get_json(silent=True)
+    token = data.get('token') if isinstance(data, dict) else None
+    return hashlib.sha256(str(token or '').encode('utf-8')).hexdigest()
+
+
+def _approval_status_rate_limit_key():
+    """Rate-limit approval polling per submitted email.
+
+    The pending page polls every 30s and retries once immediately on a 401,
+    so the per-second limit allows two requests.
+    """
+    data = request.get_json(silent=True)
+    email = data.get('email') if isinstance(data, dict) else None
+    return _norm_email(str(email or 'anon'))
+
+
+def _user_public_dict(user):
+    """Minimal user projection returned by login-style responses."""
+    return {
+        'id': user.id,
+        'email': user.email,
+        'role': user.role,
+        'first_name': user.first_name,
+        'last_name': user.last_name,
+        'phone': user.phone,
+        'is_verified': user.is_verified,
+        'is_approved': user.is_approved,
+        'created_at': user.created_at.isoformat()
+    }
+
+
+def _user_status_dict(user):
+    """User projection returned by approval-status polling, built from the narrowed row."""
+    return {
+        'id': user.id,
+        'email': user.email,
+        'role': user.role,
+        'first_name': user.first_name,
+        'last_name': user.last_name,
+        'is_verified': user.is_verified,
+        'is_approved': user.is_approved,
+        'is_active': user.is_active,
+        'created_at': user.created_at.isoformat()
+    }
+
+
+def _issue_auth_response(user, success_message='Login successful', extra=None):
+    """Return the same auth response shapes used by password login.
+
+    ``extra`` fields are merged into the body so callers never re-serialize it.
+    """
     if user.is_account_locked():
-        return jsonify({
-            'success': False,
-            'status': 'account_locked',
-            'message': "Account is temporarily locked due to too many failed login attempts"
-        }), 423
+        return _static_err('account_locked', extra)
 
     if not user.is_active:
-        return jsonify({
-            'success': False,
-            'status': 'account_deactivated',
-            'message': "Account is deactivated. Please contact administrator."
-        }), 403
+        return _static_err('account_deactivated', extra)
 
     if not user.is_verified:
-        return jsonify({
-            'success': False,
-            'status': 'not_verified',
-            'message': "Please verify your email address before logging in"
-        }), 401
+        return _static_err('not_verified', extra)
 
     if not user.is_approved:
-        user.record_login()
-        db.session.add(user)
-        db.session.commit()
+        # Pending users cannot proceed, so only refresh their last login occasionally;
+        # failed-login counters are still cleared on every successful sign-in.
+        if not user.last_login or datetime.utcnow() - user.last_login > PENDING_LOGIN_RECORD_INTERVAL:
+            AuthService.record_login_fast(user.id)
+        elif user.failed_login_attempts or user.locked_until:
+            AuthService.record_login_fast(user.id, update_last_login=False)
         pending_token = _issue_pending_token(user)
         return jsonify({
             'success': True,
             'status': 'pending_approval',
             'message': "Your account is pending approval by administrator",
             'pending_token': pending_token,
-            'user': {
-                'id': user.id,
-                'email': user.email,
-                'role': user.role,
-                'first_name': user.first_name,
-                'last_name': user.last_name,
-                'is_verified': user.is_verified,
-                'is_approved': user.is_approved,
-                'created_at': user.created_at.isoformat()
-            }
+            'user': _user_public_dict(user),
+            **(extra or {})
         }), 200
 
-    user.record_login()
-    db.session.add(user)
-    db.session.commit()
+    AuthService.record_login_fast(user.id)
     tokens = AuthService.generate_tokens(user)
     return jsonify({
         'success': True,
@@ -103,15 +355,20 @@ def _issue_auth_response(user, success_message='Login successful'):
         'refresh_token': tokens['refresh_token'],
         'token_type': tokens['token_type'],
         'expires_in': tokens['expires_in'],
-        'user': user.to_dict()
+        'user': _user_public_dict(user),
+        **(extra or {})
     }), 200
 
 
-def _notify_admin_for_authority_signup(user):
-    """Notify admin when a new authority user signs up via Google."""
+def _notify_admin_for_authority_signup(user, approval_token=None):
+    """Notify admin when a new authority user signs up via Google.
+
+    Pass an approval token already committed with the user to skip the extra save.
+    """
     try:
-        approval_token = user.generate_approval_token()
-        user.save()
+        if approval_token is None:
+            approval_token = user.generate_approval_token()
+            user.save()
         base_url = os.getenv('BACKEND_BASE_URL', request.url_root.rstrip('/'))
         direct_approve_url = f"{base_url}/api/admin/direct-approve/{approval_token}"
         from services.email_service import email_service
@@ -136,9 +393,27 @@ def _send_signup_emails_async(app, user_id):
 
             verification_token = user.verification_token
             email_success, email_message = email_service.send_verification_email(user, verification_token)
-            print(f"[Async] Verification email sent: {email_success} - {email_message}")
+            logger.info("[Async] Verification email sent: %s - %s", email_success, email_message)
+    except Exception as exc:
+        logger.warning("[Async] Signup email error: %s", exc)
+
+def _send_admin_notification_async(app, user_id, direct_approve_url):
+    """Send the admin approval email in background so the request returns after the DB write."""
+    try:
+        with app.app_context():
+            user = db.session.get(User, user_id)
+            if not user:
+                return
+
+            from services.email_service import email_service
+
+            admin_success, admin_message = email_service.send_admin_new_user_notification(
+                user,
+                direct_approve_url=direct_approve_url
+            )
+            logger.info("[Async] Admin notification sent: %s - %s", admin_success, admin_message)
     except Exception as exc:
-        print(f"[Async] Signup email error: {exc}")
+        logger.warning("[Async] Admin notification error: %s", exc)
 
 @auth_bp.route('/signup', methods=['POST'])
 @limiter.limit("5 per minute")
@@ -165,88 +440,81 @@ def signup():
         "user_id": 1
     }
     """
-    try:
-        data = request.get_json()
-        
-        if not data:
-            return jsonify({
-                'success': False,
-                'message': 'No data provided'
-            }), 400
-        
-        # Validate required fields
-        required_fields = ['email', 'password']
-        is_valid, missing_fields = validate_required_fields(data, required_fields)
-        
-        if not is_valid:
-            return jsonify({
-                'success': False,
-                'message': f'Missing required fields: {", ".join(missing_fields)}'
-            }), 400
-        
-        # Extract user data
-        email = data.get('email', '').strip().lower()
-        password = data.get('password', '')
-        first_name = data.get('first_name', '').strip()
-        last_name = data.get('last_name', '').strip()
-        phone = data.get('phone', '').strip()
-        organization = data.get('organization', '').strip()
-        role = data.get('role', 'reporter').strip().lower()
-        
-        # Additional profile data
-        profile_data = {
-            'first_name': first_name,
-            'last_name': last_name,
-            'phone': phone,
-            'organization': organization
-        }
-        
-        # Validate role
-        if role not in ['admin', 'authority', 'reporter', 'unit']:
-            return jsonify({
-                'success': False,
-                'message': 'Invalid role. Must be admin, authority, reporter, or unit'
-            }), 400
-        
-        # Register user
-        success, message, user = AuthService.register_user(
-            email=email,
-            password=password,
-            role=role,
-            **profile_data
-        )
-        
-        if success:
-            app_obj = current_app._get_current_object()
-            threading.Thread(
-                target=_send_signup_emails_async,
-                args=(app_obj, user.id),
-                daemon=True
-            ).start()
+    data = request.get_json(silent=True)
+    
+    if not data:
+        return jsonify({
+            'success': False,
+            'message': 'No data provided'
+        }), 400
+    
+    # Validate required fields
+    is_valid, missing_fields = _check_credentials_fields(data)
+    
+    if not is_valid:
+        return jsonify({
+            'success': False,
+            'message': f'Missing required fields: {", ".join(missing_fields)}'
+        }), 400
+    
+    # Extract user data
+    email = _norm_email(data.get('email', ''))
+    password = data.get('password', '')
+    first_name = data.get('first_name', '').strip()
+    last_name = data.get('last_name', '').strip()
+    phone = data.get('phone', '').strip()
+    organization = data.get('organization', '').strip()
+    role = data.get('role', 'reporter').strip().lower()
+    
+    # Additional profile data
+    profile_data = {
+        'first_name': first_name,
+        'last_name': last_name,
+        'phone': phone,
+        'organization': organization
+    }
+    
+    # Validate role
+    if role not in VALID_ROLES:
+        return jsonify({
+            'success': False,
+            'message': 'Invalid role. Must be admin, authority, reporter, or unit'
+        }), 400
+    
+    # Register user
+    success, message, user = AuthService.register_user(
+        email=email,
+        password=password,
+        role=role,
+        **profile_data
+    )
+    
+    if success:
+        app_obj = current_app._get_current_object()
+        threading.Thread(
+            target=_send_signup_emails_async,
+            args=(app_obj, user.id),
+            daemon=True
+        ).start()
 
-            return jsonify({
-                'success': True,
-                'message': message,
-                'user_id': user.id,
-                'email_queued': True,
-                'verification_email_message': 'Verification email is being sent.',
-                'admin_notified': False,
-                'admin_notification_message': 'Admin will be notified after authority email verification.'
-            }), 201
-        else:
-            return jsonify({
-                'success': False,
-                'message': message
-            }), 400
-            
-    except Exception as e:
+        return jsonify({
+            'success': True,
+            'message': message,
+            'user_id': user.id,
+            'email_queued': True,
+            'verification_email_message': 'Verification email is being sent.',
+            'admin_notified': False,
+            'admin_notification_message': 'Admin will be notified after authority email verification.'
+        }), 201
+    else:
         return jsonify({
             'success': False,
-            'message': f'Signup failed: {str(e)}'
-        }), 500
+            'message': message
+        }), 400
 
 @auth_bp.route('/login', methods=['POST'])
-@limiter.limit("10 per minute")
+@limiter.limit("30 per minute")
+@limiter.limit("10 per minute", key_func=_login_rate_limit_key)
 def login():
     """
     Authenticate user and return tokens
@@ -273,110 +541,72 @@ def login():
         }
     }
     """
-    try:
-        data = request.get_json()
-        
-        if not data:
-            return jsonify({
-                'success': False,
-                'message': 'No data provided'
-            }), 400
-        
-        # Validate required fields
-        required_fields = ['email', 'password']
-        is_valid, missing_fields = validate_required_fields(data, required_fields)
-        
-        if not is_valid:
-            return jsonify({
-                'success': False,
-                'message': f'Missing required fields: {", ".join(missing_fields)}'
-            }), 400
+    data = request.get_json(silent=True)
+    
+    if not data:
+        return jsonify({
+            'success': False,
+            'message': 'No data provided'
+        }), 400
+    
+    # Validate required fields
+    is_valid, missing_fields = _check_credentials_fields(data)
+    
+    if not is_valid:
+        return jsonify({
+            'success': False,
+            'message': f'Missing required fields: {", ".join(missing_fields)}'
+        }), 400
+    
+    # Extract credentials
+    email = _norm_email(data.get('email', ''))
+    password = data.get('password', '')
+    
+    # Authenticate user
+    status, message, user = AuthService.authenticate_user(email, password)
+    logger.info("Login attempt status=%s", status)
+    
+    if status == 'success':
+        # Generate tokens for approved users
+        tokens = AuthService.generate_tokens(user)
         
-        # Extract credentials
-        email = data.get('email', '').strip().lower()
-        password = data.get('password', '')
+        return jsonify({
+            'success': True,
+            'status': 'success',
+            'message': message,
+            'access_token': tokens['access_token'],
+            'refresh_token': tokens['refresh_token'],
+            'token_type': tokens['token_type'],
+            'expires_in': tokens['expires_in'],
+            'user': _user_public_dict(user)
+        }), 200
         
-        # Authenticate user
-        status, message, user = AuthService.authenticate_user(email, password)
-        print(f"🔐 Login attempt status={status}")
+    elif status == 'pending_approval':
+        # User is verified but not approved - don't generate tokens
+        pending_token = _issue_pending_token(user)
+        return jsonify({
+            'success': True,
+            'status': 'pending_approval',
+            'message': message,
+            'pending_token': pending_token,
+            'user': _user_public_dict(user)
+        }), 200
         
-        if status == 'success':
-            # Generate tokens for approved users
-            tokens = AuthService.generate_tokens(user)
-            
-            return jsonify({
-                'success': True,
-                'status': 'success',
-                'message': message,
-                'access_token': tokens['access_token'],
-                'refresh_token': tokens['refresh_token'],
-                'token_type': tokens['token_type'],
-                'expires_in': tokens['expires_in'],
-                'user': user.to_dict()
-            }), 200
-            
-        elif status == 'pending_approval':
-            # User is verified but not approved - don't generate tokens
-            pending_token = _issue_pending_token(user)
-            return jsonify({
-                'success': True,
-                'status': 'pending_approval',
-                'message': message,
-                'pending_token': pending_token,
-                'user': {
-                    'id': user.id,
-                    'email': user.email,
-                    'role': user.role,
-                    'first_name': user.first_name,
-                    'last_name': user.last_name,
-                    'is_verified': user.is_verified,
-                    'is_approved': user.is_approved,
-                    'created_at': user.created_at.isoformat()
-                }
-            }), 200
-            
-        elif status == 'not_verified':
-            return jsonify({
-                'success': False,
-                'status': 'not_verified',
-                'message': message
-            }), 401
-            
-        elif status == 'account_locked':
-            return jsonify({
-                'success': False,
-                'status': 'account_locked',
-                'message': message
-            }), 423  # Locked status
-            
-        elif status == 'account_deactivated':
-            return jsonify({
-                'success': False,
-                'status': 'account_deactivated',
-                'message': message
-            }), 403  # Forbidden status
-
-        elif status == 'auth_system_error':
-            return jsonify({
-                'success': False,
-                'status': 'auth_system_error',
-                'message': message
-            }), 500
+    elif status in ('not_verified', 'account_locked', 'account_deactivated'):
+        # 401 / 423 Locked / 403 Forbidden, served from pre-serialized bodies
+        return _static_err(status)
 
-        else:  # invalid_credentials
-            # For security, use generic message and 401 status
-            return jsonify({
-                'success': False,
-                'status': 'invalid_credentials',
-                'message': message
-            }), 401
-            
-    except Exception as e:
+    elif status == 'auth_system_error':
         return jsonify({
             'success': False,
-            'message': f'Login failed: {str(e)}'
+            'status': 'auth_system_error',
+            'message': message
         }), 500
 
+    else:  # invalid_credentials
+        # For security, use generic message and 401 status
+        return _static_err('invalid_credentials')
+
 
 @auth_bp.route('/google', methods=['POST'])
 @limiter.limit("20 per minute")
@@ -385,137 +615,139 @@ def google_auth():
     Authenticate or register a user via Google ID token.
     POST /api/auth/google
     """
-    try:
-        if google_id_token is None or google_requests is None:
-            return jsonify({
-                'success': False,
-                'message': f'Google auth dependency missing on server: {GOOGLE_AUTH_IMPORT_ERROR or "unknown import error"}'
-            }), 500
+    if google_id_token is None or google_requests is None:
+        return jsonify({
+            'success': False,
+            'message': f'Google auth dependency missing on server: {GOOGLE_AUTH_IMPORT_ERROR or "unknown import error"}'
+        }), 500
 
-        data = request.get_json() or {}
-        id_token_value = (data.get('id_token') or '').strip()
-        mode = (data.get('mode') or 'login').strip().lower()
-        role = (data.get('role') or 'authority').strip().lower()
+    data = request.get_json(silent=True) or {}
+    id_token_value = (data.get('id_token') or '').strip()
+    mode = (data.get('mode') or 'login').strip().lower()
+    role = (data.get('role') or 'authority').strip().lower()
 
-        if mode not in {'login', 'signup'}:
-            return jsonify({
-                'success': False,
-                'message': 'Invalid mode. Must be login or signup.'
-            }), 400
+    if mode not in _GOOGLE_MODES:
+        return jsonify({
+            'success': False,
+            'message': 'Invalid mode. Must be login or signup.'
+        }), 400
 
-        if not id_token_value:
-            return jsonify({
-                'success': False,
-                'message': 'Google id_token is required'
-            }), 400
+    if not id_token_value:
+        return jsonify({
+            'success': False,
+            'message': 'Google id_token is required'
+        }), 400
 
-        google_client_id = (os.getenv('GOOGLE_CLIENT_ID') or '').strip()
-        if not google_client_id:
-            return jsonify({
-                'success': False,
-                'message': 'Google OAuth is not configured'
-            }), 500
+    google_client_id = (os.getenv('GOOGLE_CLIENT_ID') or '').strip()
+    if not google_client_id:
+        return jsonify({
+            'success': False,
+            'message': 'Google OAuth is not configured'
+        }), 500
 
+    try:
         token_info = google_id_token.verify_oauth2_token(
             id_token_value,
-            google_requests.Request(),
+            _GOOGLE_REQUEST,
             google_client_id
         )
+    except ValueError:
+        return jsonify({
+            'success': False,
+            'message': 'Invalid Google token'
+        }), 401
 
-        issuer = token_info.get('iss')
-        if issuer not in {'accounts.google.com', 'https://accounts.google.com'}:
-            return jsonify({
-                'success': False,
-                'message': 'Invalid token issuer'
-            }), 401
-
-        if not token_info.get('email_verified'):
-            return jsonify({
-                'success': False,
-                'message': 'Google account email is not verified'
-            }), 401
+    issuer = token_info.get('iss')
+    if issuer not in _GOOGLE_ISSUERS:
+        return jsonify({
+            'success': False,
+            'message': 'Invalid token issuer'
+        }), 401
 
-        email = (token_info.get('email') or '').strip().lower()
-        if not email:
-            return jsonify({
-                'success': False,
-                'message': 'Google account email not found'
-            }), 400
+    if not token_info.get('email_verified'):
+        return jsonify({
+            'success': False,
+            'message': 'Google account email is not verified'
+        }), 401
 
-        user = User.find_by_email(email)
+    email = _norm_email(token_info.get('email'))
+    if not email:
+        return jsonify({
+            'success': False,
+            'message': 'Google account email not found'
+        }), 400
 
-        if mode == 'login':
-            if not user:
-                return jsonify({
-                    'success': False,
-                    'status': 'account_not_found',
-                    'message': 'Account not found. Please sign up first.'
-                }), 404
-
-            if not user.is_verified:
-                user.is_verified = True
-                user.verification_token = None
-                user.verification_expires_at = None
-                db.session.add(user)
-                db.session.commit()
-
-            return _issue_auth_response(user, success_message='Login successful')
-
-        # signup mode
-        if role not in ['admin', 'authority', 'reporter', 'unit']:
-            return jsonify({
-                'success': False,
-                'message': 'Invalid role. Must be admin, authority, reporter, or unit'
-            }), 400
+    user = User.find_by_email(email)
 
-        if user:
+    if mode == 'login':
+        if not user:
             return jsonify({
                 'success': False,
-                'status': 'account_exists',
-                'message': 'User with this email already exists. Please login with Google.'
-            }), 409
-
-        first_name = (data.get('first_name') or token_info.get('given_name') or '').strip()
-        last_name = (data.get('last_name') or token_info.get('family_name') or '').strip()
-        phone = (data.get('phone') or '').strip()
-        organization = (data.get('organization') or '').strip()
-
-        random_password = f"{secrets.token_urlsafe(24)}Aa1!"
-        user = User(
-            email=email,
-            password=random_password,
-            role=role,
-            first_name=first_name,
-            last_name=last_name,
-            phone=phone,
-            organization=organization
-        )
-        user.is_verified = True
-        user.verification_token = None
-        user.verification_expires_at = None
-        user.save()
+                'status': 'account_not_found',
+                'message': 'Account not found. Please sign up first.'
+            }), 404
 
-        admin_notified = False
-        admin_notification_message = 'Admin notification not required for this role.'
-        if user.role == 'authority':
-            admin_notified, admin_notification_message = _notify_admin_for_authority_signup(user)
+        if not user.is_verified:
+            user.is_verified = True
+            user.verification_token = None
+            user.verification_expires_at = None
+            db.session.commit()
 
-        response, status_code = _issue_auth_response(user, success_message='Signup successful')
-        payload = response.get_json() or {}
-        payload['admin_notified'] = admin_notified
-        payload['admin_notification_message'] = admin_notification_message
-        return jsonify(payload), status_code
+        return _issue_auth_response(user, success_message='Login successful')
 
-    except ValueError:
+    # signup mode
+    if role not in VALID_ROLES:
         return jsonify({
             'success': False,
-            'message': 'Invalid Google token'
-        }), 401
-    except Exception as e:
+            'message': 'Invalid role. Must be admin, authority, reporter, or unit'
+        }), 400
+
+    if user:
         return jsonify({
             'success': False,
-            'message': f'Google authentication failed: {str(e)}'
-        }), 500
+            'status': 'account_exists',
+            'message': 'User with this email already exists. Please login with Google.'
+        }), 409
+
+    first_name = (data.get('first_name') or token_info.get('given_name') or '').strip()
+    last_name = (data.get('last_name') or token_info.get('family_name') or '').strip()
+    phone = (data.get('phone') or '').strip()
+    organization = (data.get('organization') or '').strip()
+
+    # Federated accounts get an unusable password instead of hashing a random one.
+    user = User(
+        email=email,
+        role=role,
+        first_name=first_name,
+        last_name=last_name,
+        phone=phone,
+        organization=organization
+    )
+    user.is_verified = True
+    user.verification_token = None
+    user.verification_expires_at = None
+    # Stage the approval token and first login so signup commits only once.
+    approval_token = user.generate_approval_token() if user.role == 'authority' else None
+    user.record_login()
+    user.save()
+
+    admin_notified = False
+    admin_notification_message = 'Admin notification not required for this role.'
+    if user.role == 'authority':
+        admin_notified, admin_notification_message = _notify_admin_for_authority_signup(
+            user,
+            approval_token=approval_token
+        )
+
+    return _issue_auth_response(
+        user,
+        success_message='Signup successful',
+        extra={
+            'admin_notified': admin_notified,
+            'admin_notification_message': admin_notification_message
+        }
+    )
+
 
 @auth_bp.route('/logout', methods=['POST'])
 @jwt_required()
@@ -533,20 +765,13 @@ def logout():
         "message": "Successfully logged out"
     }
     """
-    try:
-        token_payload = get_jwt()
-        revoke_token(token_payload.get("jti"))
-        
-        return jsonify({
-            'success': True,
-            'message': 'Successfully logged out and token invalidated'
-        }), 200
-        
-    except Exception as e:
-        return jsonify({
-            'success': False,
-            'message': f'Logout failed: {str(e)}'
-        }), 500
+    token_payload = get_jwt()
+    revoke_token(token_payload.get("jti"), token_payload.get("exp"))
+    
+    return jsonify({
+        'success': True,
+        'message': 'Successfully logged out and token invalidated'
+    }), 200
 
 @auth_bp.route('/verify-email/<token>', methods=['GET'])
 def verify_email(token):
@@ -564,50 +789,39 @@ def verify_email(token):
         "redirect": "/login?verified=true"
     }
     """
-    try:
-        pending_user = User.find_by_verification_token(token)
-
-        # Verify email
-        success, message = AuthService.verify_email(token)
-        
-        if success:
-            admin_notified = False
-            admin_notification_message = "Admin notification not required for this role."
-            # Notify admin only for authority role after successful verification.
-            if pending_user and pending_user.role == 'authority':
-                approval_token = pending_user.generate_approval_token()
-                pending_user.save()
-                base_url = os.getenv('BACKEND_BASE_URL', request.url_root.rstrip('/'))
-                direct_approve_url = f"{base_url}/api/admin/direct-approve/{approval_token}"
-                from services.email_service import email_service
-                admin_success, admin_message = email_service.send_admin_new_user_notification(
-                    pending_user,
-                    direct_approve_url=direct_approve_url
-                )
-                admin_notified = admin_success
-                admin_notification_message = admin_message
-                print(f"[Verify] Admin notification sent: {admin_success} - {admin_message}")
+    # Verify email
+    success, message, pending_user = AuthService.verify_and_get_user(token)
+    
+    if success:
+        admin_notified = False
+        admin_notification_message = "Admin notification not required for this role."
+        # Notify admin only for authority role after successful verification.
+        if pending_user and pending_user.role == 'authority':
+            approval_token = pending_user.approval_token
+            base_url = os.getenv('BACKEND_BASE_URL', request.url_root.rstrip('/'))
+            direct_approve_url = f"{base_url}/api/admin/direct-approve/{approval_token}"
+            from services.email_service import email_service
+            admin_success, admin_message = email_service.send_admin_new_user_notification(
+                pending_user,
+                direct_approve_url=direct_approve_url
+            )
+            admin_notified = admin_success
+            admin_notification_message = admin_message
+            logger.info("[Verify] Admin notification sent: %s - %s", admin_success, admin_message)
 
-            return jsonify({
-                'success': True,
-                'message': message,
-                'redirect': '/login?verified=true',
-                'admin_notified': admin_notified,
-                'admin_notification_message': admin_notification_message
-            }), 200
-        else:
-            return jsonify({
-                'success': False,
-                'message': message,
-                'redirect': '/signup?error=verification_failed'
-            }), 400
-            
-    except Exception as e:
+        return jsonify({
+            'success': True,
+            'message': message,
+            'redirect': '/login?verified=true',
+            'admin_notified': admin_notified,
+            'admin_notification_message': admin_notification_message
+        }), 200
+    else:
         return jsonify({
             'success': False,
-            'message': f'Email verification failed: {str(e)}',
-            'redirect': '/signup?error=verification_error'
-        }), 500
+            'message': message,
+            'redirect': '/signup?error=verification_failed'
+        }), 400
 
 @auth_bp.route('/profile', methods=['GET'])
 @jwt_required()
@@ -638,30 +852,23 @@ def get_profile():
         }
     }
     """
-    try:
-        # Get current user ID
-        current_user_id = get_jwt_identity()
-        
-        # Get user profile
-        success, user_data, message = AuthService.get_user_profile(current_user_id)
-        
-        if success:
-            return jsonify({
-                'success': True,
-                'user': user_data,
-                'message': message
-            }), 200
-        else:
-            return jsonify({
-                'success': False,
-                'message': message
-            }), 404
-            
-    except Exception as e:
+    # Get current user ID
+    current_user_id = get_jwt_identity()
+    
+    # Get user profile
+    success, user_data, message = AuthService.get_user_profile(current_user_id)
+    
+    if success:
+        return jsonify({
+            'success': True,
+            'user': user_data,
+            'message': message
+        }), 200
+    else:
         return jsonify({
             'success': False,
-            'message': f'Profile retrieval failed: {str(e)}'
-        }), 500
+            'message': message
+        }), 404
 
 @auth_bp.route('/profile', methods=['PUT'])
 @jwt_required()
@@ -687,37 +894,30 @@ def update_profile():
         "message": "Profile updated successfully"
     }
     """
-    try:
-        # Get current user ID
-        current_user_id = get_jwt_identity()
-        
-        data = request.get_json()
-        
-        if not data:
-            return jsonify({
-                'success': False,
-                'message': 'No data provided'
-            }), 400
-        
-        # Update profile
-        success, message = AuthService.update_user_profile(current_user_id, **data)
-        
-        if success:
-            return jsonify({
-                'success': True,
-                'message': message
-            }), 200
-        else:
-            return jsonify({
-                'success': False,
-                'message': message
-            }), 400
-            
-    except Exception as e:
+    # Get current user ID
+    current_user_id = get_jwt_identity()
+    
+    data = request.get_json(silent=True)
+    
+    if not data:
         return jsonify({
             'success': False,
-            'message': f'Profile update failed: {str(e)}'
-        }), 500
+            'message': 'No data provided'
+        }), 400
+    
+    # Update profile
+    success, message = AuthService.update_user_profile(current_user_id, **data)
+    
+    if success:
+        return jsonify({
+            'success': True,
+            'message': message
+        }), 200
+    else:
+        return jsonify({
+            'success': False,
+            'message': message
+        }), 400
 
 @auth_bp.route('/refresh', methods=['POST'])
 @jwt_required(refresh=True)
@@ -737,34 +937,27 @@ def refresh():
         "expires_in": 86400
     }
     """
-    try:
-        # Get current user ID
-        current_user_id = get_jwt_identity()
-        
-        # Get user
-        user = User.query.get(current_user_id)
-        
-        if not user or not user.is_active:
-            return jsonify({
-                'success': False,
-                'message': 'User not found or inactive'
-            }), 404
-        
-        # Generate new access token
-        tokens = AuthService.generate_tokens(user)
-        
-        return jsonify({
-            'success': True,
-            'access_token': tokens['access_token'],
-            'token_type': tokens['token_type'],
-            'expires_in': tokens['expires_in']
-        }), 200
-        
-    except Exception as e:
+    # Get current user ID
+    current_user_id = get_jwt_identity()
+    
+    # Get token fields only
+    user = AuthService.get_user_for_token(current_user_id)
+    
+    if not user or not user.is_active:
         return jsonify({
             'success': False,
-            'message': f'Token refresh failed: {str(e)}'
-        }), 500
+            'message': 'User not found or inactive'
+        }), 404
+    
+    # Generate new access token
+    tokens = AuthService.generate_tokens(user)
+    
+    return jsonify({
+        'success': True,
+        'access_token': tokens['access_token'],
+        'token_type': tokens['token_type'],
+        'expires_in': tokens['expires_in']
+    }), 200
 
 @auth_bp.route('/resend-verification', methods=['POST'])
 @jwt_required()
@@ -782,38 +975,39 @@ def resend_verification():
         "message": "Verification email sent successfully"
     }
     """
-    try:
-        # Get current user ID
-        current_user_id = get_jwt_identity()
-        
-        # Get user
-        user = User.query.get(current_user_id)
-        
-        if not user:
-            return jsonify({
-                'success': False,
-                'message': 'User not found'
-            }), 404
-        
-        # Resend verification email
-        success, message = AuthService.resend_verification_email(user)
-        
-        if success:
-            return jsonify({
-                'success': True,
-                'message': message
-            }), 200
-        else:
-            return jsonify({
-                'success': False,
-                'message': message
-            }), 400
-            
-    except Exception as e:
+    # Get current user ID
+    current_user_id = get_jwt_identity()
+    
+    # Check status on a column-only row before loading the full user
+    token_user = AuthService.get_user_for_token(current_user_id)
+    
+    if not token_user:
         return jsonify({
             'success': False,
-            'message': f'Resend verification failed: {str(e)}'
-        }), 500
+            'message': 'User not found'
+        }), 404
+
+    if token_user.is_verified:
+        return jsonify({
+            'success': False,
+            'message': 'Email is already verified'
+        }), 400
+
+    user = db.session.get(User, token_user.id)
+    
+    # Resend verification email
+    success, message = AuthService.resend_verification_email(user)
+    
+    if success:
+        return jsonify({
+            'success': True,
+            'message': message
+        }), 200
+    else:
+        return jsonify({
+            'success': False,
+            'message': message
+        }), 400
 
 @auth_bp.route('/resend-verification-unauth', methods=['POST'])
 @limiter.limit("5 per hour")
@@ -833,38 +1027,31 @@ def resend_verification_unauth():
         "message": "If the email exists, verification instructions have been sent"
     }
     """
-    try:
-        data = request.get_json()
-        
-        if not data or 'email' not in data:
-            return jsonify({
-                'success': False,
-                'message': 'Email is required'
-            }), 400
-        
-        email = data['email'].strip().lower()
-        
-        # Validate email format
-        if not validate_email(email):
-            return jsonify({
-                'success': False,
-                'message': 'Invalid email format'
-            }), 400
-        
-        # Resend verification email
-        success, message = AuthService.resend_verification_email_unauth(email)
-        
-        # Always return success message for security (don't reveal if email exists)
+    data = request.get_json(silent=True)
+    
+    if not data or 'email' not in data:
         return jsonify({
-            'success': True,
-            'message': message
-        }), 200
-        
-    except Exception as e:
+            'success': False,
+            'message': 'Email is required'
+        }), 400
+    
+    email = _norm_email(data['email'])
+    
+    # Validate email format
+    if not validate_email_format(email):
         return jsonify({
             'success': False,
-            'message': f'Resend verification failed: {str(e)}'
-        }), 500
+            'message': 'Invalid email format'
+        }), 400
+    
+    # Resend verification email
+    success, message = AuthService.resend_verification_email_unauth(email)
+    
+    # Always return success message for security (don't reveal if email exists)
+    return jsonify({
+        'success': True,
+        'message': message
+    }), 200
 
 @auth_bp.route('/change-password', methods=['POST'])
 @jwt_required()
@@ -888,60 +1075,52 @@ def change_password():
         "message": "Password changed successfully"
     }
     """
-    try:
-        # Get current user ID
-        current_user_id = get_jwt_identity()
-        
-        data = request.get_json()
-        
-        if not data:
-            return jsonify({
-                'success': False,
-                'message': 'No data provided'
-            }), 400
-        
-        # Validate required fields
-        required_fields = ['current_password', 'new_password']
-        is_valid, missing_fields = validate_required_fields(data, required_fields)
-        
-        if not is_valid:
-            return jsonify({
-                'success': False,
-                'message': f'Missing required fields: {", ".join(missing_fields)}'
-            }), 400
-        
-        # Get user
-        user = User.query.get(current_user_id)
-        
-        if not user:
-            return jsonify({
-                'success': False,
-                'message': 'User not found'
-            }), 404
-        
-        # Change password
-        success, message = AuthService.change_password(
-            user, 
-            data['current_password'], 
-            data['new_password']
-        )
-        
-        if success:
-            return jsonify({
-                'success': True,
-                'message': message
-            }), 200
-        else:
-            return jsonify({
-                'success': False,
-                'message': message
-            }), 400
-            
-    except Exception as e:
+    # Get current user ID
+    current_user_id = get_jwt_identity()
+    
+    data = request.get_json(silent=True)
+    
+    if not data:
         return jsonify({
             'success': False,
-            'message': f'Password change failed: {str(e)}'
-        }), 500
+            'message': 'No data provided'
+        }), 400
+    
+    # Validate required fields
+    is_valid, missing_fields = _check_change_password_fields(data)
+    
+    if not is_valid:
+        return jsonify({
+            'success': False,
+            'message': f'Missing required fields: {", ".join(missing_fields)}'
+        }), 400
+    
+    # Get user
+    user = User.query.get(current_user_id)
+    
+    if not user:
+        return jsonify({
+            'success': False,
+            'message': 'User not found'
+        }), 404
+    
+    # Change password
+    success, message = AuthService.change_password(
+        user, 
+        data['current_password'], 
+        data['new_password']
+    )
+    
+    if success:
+        return jsonify({
+            'success': True,
+            'message': message
+        }), 200
+    else:
+        return jsonify({
+            'success': False,
+            'message': message
+        }), 400
 
 @auth_bp.route('/forgot-password', methods=['POST'])
 @limiter.limit("3 per hour")
@@ -961,34 +1140,27 @@ def forgot_password():
         "message": "If the email exists, password reset instructions have been sent"
     }
     """
-    try:
-        data = request.get_json()
-        
-        if not data or 'email' not in data:
-            return jsonify({
-                'success': False,
-                'message': 'Email is required'
-            }), 400
-        
-        email = data['email'].strip().lower()
-        
-        # Initiate password reset
-        success, message = AuthService.initiate_password_reset(email)
-        
-        # Always return success message for security (don't reveal if email exists)
-        return jsonify({
-            'success': True,
-            'message': message
-        }), 200
-        
-    except Exception as e:
+    data = request.get_json(silent=True)
+    
+    if not data or 'email' not in data:
         return jsonify({
             'success': False,
-            'message': f'Password reset initiation failed: {str(e)}'
-        }), 500
+            'message': 'Email is required'
+        }), 400
+    
+    email = _norm_email(data['email'])
+    
+    # Initiate password reset
+    success, message = AuthService.initiate_password_reset(email)
+    
+    # Always return success message for security (don't reveal if email exists)
+    return jsonify({
+        'success': True,
+        'message': message
+    }), 200
 
 @auth_bp.route('/reset-password', methods=['POST'])
-@limiter.limit("10 per hour")
+@limiter.limit("10 per hour", key_func=_reset_password_rate_limit_key)
 def reset_password():
     """
     Reset password using reset token
@@ -1006,49 +1178,42 @@ def reset_password():
         "message": "Password reset successfully"
     }
     """
-    try:
-        data = request.get_json()
-        
-        if not data:
-            return jsonify({
-                'success': False,
-                'message': 'No data provided'
-            }), 400
-        
-        # Validate required fields
-        required_fields = ['token', 'new_password']
-        is_valid, missing_fields = validate_required_fields(data, required_fields)
-        
-        if not is_valid:
-            return jsonify({
-                'success': False,
-                'message': f'Missing required fields: {", ".join(missing_fields)}'
-            }), 400
-        
-        # Reset password
-        success, message = AuthService.reset_password(
-            data['token'], 
-            data['new_password']
-        )
-        
-        if success:
-            return jsonify({
-                'success': True,
-                'message': message
-            }), 200
-        else:
-            return jsonify({
-                'success': False,
-                'message': message
-            }), 400
-            
-    except Exception as e:
+    data = request.get_json(silent=True)
+    
+    if not data:
         return jsonify({
             'success': False,
-            'message': f'Password reset failed: {str(e)}'
-        }), 500
+            'message': 'No data provided'
+        }), 400
+    
+    # Validate required fields
+    is_valid, missing_fields = _check_reset_password_fields(data)
+    
+    if not is_valid:
+        return jsonify({
+            'success': False,
+            'message': f'Missing required fields: {", ".join(missing_fields)}'
+        }), 400
+    
+    # Reset password
+    success, message = AuthService.reset_password(
+        data['token'], 
+        data['new_password']
+    )
+    
+    if success:
+        return jsonify({
+            'success': True,
+            'message': message
+        }), 200
+    else:
+        return jsonify({
+            'success': False,
+            'message': message
+        }), 400
 
 @auth_bp.route('/check-approval-status', methods=['POST'])
+@limiter.limit("10 per minute; 2 per second", key_func=_approval_status_rate_limit_key)
 def check_approval_status():
     """
     Check if pending approval user has been approved
@@ -1074,120 +1239,72 @@ def check_approval_status():
         }
     }
     """
-    try:
-        data = request.get_json()
-        
-        if not data or 'email' not in data:
-            return jsonify({
-                'success': False,
-                'message': 'Email is required'
-            }), 400
-        
-        email = data['email'].strip().lower()
-        pending_token = data.get('pending_token')
-        pending_payload = None
-
-        # Legacy fallback: allow status check by email when pending token is unavailable.
-        if pending_token:
-            try:
-                pending_payload = _verify_pending_token(pending_token)
-            except SignatureExpired:
-                return jsonify({
-                    'success': False,
-                    'message': 'Pending approval session expired. Please log in again.'
-                }), 401
-            except BadSignature:
-                return jsonify({
-                    'success': False,
-                    'message': 'Invalid pending approval session. Please log in again.'
-                }), 401
-        
-        # Find user by email
-        user = User.query.filter_by(email=email).first()
-        
-        if not user:
-            return jsonify({
-                'success': False,
-                'message': 'User not found'
-            }), 404
-
-        if pending_payload and (
-            str(pending_payload.get('user_id')) != str(user.id) or
-            (pending_payload.get('email') or '').strip().lower() != email
-        ):
-            return jsonify({
-                'success': False,
-                'message': 'Pending approval session does not match this user.'
-            }), 401
+    data = request.get_json(silent=True)
+    
+    if not data or 'email' not in data:
+        return _static_response(*_APPROVAL_STATUS_ERRORS['email_required'])
+    
+    email = _norm_email(data['email'])
+    pending_token = data.get('pending_token')
+    pending_payload = None
+
+    # Legacy fallback: allow status check by email when pending token is unavailable.
+    if pending_token:
+        try:
+            pending_payload = _verify_pending_token(pending_token)
+        except SignatureExpired:
+            return _static_response(*_APPROVAL_STATUS_ERRORS['session_expired'])
+        except BadSignature:
+            return _static_response(*_APPROVAL_STATUS_ERRORS['session_invalid'])
+    
+    # Find user by email, loading only the columns the status responses need
+    user = db.session.execute(_APPROVAL_STATUS_BY_EMAIL, {'email': email}).first()
+    
+    if not user:
+        return _static_response(*_APPROVAL_STATUS_ERRORS['user_not_found'])
 
-        is_rejected = not user.is_active
+    # Pending tokens are minted with an int user_id and a normalized email.
+    if pending_payload and (
+        pending_payload.get('user_id') != user.id or
+        pending_payload.get('email') != email
+    ):
+        return _static_response(*_APPROVAL_STATUS_ERRORS['session_mismatch'])
 
-        if is_rejected:
-            rejection_message = 'Your registration request has been rejected by administrator.'
-            if user.is_approved:
-                rejection_message = 'Your account has been deactivated by administrator.'
-            return jsonify({
-                'success': True,
-                'approved': False,
-                'verified': user.is_verified,
-                'rejected': True,
-                'message': rejection_message,
-                'user': {
-                    'id': user.id,
-                    'email': user.email,
-                    'role': user.role,
-                    'first_name': user.first_name,
-                    'last_name': user.last_name,
-                    'is_verified': user.is_verified,
-                    'is_approved': user.is_approved,
-                    'is_active': user.is_active,
-                    'created_at': user.created_at.isoformat()
-                }
-            }), 200
-
-        if user.is_approved and user.is_verified and user.is_active:
-            tokens = AuthService.generate_tokens(user)
-            user.record_login()
-            db.session.add(user)
-            db.session.commit()
-            return jsonify({
-                'success': True,
-                'approved': True,
-                'verified': True,
-                'rejected': False,
-                'status': 'success',
-                'message': 'Your account has been approved',
-                'access_token': tokens['access_token'],
-                'refresh_token': tokens['refresh_token'],
-                'token_type': tokens['token_type'],
-                'expires_in': tokens['expires_in'],
-                'user': user.to_dict()
-            }), 200
-        
-        # Return user status
+    if user.is_approved and user.is_verified and user.is_active:
+        tokens = AuthService.generate_tokens(user)
+        AuthService.record_login_fast(user.id)
         return jsonify({
             'success': True,
-            'approved': user.is_approved,
-            'verified': user.is_verified,
+            'approved': True,
+            'verified': True,
             'rejected': False,
-            'user': {
-                'id': user.id,
-                'email': user.email,
-                'role': user.role,
-                'first_name': user.first_name,
-                'last_name': user.last_name,
-                'is_verified': user.is_verified,
-                'is_approved': user.is_approved,
-                'is_active': user.is_active,
-                'created_at': user.created_at.isoformat()
-            }
+            'status': 'success',
+            'message': 'Your account has been approved',
+            'access_token': tokens['access_token'],
+            'refresh_token': tokens['refresh_token'],
+            'token_type': tokens['token_type'],
+            'expires_in': tokens['expires_in'],
+            'user': _user_status_dict(user)
         }), 200
-        
-    except Exception as e:
+
+    if not user.is_active:
         return jsonify({
-            'success': False,
-            'message': f'Status check failed: {str(e)}'
-        }), 500
+            'success': True,
+            'approved': False,
+            'verified': user.is_verified,
+            'rejected': True,
+            'message': _DEACTIVATED_MESSAGE if user.is_approved else _REJECTED_MESSAGE,
+            'user': _user_status_dict(user)
+        }), 200
+    
+    # Return user status
+    return jsonify({
+        'success': True,
+        'approved': user.is_approved,
+        'verified': user.is_verified,
+        'rejected': False,
+        'user': _user_status_dict(user)
+    }), 200
 
 
 @auth_bp.route('/request-approval-again', methods=['POST'])
@@ -1196,61 +1313,54 @@ def request_approval_again():
     Re-activate a previously rejected user so they can be reviewed again.
     POST /api/auth/request-approval-again
     """
-    try:
-        data = request.get_json() or {}
-        email = (data.get('email') or '').strip().lower()
+    data = request.get_json(silent=True) or {}
+    email = _norm_email(data.get('email'))
 
-        if not email:
-            return jsonify({
-                'success': False,
-                'message': 'Email is required'
-            }), 400
+    if not email:
+        return _static_response(*_APPROVAL_STATUS_ERRORS['email_required'])
 
-        user = User.query.filter_by(email=email).first()
-        if not user:
-            return jsonify({
-                'success': False,
-                'message': 'User not found'
-            }), 404
+    user = User.find_by_email(email)
+    if not user:
+        return _static_response(*_APPROVAL_STATUS_ERRORS['user_not_found'])
 
-        if user.is_approved and user.is_active:
-            return jsonify({
-                'success': False,
-                'message': 'Account is already approved and active.'
-            }), 400
+    if user.is_approved and user.is_active:
+        return _static_response(*_APPROVAL_AGAIN_ERRORS['already_active'])
 
-        if not user.is_verified:
-            return jsonify({
-                'success': False,
-                'message': 'Please verify your email before requesting approval again.'
-            }), 400
+    if not user.is_verified:
+        return _static_response(*_APPROVAL_AGAIN_ERRORS['not_verified'])
 
-        if user.is_approved and not user.is_active:
-            return jsonify({
-                'success': False,
-                'message': 'This account was deactivated. Please contact administrator.'
-            }), 400
+    if user.is_approved and not user.is_active:
+        return _static_response(*_APPROVAL_AGAIN_ERRORS['deactivated'])
 
-        user.is_active = True
-        db.session.add(user)
-        db.session.commit()
+    user.is_active = True
+    # Stage the approval token with the reactivation so both land in one commit.
+    approval_token = user.generate_approval_token() if user.role == 'authority' else None
+    # The user is already tracked by this session, so committing flushes the changes.
+    db.session.commit()
 
-        admin_notified = False
-        admin_notification_message = 'Admin notification not required for this role.'
-        if user.role == 'authority':
-            admin_notified, admin_notification_message = _notify_admin_for_authority_signup(user)
+    admin_notification_queued = False
+    admin_notification_message = 'Admin notification not required for this role.'
+    if approval_token:
+        base_url = os.getenv('BACKEND_BASE_URL', request.url_root.rstrip('/'))
+        threading.Thread(
+            target=_send_admin_notification_async,
+            args=(
+                current_app._get_current_object(),
+                user.id,
+                f"{base_url}/api/admin/direct-approve/{approval_token}"
+            ),
+            daemon=True
+        ).start()
+        admin_notification_queued = True
+        admin_notification_message = 'Admin notification is being sent.'
 
-        return jsonify({
-            'success': True,
-            'message': 'Request submitted again. Please wait for admin approval.',
-            'admin_notified': admin_notified,
-            'admin_notification_message': admin_notification_message
-        }), 200
-    except Exception as e:
-        return jsonify({
-            'success': False,
-            'message': f'Request failed: {str(e)}'
-        }), 500
+    return jsonify({
+        'success': True,
+        'message': 'Request submitted again. Please wait for admin approval.',
+        'admin_notified': False,
+        'admin_notification_queued': admin_notification_queued,
+        'admin_notification_message': admin_notification_message
+    }), 200
 
 @auth_bp.route('/status', methods=['GET'])
 def auth_status():
@@ -1265,27 +1375,65 @@ def auth_status():
         "message": "Authentication service is running"
     }
     """
-    return jsonify({
-        'success': True,
-        'authenticated': False,
-        'message': 'Authentication service is running'
-    }), 200
+    return _static_response(_STATUS_BODY, 200)
+
+# Error message prefixes for unexpected failures, keyed by endpoint
+_ROUTE_ERROR_MESSAGES = {
+    'auth.signup': 'Signup failed',
+    'auth.login': 'Login failed',
+    'auth.google_auth': 'Google authentication failed',
+    'auth.logout': 'Logout failed',
+    'auth.verify_email': 'Email verification failed',
+    'auth.get_profile': 'Profile retrieval failed',
+    'auth.update_profile': 'Profile update failed',
+    'auth.refresh': 'Token refresh failed',
+    'auth.resend_verification': 'Resend verification failed',
+    'auth.resend_verification_unauth': 'Resend verification failed',
+    'auth.change_password': 'Password change failed',
+    'auth.forgot_password': 'Password reset initiation failed',
+    'auth.reset_password': 'Password reset failed',
+    'auth.check_approval_status': 'Status check failed',
+    'auth.request_approval_again': 'Request failed',
+}
+
+
+def _app_error_handler(error):
+    """Find an app-level handler (e.g. flask-jwt-extended's) for this exception type."""
+    handler_map = current_app.error_handler_spec[None][None]
+    for cls in type(error).__mro__:
+        handler = handler_map.get(cls)
+        if handler is not None:
+            return handler
+    return None
+
+
+@auth_bp.errorhandler(Exception)
+def handle_unexpected_error(error):
+    """Return the JSON 500 shape for errors raised inside auth routes"""
+    # Blueprint handlers win over app-level ones, so hand back HTTP errors
+    # (e.g. rate limits) and JWT errors to their usual handling.
+    if isinstance(error, HTTPException):
+        return error
+    app_handler = _app_error_handler(error)
+    if app_handler is not None:
+        return app_handler(error)
+
+    logger.exception("Unhandled error in %s", request.endpoint)
+    payload = {
+        'success': False,
+        'message': f"{_ROUTE_ERROR_MESSAGES.get(request.endpoint, 'Request failed')}: {str(error)}"
+    }
+    if request.endpoint == 'auth.verify_email':
+        payload['redirect'] = '/signup?error=verification_error'
+    return jsonify(payload), 500
 
 # Error handlers for JWT
 @auth_bp.errorhandler(422)
 def handle_unprocessable_entity(error):
     """Handle JWT validation errors"""
-    return jsonify({
-        'success': False,
-        'message': 'Invalid token or missing required fields',
-        'error': 'VALIDATION_ERROR'
-    }), 422
+    return _static_response(_UNPROCESSABLE_BODY, 422)
 
 @auth_bp.errorhandler(401)
 def handle_unauthorized(error):
     """Handle unauthorized access"""
-    return jsonify({
-        'success': False,
-        'message': 'Invalid or expired token',
-        'error': 'UNAUTHORIZED'
-    }), 401
+    return _static_response(_UNAUTHORIZED_BODY, 401)
@@ -1,33 +1,118 @@
-from flask import Blueprint, jsonify, request
+from flask import Blueprint, current_app, g, jsonify, request, stream_with_context
 from flask_jwt_extended import jwt_required, get_jwt_identity
 from models.unit import Unit
 from models.emergency import Emergency
 from models.location import RouteCalculation
 from models.user import User
-from models.emergency_reporter_contact import EmergencyReporterContact
 from models import db, PublicTrackingLink, TrafficSegment
 from datetime import datetime
-from config import OSRM_BASE_URL
+from config import OSRM_BASE_URL, OSRM_SKIP_WAYPOINTS
 from routes.notification_routes import create_emergency_notification, create_unit_notification
+from utils.json_provider import dumps_compact, loads_bytes
+from utils.polyline_codec import decode_polyline, encode_polyline
 from events import socketio
+from extensions import get_redis, routing_session
 from services.sms_service import SMSService
-import requests
 import math
 import json
-import polyline
 import functools
+import operator
 import os
+import threading
+from cachetools import TTLCache
+from concurrent.futures import ThreadPoolExecutor
+from sqlalchemy import func, select, text
+from sqlalchemy.orm import joinedload
 from itsdangerous import URLSafeTimedSerializer
 from config import SECRET_KEY
 
+try:
+    import numpy as np
+except Exception:
+    np = None
+
 # Max allowed route distance (50 km) for approval/dispatch
 MAX_DISTANCE_METERS = 50_000
 TRACKING_TOKEN_SALT = "public-emergency-tracking-v1"
+OSRM_MAX_WORKERS = 16
+OSRM_FALLBACK_BATCH_SIZE = 4
+# OSRM's default --max-table-size is 100 coordinates; one slot is the destination.
+OSRM_TABLE_MAX_SOURCES = 99
+# Nearest units (by straight line) considered when PostGIS is available
+NEAREST_UNIT_CANDIDATES = 10
+# Route geometry is cached and broadcast as at most this many evenly spaced points
+MAX_CACHED_WAYPOINTS = 245
+# Stored/broadcast waypoints keep 5 decimals (~1 m), the precision of the encoded polyline
+WAYPOINT_DECIMALS = 5
+# Route lookups are reused for endpoints within the same ~11 m grid cell (4 decimals)
+ROUTE_CACHE_GRID_DECIMALS = 4
+ROUTE_CACHE_TTL_SECONDS = 600
+# Route candidates whose 16 evenly spaced points share ~11 m grid cells count as duplicates
+ROUTE_FINGERPRINT_POINTS = 16
+ROUTE_FINGERPRINT_CELL_E5 = 10  # cell size in polyline units (1e-5 degrees)
+# Candidate routes are traffic-scored together in batches of up to this many points
+TRAFFIC_BATCH_MAX_POINTS = 4096
+# With many traffic lines, routes find nearby ones through a grid of ~220 m cells
+# (0.002 degrees) instead of checking every line's bounding box
+TRAFFIC_GRID_MIN_LINES = 64
+TRAFFIC_GRID_CELL_DEG = 0.002
+# Extra delay per meter near each jam type.
+# Example: HIGH => 0.35 sec/m (~350 sec / km additional delay).
+JAM_SEC_PER_METER = {
+    "LOW": 0.06,
+    "MEDIUM": 0.16,
+    "HIGH": 0.35,
+    "BLOCKED": 0.0
+}
+# Traffic scoring accumulates per level by index; unknown levels map to -1 and are ignored
+JAM_LEVELS = ("LOW", "MEDIUM", "HIGH", "BLOCKED")
+JAM_LEVEL_INDEX = {level: idx for idx, level in enumerate(JAM_LEVELS)}
+BLOCKED_LEVEL_INDEX = JAM_LEVEL_INDEX["BLOCKED"]
+JAM_SEC_PER_METER_BY_INDEX = tuple(JAM_SEC_PER_METER[level] for level in JAM_LEVELS)
+ROUTE_CACHE_KEY_PREFIX = "osrm:route:"
+# Distance-only OSRM calls never read the snapped waypoints array.
+OSRM_DISTANCE_ONLY_PARAMS = {"skip_waypoints": "true"} if OSRM_SKIP_WAYPOINTS else {}
+METERS_PER_DEGREE_LAT = 111320.0
+
+# Listing endpoints fetch plain column tuples rather than full ORM objects.
+_UNIT_LIST_COLUMNS = (
+    Unit.unit_id, Unit.unit_vehicle_number, Unit.service_type, Unit.status,
+    Unit.latitude, Unit.longitude, Unit.last_updated
+)
+_UNIT_LIST_FIELDS = tuple(column.key for column in _UNIT_LIST_COLUMNS)
+_EMERGENCY_LIST_COLUMNS = (
+    Emergency.request_id, Emergency.emergency_type, Emergency.latitude, Emergency.longitude,
+    Emergency.status, Emergency.approved_by, Emergency.assigned_unit, Emergency.created_at
+)
+_EMERGENCY_LIST_FIELDS = tuple(column.key for column in _EMERGENCY_LIST_COLUMNS)
+UNIT_LIST_STREAM_BATCH_SIZE = 500
+# Dashboard polls of the unit/emergency listings within this window share one response body
+LISTING_CACHE_TTL_SECONDS = 2
+
+_units_have_postgis_loc = None
+_route_cache = TTLCache(maxsize=4096, ttl=ROUTE_CACHE_TTL_SECONDS)
+_route_cache_lock = threading.Lock()
+# (version, parsed segments) for active traffic segments; see _load_active_traffic_segments.
+_traffic_segments_cache = (None, [])
+# (lines list, grid) for the last list indexed by _line_grid; active segments are one
+# shared list per version, so the grid is built once per version.
+_line_grid_cache = (None, None)
+# (traffic version, route geometry) -> evaluate_route_traffic_penalty result, shared by
+# dispatches on the same corridor until the active traffic segments change.
+_traffic_eval_cache = TTLCache(maxsize=1024, ttl=ROUTE_CACHE_TTL_SECONDS)
+_traffic_eval_cache_lock = threading.Lock()
+# (endpoint, query string) -> JSON body; see _cached_listing.
+_listing_cache = TTLCache(maxsize=256, ttl=LISTING_CACHE_TTL_SECONDS)
+_listing_cache_lock = threading.Lock()
+# Bumped by _invalidate_listing_cache; a body built across a clear is not stored.
+_listing_cache_generation = 0
+
+
+_TRACKING_SERIALIZER = URLSafeTimedSerializer(SECRET_KEY, salt=TRACKING_TOKEN_SALT)
 
 
 def _build_tracking_token(request_id):
-    serializer = URLSafeTimedSerializer(SECRET_KEY, salt=TRACKING_TOKEN_SALT)
-    return serializer.dumps({"request_id": int(request_id)})
+    return _TRACKING_SERIALIZER.dumps({"request_id": int(request_id)})
 
 
 def _normalized_frontend_base_url():
@@ -39,27 +124,75 @@ def _normalized_frontend_base_url():
     return base.rstrip('/')
 
 
+# Environment is read once at import; tracking links reuse the normalized value.
+FRONTEND_BASE_URL = _normalized_frontend_base_url()
+
+
 def _ensure_public_tracking_links_table():
     try:
-        PublicTrackingLink.__table__.create(bind=db.engine, checkfirst=True)
+        PublicTrackingLink.ensure_table()
     except Exception:
         # Table creation should not block dispatch flow.
         pass
 
 
+def _units_support_postgis():
+    """True when the units.loc geography column from migrate_units_postgis.py exists."""
+    global _units_have_postgis_loc
+    if _units_have_postgis_loc is None:
+        try:
+            _units_have_postgis_loc = db.engine.dialect.name == "postgresql" and db.session.execute(text(
+                "SELECT 1 FROM information_schema.columns "
+                "WHERE table_name = 'units' AND column_name = 'loc'"
+            )).first() is not None
+        except Exception:
+            db.session.rollback()
+            _units_have_postgis_loc = False
+    return _units_have_postgis_loc
+
+
+def _query_dispatch_units(service_type, lat, lon):
+    """
+    Available units of a service type that can lie within MAX_DISTANCE_METERS.
+    Uses the PostGIS KNN index when available, else a lat/lon bounding box.
+    """
+    query = Unit.query.filter_by(service_type=service_type, status="AVAILABLE")
+
+    if _units_support_postgis():
+        rows = db.session.execute(text("""
+            SELECT unit_id FROM units
+            WHERE status = 'AVAILABLE'
+              AND service_type = :service_type
+              AND ST_DWithin(loc, ST_MakePoint(:lon, :lat)::geography, :radius)
+            ORDER BY loc <-> ST_MakePoint(:lon, :lat)::geography
+            LIMIT :limit
+        """), {
+            "service_type": service_type,
+            "lat": lat,
+            "lon": lon,
+            "radius": MAX_DISTANCE_METERS,
+            "limit": NEAREST_UNIT_CANDIDATES,
+        }).all()
+        unit_ids = [row[0] for row in rows]
+        return query.filter(Unit.unit_id.in_(unit_ids)).all() if unit_ids else []
+
+    # The box encloses the distance circle, so it never drops a qualifying unit.
+    lat_delta = MAX_DISTANCE_METERS / METERS_PER_DEGREE_LAT
+    query = query.filter(Unit.latitude.between(lat - lat_delta, lat + lat_delta))
+    cos_lat = math.cos(math.radians(lat))
+    if cos_lat > 0.01:
+        lon_delta = MAX_DISTANCE_METERS / (METERS_PER_DEGREE_LAT * cos_lat)
+        if abs(lon) + lon_delta < 180:
+            query = query.filter(Unit.longitude.between(lon - lon_delta, lon + lon_delta))
+    return query.all()
+
+
 def _resolve_unit_driver(unit_id):
-    candidates = User.query.filter_by(role='unit').all()
-    for user in candidates:
-        org = (user.organization or "").strip()
-        if not org:
-            continue
-        normalized = org
-        if normalized.upper().startswith("UNIT_ID:"):
-            normalized = normalized.split(":", 1)[1].strip()
-        if normalized.isdigit() and int(normalized) == int(unit_id):
-            full_name = " ".join(part for part in [user.first_name, user.last_name] if part).strip() or user.email
-            return {"name": full_name, "phone": user.phone}
-    return None
+    user = User.find_unit_contact(unit_id)
+    if not user:
+        return None
+    full_name = " ".join(part for part in [user.first_name, user.last_name] if part).strip() or user.email
+    return {"name": full_name, "phone": user.phone}
 
 def authority_required():
     """
@@ -69,10 +202,12 @@ def authority_required():
         @jwt_required()
         @functools.wraps(f)
         def decorated_function(*args, **kwargs):
-            current_user_id = get_jwt_identity()
-            current_user = User.query.get(current_user_id)
+            # Only the role is needed here; it is looked up once per request.
+            if 'current_user_role' not in g:
+                g.current_user_role = db.session.query(User.role).filter_by(id=get_jwt_identity()).scalar()
+            current_user_role = g.current_user_role
             
-            if not current_user:
+            if current_user_role is None:
                 return jsonify({
                     'success': False,
                     'message': 'User not found',
@@ -80,7 +215,7 @@ def authority_required():
                 }), 401
             
             # Check if user has authority or admin role
-            if current_user.role not in ['authority', 'admin']:
+            if current_user_role not in ('authority', 'admin'):
                 return jsonify({
                     'success': False,
                     'message': 'Authority access required',
@@ -92,24 +227,198 @@ def authority_required():
     return decorator
 
 
-def haversine_m(lat1, lon1, lat2, lon2):
+def _cached_listing(f):
+    """
+    Serve repeat polls of a listing endpoint from a per-process cache of the JSON body,
+    keyed by endpoint and query string, for LISTING_CACHE_TTL_SECONDS.
+    Streamed bodies are stored once the stream has been sent in full.
+    Listings may be up to LISTING_CACHE_TTL_SECONDS stale: add_unit, dispatch and complete
+    clear this worker's cache so their own writes show at once, but other workers, unit
+    status updates from unit/communication routes and new emergencies are not invalidated.
+    """
+    @functools.wraps(f)
+    def wrapper(*args, **kwargs):
+        key = (request.endpoint, request.query_string)
+        with _listing_cache_lock:
+            body = _listing_cache.get(key)
+            generation = _listing_cache_generation
+        if body is not None:
+            return current_app.response_class(body, mimetype="application/json")
+
+        response = f(*args, **kwargs)
+        if response.status_code != 200:
+            return response
+        if response.is_streamed:
+            response.response = _cache_streamed_body(key, generation, response.response)
+        else:
+            _store_listing(key, generation, response.get_data())
+        return response
+    return wrapper
+
+
+def _store_listing(key, generation, body):
+    with _listing_cache_lock:
+        if generation == _listing_cache_generation:
+            _listing_cache[key] = body
+
+
+def _cache_streamed_body(key, generation, chunks):
+    parts = []
+    for chunk in chunks:
+        parts.append(chunk)
+        yield chunk
+    _store_listing(key, generation, "".join(parts))
+
+
+def _invalidate_listing_cache():
+    global _listing_cache_generation
+    with _listing_cache_lock:
+        _listing_cache_generation += 1
+        _listing_cache.clear()
+
+
+def haversine_m(
+    lat1, lon1, lat2, lon2,
+    _R=6371000, _rad=math.radians, _sin=math.sin, _cos=math.cos, _atan2=math.atan2, _sqrt=math.sqrt
+):
     """
     Great-circle distance between two lat/lon pairs in meters.
+    The underscore defaults bind Earth's radius and math functions as fast locals for
+    scalar callers; they are not meant to be passed.
+    """
+    phi1 = _rad(lat1)
+    phi2 = _rad(lat2)
+    dphi = _rad(lat2 - lat1)
+    dlambda = _rad(lon2 - lon1)
+
+    a = _sin(dphi / 2) ** 2 + _cos(phi1) * _cos(phi2) * _sin(dlambda / 2) ** 2
+    c = 2 * _atan2(_sqrt(a), _sqrt(1 - a))
+    return _R * c
+
+
+def haversine_m_vec(lat0, lon0, lats, lons):
     """
+    Great-circle distances in meters from one point to many points at once.
+    lat0/lon0 may also be arrays the same length as lats/lons for pairwise
+    distances (e.g. consecutive route points).
+    Returns a NumPy array when NumPy is installed, otherwise a list.
+    """
+    if np is None:
+        if isinstance(lat0, (int, float)):
+            return [haversine_m(lat0, lon0, lat, lon) for lat, lon in zip(lats, lons)]
+        return [haversine_m(*pair) for pair in zip(lat0, lon0, lats, lons)]
+
     R = 6371000  # Earth radius in meters
-    phi1 = math.radians(lat1)
-    phi2 = math.radians(lat2)
-    dphi = math.radians(lat2 - lat1)
-    dlambda = math.radians(lon2 - lon1)
+    lats = np.asarray(lats, dtype=np.float64)
+    lons = np.asarray(lons, dtype=np.float64)
+    phi1 = np.radians(lat0)
+    phi2 = np.radians(lats)
+    dphi = phi2 - phi1
+    dlambda = np.radians(lons - np.asarray(lon0, dtype=np.float64))
+
+    a = np.sin(dphi / 2) ** 2 + np.cos(phi1) * np.cos(phi2) * np.sin(dlambda / 2) ** 2
+    return R * 2 * np.arctan2(np.sqrt(a), np.sqrt(1 - a))
+
+
+def _route_segment_lengths_m(route_points):
+    """Length in meters of each consecutive segment of a [lat, lng] route."""
+    if np is None:
+        return [
+            haversine_m(start[0], start[1], end[0], end[1])
+            for start, end in zip(route_points[:-1], route_points[1:])
+        ]
+    route = np.asarray(route_points, dtype=np.float64)
+    return haversine_m_vec(route[:-1, 0], route[:-1, 1], route[1:, 0], route[1:, 1])
+
 
-    a = math.sin(dphi / 2) ** 2 + math.cos(phi1) * math.cos(phi2) * math.sin(dlambda / 2) ** 2
-    c = 2 * math.atan2(math.sqrt(a), math.sqrt(1 - a))
-    return R * c
+@functools.lru_cache(maxsize=256)
+def _waypoint_sampler(count):
+    """itemgetter for MAX_CACHED_WAYPOINTS evenly spaced indices out of count points."""
+    step = count / MAX_CACHED_WAYPOINTS
+    return operator.itemgetter(*(int(i * step) for i in range(MAX_CACHED_WAYPOINTS)))
+
+
+def waypoints_to_json(waypoints):
+    """
+    Evenly sample decoded [lat, lng] points down to MAX_CACHED_WAYPOINTS, round them to
+    WAYPOINT_DECIMALS and encode them as compact JSON.
+    Points are picked before any array conversion, so long routes only convert the sample.
+    Returns (waypoints, json_text) so callers broadcast what they store.
+    """
+    if len(waypoints) > MAX_CACHED_WAYPOINTS:
+        waypoints = _waypoint_sampler(len(waypoints))(waypoints)
+    if np is None:
+        rounded = [[round(lat, WAYPOINT_DECIMALS), round(lng, WAYPOINT_DECIMALS)] for lat, lng in waypoints]
+    else:
+        rounded = np.round(np.asarray(waypoints, dtype=np.float64), WAYPOINT_DECIMALS).tolist()
+    return rounded, dumps_compact(rounded)
+
+
+def _route_cache_key(kind, src_lat, src_lon, dst_lat, dst_lon):
+    return "{}:{}".format(kind, ",".join(
+        str(round(v, ROUTE_CACHE_GRID_DECIMALS)) for v in (src_lat, src_lon, dst_lat, dst_lon)
+    ))
+
+
+def _route_cache_get_many(keys):
+    """
+    Look keys up in the per-process cache, then in one Redis MGET for the misses.
+    Returns a list aligned with keys, with None for misses.
+    """
+    with _route_cache_lock:
+        results = [_route_cache.get(key) for key in keys]
+    missing = [idx for idx, value in enumerate(results) if value is None]
+    client = get_redis()
+    if not missing or client is None:
+        return results
+    try:
+        raw_values = client.mget([f"{ROUTE_CACHE_KEY_PREFIX}{keys[idx]}" for idx in missing])
+    except Exception:
+        return results
+    with _route_cache_lock:
+        for idx, raw in zip(missing, raw_values):
+            if raw:
+                results[idx] = _route_cache[keys[idx]] = loads_bytes(raw)
+    return results
+
+
+def _route_cache_put(key, value):
+    with _route_cache_lock:
+        _route_cache[key] = value
+    client = get_redis()
+    if client is not None:
+        try:
+            client.setex(f"{ROUTE_CACHE_KEY_PREFIX}{key}", ROUTE_CACHE_TTL_SECONDS, dumps_compact(value))
+        except Exception:
+            pass
+
+
+def _grid_cached_route(kind, is_cacheable):
+    """
+    Cache a (src_lat, src_lon, dst_lat, dst_lon) route lookup by grid-rounded endpoints.
+    Results live in a per-process TTL cache and, when REDIS_URL is set, in Redis
+    so other workers reuse them. Callers must treat cached results as read-only.
+    """
+    def decorator(f):
+        @functools.wraps(f)
+        def wrapper(src_lat, src_lon, dst_lat, dst_lon, **kwargs):
+            key = _route_cache_key(kind, src_lat, src_lon, dst_lat, dst_lon)
+            cached = _route_cache_get_many([key])[0]
+            if cached is not None:
+                return cached
+
+            result = f(src_lat, src_lon, dst_lat, dst_lon, **kwargs)
+            if is_cacheable(result):
+                _route_cache_put(key, result)
+            return result
+        return wrapper
+    return decorator
 
 
 # -------------------------
 # Helper: Phase 1 - Fetch full OSRM route with 245 waypoints
 # -------------------------
+@_grid_cached_route("full", lambda result: result[0] is not None)
 def fetch_full_osrm_route(src_lat, src_lon, dst_lat, dst_lon, timeout=5):
     """
     Fetches complete OSRM route with full geometry and waypoints.
@@ -124,9 +433,9 @@ def fetch_full_osrm_route(src_lat, src_lon, dst_lat, dst_lon, timeout=5):
     }
     
     try:
-        resp = requests.get(url, params=params, timeout=timeout)
+        resp = routing_session.get(url, params=params, timeout=timeout)
         resp.raise_for_status()
-        data = resp.json()
+        data = loads_bytes(resp.content)
         
         routes = data.get("routes") or []
         if not routes:
@@ -139,20 +448,11 @@ def fetch_full_osrm_route(src_lat, src_lon, dst_lat, dst_lon, timeout=5):
         
         # Decode polyline to get waypoints
         if geometry:
-            waypoints = polyline.decode(geometry)
             # Limit to 245 waypoints maximum
-            if len(waypoints) > 245:
-                # Sample waypoints to get exactly 245 points
-                step = len(waypoints) / 245
-                waypoints = [waypoints[int(i * step)] for i in range(245)]
-            
-            # Convert to [lat, lng] format for JSON storage
-            waypoints_json = json.dumps([[lat, lng] for lat, lng in waypoints])
-            
-            # Prepare polyline positions for frontend
-            polyline_positions = json.dumps(waypoints)
+            waypoints, waypoints_json = waypoints_to_json(decode_polyline(geometry))
             
-            return distance, duration, geometry, waypoints_json, polyline_positions, len(waypoints)
+            # Stored waypoints and frontend polyline positions are the same [lat, lng] array.
+            return distance, duration, geometry, waypoints_json, waypoints_json, len(waypoints)
         else:
             raise ValueError("No geometry in OSRM response")
             
@@ -172,17 +472,19 @@ def distance(lat1, lon1, lat2, lon2):
 # -------------------------
 # Helper: OSRM route distance/duration (driving)
 # -------------------------
-def osrm_route_distance_duration(src_lat, src_lon, dst_lat, dst_lon, timeout=3):
+@_grid_cached_route("distance", lambda result: result[0] is not None)
+def osrm_route_distance_duration(src_lat, src_lon, dst_lat, dst_lon, timeout=3, session=None):
     """
     Calls OSRM (or your routing host) to get the driving route.
     Returns (distance_meters, duration_seconds).
     Raises on failure so caller can decide fallback/skip.
     """
     url = f"{OSRM_BASE_URL}/route/v1/driving/{src_lon},{src_lat};{dst_lon},{dst_lat}"
-    params = {"overview": "false", "alternatives": "false"}
-    resp = requests.get(url, params=params, timeout=timeout)
+    # Candidate scoring never needs geometry; only the chosen unit's route asks for overview=full.
+    params = {"overview": "false", "alternatives": "false", **OSRM_DISTANCE_ONLY_PARAMS}
+    resp = (session or routing_session).get(url, params=params, timeout=timeout)
     resp.raise_for_status()
-    data = resp.json()
+    data = loads_bytes(resp.content)
     routes = data.get("routes") or []
     if not routes:
         raise ValueError("No route from OSRM")
@@ -190,6 +492,92 @@ def osrm_route_distance_duration(src_lat, src_lon, dst_lat, dst_lon, timeout=3):
     return route.get("distance"), route.get("duration")
 
 
+def osrm_table_distances(sources, dst_lat, dst_lon, timeout=3):
+    """
+    Calls the OSRM table service for many sources to a single destination,
+    one request per OSRM_TABLE_MAX_SOURCES sources.
+    sources is a list of (lat, lon) pairs.
+    Returns a list of (distance_meters, duration_seconds) aligned with sources;
+    either value is None where OSRM found no route.
+    Raises on failure so caller can fall back to per-source routing.
+    """
+    # Pairs share the "distance" cache with osrm_route_distance_duration; only misses are sent.
+    keys = [_route_cache_key("distance", lat, lon, dst_lat, dst_lon) for lat, lon in sources]
+    results = _route_cache_get_many(keys)
+    missing = [idx for idx, value in enumerate(results) if value is None]
+    for start in range(0, len(missing), OSRM_TABLE_MAX_SOURCES):
+        chunk = missing[start:start + OSRM_TABLE_MAX_SOURCES]
+        chunk_results = _osrm_table_chunk([sources[idx] for idx in chunk], dst_lat, dst_lon, timeout)
+        for idx, result in zip(chunk, chunk_results):
+            results[idx] = result
+            if result[0] is not None:
+                _route_cache_put(keys[idx], result)
+    return results
+
+
+def _osrm_table_chunk(sources, dst_lat, dst_lon, timeout):
+    coords = ";".join([f"{dst_lon},{dst_lat}"] + [f"{lon},{lat}" for lat, lon in sources])
+    url = f"{OSRM_BASE_URL}/table/v1/driving/{coords}"
+    params = {
+        "sources": ";".join(str(i) for i in range(1, len(sources) + 1)),
+        "destinations": "0",
+        "annotations": "distance,duration",
+        **OSRM_DISTANCE_ONLY_PARAMS
+    }
+    resp = routing_session.get(url, params=params, timeout=timeout)
+    resp.raise_for_status()
+    data = loads_bytes(resp.content)
+    if data.get("code") != "Ok":
+        raise ValueError(f"OSRM table failed: {data.get('code')}")
+    distances = data.get("distances") or []
+    durations = data.get("durations") or []
+    if len(distances) != len(sources) or len(durations) != len(sources):
+        raise ValueError("OSRM table size mismatch")
+    return [(dist_row[0], dur_row[0]) for dist_row, dur_row in zip(distances, durations)]
+
+
+def osrm_route_distances_parallel(sources, dst_lat, dst_lon, timeout=3):
+    """
+    Per-source OSRM route lookups run concurrently on the shared session.
+    Returns a list aligned with sources of (distance_meters, duration_seconds),
+    or (None, None) where the lookup failed.
+    """
+    def lookup(source):
+        try:
+            return osrm_route_distance_duration(source[0], source[1], dst_lat, dst_lon, timeout=timeout)
+        except Exception:
+            return None, None
+
+    if not sources:
+        return []
+    with ThreadPoolExecutor(max_workers=min(OSRM_MAX_WORKERS, len(sources))) as executor:
+        return list(executor.map(lookup, sources))
+
+
+def osrm_route_distances_nearest_first(sources, lower_bounds, dst_lat, dst_lon, timeout=3):
+    """
+    Routes sources a small batch at a time, nearest first.
+    lower_bounds are the ascending straight-line distances of sources; a failed
+    lookup counts as its straight-line distance, matching the dispatch fallback.
+    Stops once the best distance so far is no longer than the next source's
+    lower bound, since road distance can never beat straight-line distance.
+    Returns results for the routed prefix of sources only.
+    """
+    results = []
+    best = None
+    for start in range(0, len(sources), OSRM_FALLBACK_BATCH_SIZE):
+        end = start + OSRM_FALLBACK_BATCH_SIZE
+        batch = osrm_route_distances_parallel(sources[start:end], dst_lat, dst_lon, timeout=timeout)
+        for bound, (dist, _) in zip(lower_bounds[start:end], batch):
+            effective = bound if dist is None else dist
+            if best is None or effective < best:
+                best = effective
+        results.extend(batch)
+        if end < len(sources) and best <= lower_bounds[end]:
+            break
+    return results
+
+
 def fetch_osrm_alternative_routes(src_lat, src_lon, dst_lat, dst_lon, timeout=5):
     """
     Fetch route alternatives from OSRM.
@@ -202,9 +590,9 @@ def fetch_osrm_alternative_routes(src_lat, src_lon, dst_lat, dst_lon, timeout=5)
         "steps": "false",
         "alternatives": "true"
     }
-    resp = requests.get(url, params=params, timeout=timeout)
+    resp = routing_session.get(url, params=params, timeout=timeout)
     resp.raise_for_status()
-    data = resp.json()
+    data = loads_bytes(resp.content)
     routes = data.get("routes") or []
     if not routes:
         raise ValueError("No alternative routes from OSRM")
@@ -231,9 +619,9 @@ def fetch_osrm_route_with_via(src_lat, src_lon, via_lat, via_lon, dst_lat, dst_l
         "steps": "false",
         "alternatives": "false"
     }
-    resp = requests.get(url, params=params, timeout=timeout)
+    resp = routing_session.get(url, params=params, timeout=timeout)
     resp.raise_for_status()
-    data = resp.json()
+    data = loads_bytes(resp.content)
     routes = data.get("routes") or []
     if not routes:
         return None
@@ -271,9 +659,9 @@ def fetch_openrouteservice_alternatives(src_lat, src_lon, dst_lat, dst_lon, time
     }
 
     try:
-        resp = requests.post(url, headers=headers, json=payload, timeout=timeout)
+        resp = routing_session.post(url, headers=headers, json=payload, timeout=timeout)
         resp.raise_for_status()
-        data = resp.json() or {}
+        data = loads_bytes(resp.content) or {}
         routes = []
 
         # Shape A: /json endpoint => {"routes":[{"geometry":"encoded", "summary":{...}}]}
@@ -301,7 +689,7 @@ def fetch_openrouteservice_alternatives(src_lat, src_lon, dst_lat, dst_lon, time
             if len(latlng) < 2:
                 continue
             routes.append({
-                "geometry": polyline.encode(latlng),
+                "geometry": encode_polyline(latlng),
                 "distance": summary.get("distance"),
                 "duration": summary.get("duration")
             })
@@ -348,69 +736,115 @@ def build_additional_via_candidates(src_lat, src_lon, dst_lat, dst_lon):
     return via_points
 
 
+def _route_fingerprint(geometry):
+    """
+    Dedup key for an encoded route: the grid cells of ROUTE_FINGERPRINT_POINTS evenly
+    spaced points, so near-identical geometries collapse to one candidate.
+    Cells are computed on integer 1e-5 degree units, the polyline's own precision, so the
+    NumPy and pure-Python paths agree exactly.
+    """
+    points = decode_polyline(geometry)
+    if len(points) < 2:
+        return geometry
+    last = len(points) - 1
+    if np is None:
+        indices = [i * last // (ROUTE_FINGERPRINT_POINTS - 1) for i in range(ROUTE_FINGERPRINT_POINTS)]
+        return tuple(
+            tuple(round(coord * 1e5) // ROUTE_FINGERPRINT_CELL_E5 for coord in points[i])
+            for i in indices
+        )
+    indices = np.arange(ROUTE_FINGERPRINT_POINTS) * last // (ROUTE_FINGERPRINT_POINTS - 1)
+    sampled = np.asarray(points, dtype=np.float64)[indices]
+    cells = np.rint(sampled * 1e5).astype(np.int64) // ROUTE_FINGERPRINT_CELL_E5
+    return tuple(map(tuple, cells.tolist()))
+
+
+@_grid_cached_route("candidates", bool)
 def fetch_route_candidates_expanded(src_lat, src_lon, dst_lat, dst_lon, timeout=5):
     """
     Get base OSRM alternatives and enrich with via-constrained routes to increase
     chance of finding distinct low-traffic paths.
     """
     candidates = []
-    seen_geometries = set()
+    seen_fingerprints = set()
 
-    try:
-        base_routes = fetch_osrm_alternative_routes(src_lat, src_lon, dst_lat, dst_lon, timeout=timeout)
-        for route in base_routes:
-            geom = route.get("geometry")
-            if geom and geom not in seen_geometries:
-                candidates.append(route)
-                seen_geometries.add(geom)
-        print(f"🧭 OSRM base candidates: {len(base_routes)}")
-    except Exception:
-        pass
-
-    for via_lat, via_lon in build_additional_via_candidates(src_lat, src_lon, dst_lat, dst_lon):
+    def add_candidate(route):
+        geom = route.get("geometry")
+        if not geom:
+            return
         try:
-            route = fetch_osrm_route_with_via(
-                src_lat, src_lon, via_lat, via_lon, dst_lat, dst_lon, timeout=timeout
+            fingerprint = _route_fingerprint(geom)
+        except Exception:
+            fingerprint = geom
+        if fingerprint not in seen_fingerprints:
+            candidates.append(route)
+            seen_fingerprints.add(fingerprint)
+
+    # Base alternatives, ORS and every via probe are independent lookups, so they run
+    # concurrently; results are still merged in the fixed order base, via, ORS.
+    via_points = build_additional_via_candidates(src_lat, src_lon, dst_lat, dst_lon)
+    with ThreadPoolExecutor(max_workers=min(OSRM_MAX_WORKERS, len(via_points) + 2)) as executor:
+        base_future = executor.submit(
+            fetch_osrm_alternative_routes, src_lat, src_lon, dst_lat, dst_lon, timeout=timeout
+        )
+        # Optional secondary API enrichment (OSRM remains mandatory primary).
+        ors_future = executor.submit(
+            fetch_openrouteservice_alternatives, src_lat, src_lon, dst_lat, dst_lon, timeout=max(4, timeout)
+        )
+        via_futures = [
+            executor.submit(
+                fetch_osrm_route_with_via,
+                src_lat, src_lon, via_lat, via_lon, dst_lat, dst_lon,
+                timeout=timeout
             )
-            if not route:
-                continue
-            geom = route.get("geometry")
-            if geom and geom not in seen_geometries:
-                candidates.append(route)
-                seen_geometries.add(geom)
-            if len(candidates) >= 24:
-                break
+            for via_lat, via_lon in via_points
+        ]
+
+        try:
+            base_routes = base_future.result()
+            for route in base_routes:
+                add_candidate(route)
+            print(f"🧭 OSRM base candidates: {len(base_routes)}")
         except Exception:
-            continue
+            pass
 
-    # Optional secondary API enrichment (OSRM remains mandatory primary).
-    try:
-        ors_routes = fetch_openrouteservice_alternatives(
-            src_lat, src_lon, dst_lat, dst_lon, timeout=max(4, timeout)
-        )
-        for route in ors_routes:
-            geom = route.get("geometry")
-            if geom and geom not in seen_geometries:
-                candidates.append(route)
-                seen_geometries.add(geom)
-        if ors_routes:
-            print(f"🧭 ORS candidates merged: {len(ors_routes)}")
-    except Exception:
-        pass
+        for future in via_futures:
+            try:
+                route = future.result()
+                if not route:
+                    continue
+                add_candidate(route)
+                if len(candidates) >= 24:
+                    break
+            except Exception:
+                continue
+        # Past the cap the remaining probes are not needed; drop any not yet started.
+        for future in via_futures:
+            future.cancel()
+
+        try:
+            ors_routes = ors_future.result()
+            for route in ors_routes:
+                add_candidate(route)
+            if ors_routes:
+                print(f"🧭 ORS candidates merged: {len(ors_routes)}")
+        except Exception:
+            pass
 
     print(f"🛣️ Total unique route candidates: {len(candidates)}")
     return candidates
 
 
-def _point_to_segment_distance_m(point, seg_start, seg_end):
+def _point_to_segment_distance_m(point, seg_start, seg_end, _rad=math.radians, _cos=math.cos, _hypot=math.hypot):
     """
     Approximate point-to-segment distance in meters.
-    Input coordinates are [lat, lng].
+    Input coordinates are [lat, lng]. The underscore defaults bind math functions as
+    fast locals for the no-NumPy loops; they are not meant to be passed.
     """
     # Equirectangular projection around point latitude for robust local distance math.
-    lat0 = math.radians(point[0])
+    lat0 = _rad(point[0])
     meter_per_deg_lat = 111320.0
-    meter_per_deg_lng = 111320.0 * math.cos(lat0)
+    meter_per_deg_lng = 111320.0 * _cos(lat0)
 
     px = point[1] * meter_per_deg_lng
     py = point[0] * meter_per_deg_lat
@@ -422,18 +856,59 @@ def _point_to_segment_distance_m(point, seg_start, seg_end):
     dx = x2 - x1
     dy = y2 - y1
     if dx == 0 and dy == 0:
-        return math.hypot(px - x1, py - y1)
+        return _hypot(px - x1, py - y1)
 
     t = ((px - x1) * dx + (py - y1) * dy) / (dx * dx + dy * dy)
     t = max(0.0, min(1.0, t))
     proj_x = x1 + t * dx
     proj_y = y1 + t * dy
-    return math.hypot(px - proj_x, py - proj_y)
+    return _hypot(px - proj_x, py - proj_y)
+
+
+def _project_latlng(points, lat0):
+    """
+    Equirectangular projection of [lat, lng] points to [x, y] meters around lat0.
+    One scale factor serves a whole route: it drifts < 0.1% over a city-sized area.
+    """
+    pts = np.asarray(points, dtype=np.float64).reshape(-1, 2)
+    meter_per_deg_lng = METERS_PER_DEGREE_LAT * math.cos(math.radians(lat0))
+    return np.stack([pts[:, 1] * meter_per_deg_lng, pts[:, 0] * METERS_PER_DEGREE_LAT], axis=1)
+
+
+def _route_projection_lat(route_points):
+    lats = np.asarray(route_points, dtype=np.float64)[:, 0]
+    return float((lats.min() + lats.max()) / 2)
+
+
+def _points_to_segments_distance_m(px, py, x1, y1, x2, y2):
+    """
+    NumPy form of _point_to_segment_distance_m over broadcast arrays of points and
+    segments. Inputs are projected meters (see _project_latlng); returns meters.
+    """
+    dx = x2 - x1
+    dy = y2 - y1
+
+    length_sq = dx * dx + dy * dy
+    # Degenerate segments keep t = 0, i.e. the distance to their start point.
+    t = np.divide(
+        (px - x1) * dx + (py - y1) * dy,
+        length_sq,
+        out=np.zeros(np.broadcast(px, length_sq).shape),
+        where=length_sq > 0
+    )
+    t = np.clip(t, 0.0, 1.0)
+    return np.hypot(px - (x1 + t * dx), py - (y1 + t * dy))
 
 
 def _point_to_polyline_distance_m(point, polyline_points):
-    if not polyline_points or len(polyline_points) < 2:
+    if polyline_points is None or len(polyline_points) < 2:
         return float("inf")
+    if np is not None:
+        pts = _project_latlng(polyline_points, point[0])
+        (px, py), = _project_latlng([point], point[0])
+        return float(_points_to_segments_distance_m(
+            px, py, pts[:-1, 0], pts[:-1, 1], pts[1:, 0], pts[1:, 1]
+        ).min())
     best = float("inf")
     for idx in range(len(polyline_points) - 1):
         dist = _point_to_segment_distance_m(point, polyline_points[idx], polyline_points[idx + 1])
@@ -456,8 +931,14 @@ def _segment_to_segment_distance_m(a1, a2, b1, b2):
 
 
 def _route_segment_to_polyline_distance_m(route_start, route_end, polyline_points):
-    if not polyline_points or len(polyline_points) < 2:
+    if polyline_points is None or len(polyline_points) < 2:
         return float("inf")
+    if np is not None:
+        lat0 = route_start[0]
+        return float(_route_to_polyline_distances_m(
+            _project_latlng([route_start, route_end], lat0),
+            _project_latlng(polyline_points, lat0)
+        )[0])
     best = float("inf")
     for idx in range(len(polyline_points) - 1):
         traffic_start = polyline_points[idx]
@@ -468,19 +949,70 @@ def _route_segment_to_polyline_distance_m(route_start, route_end, polyline_point
     return best
 
 
+def _route_to_polyline_distances_m(route_xy, polyline_xy):
+    """
+    _route_segment_to_polyline_distance_m for every segment of a route at once
+    (NumPy required). Both inputs are projected with the same _project_latlng origin.
+    Returns an array with one distance per route segment.
+    """
+    if len(polyline_xy) < 2:
+        return np.full(len(route_xy) - 1, np.inf)
+    # Same four endpoint-to-segment checks as _segment_to_segment_distance_m. Each
+    # polyline vertex is an endpoint of some segment, so the vertex-to-route-segment
+    # half reduces to one pass over the vertices.
+    a_x, a_y = route_xy[:, 0], route_xy[:, 1]
+    b_x, b_y = polyline_xy[:, 0], polyline_xy[:, 1]
+    # Rows are route segments, columns are polyline segments (or vertices).
+    start_x, start_y = a_x[:-1, None], a_y[:-1, None]
+    end_x, end_y = a_x[1:, None], a_y[1:, None]
+    route_to_polyline = np.minimum(
+        _points_to_segments_distance_m(start_x, start_y, b_x[:-1], b_y[:-1], b_x[1:], b_y[1:]),
+        _points_to_segments_distance_m(end_x, end_y, b_x[:-1], b_y[:-1], b_x[1:], b_y[1:]),
+    ).min(axis=1)
+    polyline_to_route = _points_to_segments_distance_m(
+        b_x, b_y, start_x, start_y, end_x, end_y
+    ).min(axis=1)
+    return np.minimum(route_to_polyline, polyline_to_route)
+
+
+def _sampled_points_near_polyline(sampled_xy, polyline_xy, threshold_m):
+    """True when any projected sample point is within threshold_m of the polyline."""
+    if len(sampled_xy) == 0 or len(polyline_xy) < 2:
+        return False
+    b_x, b_y = polyline_xy[:, 0], polyline_xy[:, 1]
+    distances = _points_to_segments_distance_m(
+        sampled_xy[:, 0, None], sampled_xy[:, 1, None], b_x[:-1], b_y[:-1], b_x[1:], b_y[1:]
+    )
+    return bool((distances <= threshold_m).any())
+
+
 def _sample_points_on_route(route_points, step_m=25.0):
     """
     Densify route polyline so blocked checks don't miss curved or partial overlaps.
     Returns sampled [lat, lng] points along each segment.
     """
-    if not route_points or len(route_points) < 2:
+    # route_points may be a NumPy array (the batched scorer's stacked routes).
+    if route_points is None or len(route_points) < 2:
         return []
 
+    seg_lens = _route_segment_lengths_m(route_points)
+    if np is not None:
+        route = np.asarray(route_points, dtype=np.float64)
+        keep = np.flatnonzero(seg_lens > 0)
+        steps = np.maximum(1, (seg_lens[keep] / step_m).astype(np.int64))
+        # Segment k contributes steps[k] + 1 points at t = 0, 1/steps, ..., 1.
+        counts = steps + 1
+        seg_idx = np.repeat(keep, counts)
+        step_idx = np.arange(counts.sum()) - np.repeat(np.cumsum(counts) - counts, counts)
+        t = (step_idx / np.repeat(steps, counts))[:, None]
+        start = route[seg_idx]
+        return (start + (route[seg_idx + 1] - start) * t).tolist()
+
     sampled = []
     for idx in range(len(route_points) - 1):
         start = route_points[idx]
         end = route_points[idx + 1]
-        seg_len = haversine_m(start[0], start[1], end[0], end[1])
+        seg_len = seg_lens[idx]
         if seg_len <= 0:
             continue
         steps = max(1, int(seg_len / step_m))
@@ -492,100 +1024,268 @@ def _sample_points_on_route(route_points, step_m=25.0):
     return sampled
 
 
-def _get_blocked_overlap_by_segment(
+def _analyze_route_vs_blocked(
     route_points,
     blocked_segments,
-    blocked_threshold_m=70.0
+    blocked_threshold_m=90.0,
+    sampled_point_threshold_m=100.0,
+    overlap_threshold_m=70.0,
+    sampled_points=None
 ):
     """
-    Returns per-blocked-segment overlapped route length in meters.
-    A route segment contributes its full length when it is close enough to a blocked segment.
+    Single pass of a route against blocked lines, computing each route-to-line
+    distance once for every check. sampled_points may carry an existing
+    _sample_points_on_route(route_points) result; otherwise the route is densified
+    on first need. Returns (hard_blocked, blocking_ids, overlap_by_id):
+    - hard_blocked: a route segment (blocked_threshold_m) or a densified route point
+      (sampled_point_threshold_m) comes near any blocked line
+    - blocking_ids: sorted ids of the lines that do so (lines without an id are skipped)
+    - overlap_by_id: route length in meters of the segments within overlap_threshold_m
+      of each line
     """
-    if not route_points or len(route_points) < 2 or not blocked_segments:
-        return {}
+    if route_points is None or len(route_points) < 2 or not blocked_segments:
+        return False, [], {}
+    blocked_segments = _lines_near_route(
+        route_points,
+        blocked_segments,
+        max(blocked_threshold_m, sampled_point_threshold_m, overlap_threshold_m)
+    )
+    if not blocked_segments:
+        return False, [], {}
 
-    overlap_by_segment_id = {}
+    hard_blocked = False
+    blocking_ids = set()
+    overlap_by_id = {}
+    seg_lens = _route_segment_lengths_m(route_points)
+
+    def densified():
+        nonlocal sampled_points
+        if sampled_points is None:
+            sampled_points = _sample_points_on_route(route_points, step_m=25.0)
+        return sampled_points
+
+    if np is not None:
+        lat0 = _route_projection_lat(route_points)
+        route_xy = _project_latlng(route_points, lat0)
+        sampled_xy = None
+        for blocked in blocked_segments:
+            if blocked["points"] is None or len(blocked["points"]) < 2:
+                continue
+            blocked_id = blocked.get("id")
+            blocked_xy = _project_latlng(blocked["points"], lat0)
+            distances = _route_to_polyline_distances_m(route_xy, blocked_xy)
+
+            hit = bool((distances <= blocked_threshold_m).any())
+            if not hit:
+                if sampled_xy is None:
+                    points = densified()
+                    sampled_xy = _project_latlng(points, lat0) if points else np.empty((0, 2))
+                hit = _sampled_points_near_polyline(sampled_xy, blocked_xy, sampled_point_threshold_m)
+            if hit:
+                hard_blocked = True
+                if blocked_id is not None:
+                    blocking_ids.add(blocked_id)
+
+            near = distances <= overlap_threshold_m
+            if blocked_id is not None and near.any():
+                overlap_by_id[blocked_id] = overlap_by_id.get(blocked_id, 0.0) + float(seg_lens[near].sum())
+        return hard_blocked, sorted(blocking_ids), overlap_by_id
+
+    hit_lines = set()
     for idx in range(len(route_points) - 1):
         start = route_points[idx]
         end = route_points[idx + 1]
-        route_seg_len_m = haversine_m(start[0], start[1], end[0], end[1])
-
-        for blocked in blocked_segments:
-            blocked_id = blocked.get("id")
-            if blocked_id is None:
-                continue
+        for line_idx, blocked in enumerate(blocked_segments):
             dist_m = _route_segment_to_polyline_distance_m(start, end, blocked["points"])
             if dist_m <= blocked_threshold_m:
-                overlap_by_segment_id[blocked_id] = overlap_by_segment_id.get(blocked_id, 0.0) + route_seg_len_m
+                hit_lines.add(line_idx)
+            if dist_m <= overlap_threshold_m and blocked.get("id") is not None:
+                blocked_id = blocked["id"]
+                overlap_by_id[blocked_id] = overlap_by_id.get(blocked_id, 0.0) + seg_lens[idx]
+
+    # Dense-point check for lines the segment pass missed.
+    if len(hit_lines) < len(blocked_segments):
+        for line_idx, blocked in enumerate(blocked_segments):
+            if line_idx in hit_lines:
+                continue
+            for pt in densified():
+                if _point_to_polyline_distance_m(pt, blocked["points"]) <= sampled_point_threshold_m:
+                    hit_lines.add(line_idx)
+                    break
 
-    return overlap_by_segment_id
+    for line_idx in hit_lines:
+        hard_blocked = True
+        blocked_id = blocked_segments[line_idx].get("id")
+        if blocked_id is not None:
+            blocking_ids.add(blocked_id)
+    return hard_blocked, sorted(blocking_ids), overlap_by_id
 
 
-def _is_route_hard_blocked(
+def _get_blocked_overlap_by_segment(
     route_points,
     blocked_segments,
-    blocked_threshold_m=90.0,
-    sampled_point_threshold_m=100.0
+    blocked_threshold_m=70.0
 ):
-    if not route_points or len(route_points) < 2 or not blocked_segments:
-        return False
+    """
+    Returns per-blocked-segment overlapped route length in meters.
+    A route segment contributes its full length when it is close enough to a blocked segment.
+    """
+    return _analyze_route_vs_blocked(route_points, blocked_segments, overlap_threshold_m=blocked_threshold_m)[2]
 
-    # Strict discard: if any route segment comes close to a blocked segment, reject it.
-    for idx in range(len(route_points) - 1):
-        start = route_points[idx]
-        end = route_points[idx + 1]
-        for blocked in blocked_segments:
-            dist_m = _route_segment_to_polyline_distance_m(start, end, blocked["points"])
-            if dist_m <= blocked_threshold_m:
-                return True
 
-    # Additional dense-point check to catch missed overlaps.
-    sampled_points = _sample_points_on_route(route_points, step_m=25.0)
-    for pt in sampled_points:
-        for blocked in blocked_segments:
-            dist_m = _point_to_polyline_distance_m(pt, blocked["points"])
-            if dist_m <= sampled_point_threshold_m:
-                return True
-    return False
+def _is_route_hard_blocked(
+    route_points,
+    blocked_segments,
+    blocked_threshold_m=90.0,
+    sampled_point_threshold_m=100.0,
+    sampled_points=None
+):
+    return _analyze_route_vs_blocked(
+        route_points, blocked_segments, blocked_threshold_m, sampled_point_threshold_m,
+        sampled_points=sampled_points
+    )[0]
 
 
 def _get_route_blocking_segment_ids(
     route_points,
     blocked_segments,
     blocked_threshold_m=90.0,
-    sampled_point_threshold_m=100.0
+    sampled_point_threshold_m=100.0,
+    sampled_points=None
 ):
-    if not route_points or len(route_points) < 2 or not blocked_segments:
-        return []
+    return _analyze_route_vs_blocked(
+        route_points, blocked_segments, blocked_threshold_m, sampled_point_threshold_m,
+        sampled_points=sampled_points
+    )[1]
 
-    blocking_ids = set()
-    for idx in range(len(route_points) - 1):
-        start = route_points[idx]
-        end = route_points[idx + 1]
-        for blocked in blocked_segments:
-            seg_id = blocked.get("id")
-            if seg_id is None:
-                continue
-            dist_m = _route_segment_to_polyline_distance_m(start, end, blocked["points"])
-            if dist_m <= blocked_threshold_m:
-                blocking_ids.add(seg_id)
 
-    # Dense-point check by segment id.
-    sampled_points = _sample_points_on_route(route_points, step_m=25.0)
-    for pt in sampled_points:
-        for blocked in blocked_segments:
-            seg_id = blocked.get("id")
-            if seg_id is None:
-                continue
-            dist_m = _point_to_polyline_distance_m(pt, blocked["points"])
-            if dist_m <= sampled_point_threshold_m:
-                blocking_ids.add(seg_id)
+def _latlng_bbox(points):
+    """(min_lat, min_lng, max_lat, max_lng) of [lat, lng] points."""
+    if np is not None and isinstance(points, np.ndarray):
+        (min_lat, min_lng), (max_lat, max_lng) = points.min(axis=0).tolist(), points.max(axis=0).tolist()
+        return min_lat, min_lng, max_lat, max_lng
+    lats = [point[0] for point in points]
+    lngs = [point[1] for point in points]
+    return min(lats), min(lngs), max(lats), max(lngs)
+
+
+def _line_grid(lines):
+    """
+    Map each TRAFFIC_GRID_CELL_DEG cell to the indices of the lines whose bounding box
+    overlaps it. The grid for the last list is kept, keyed by list identity.
+    """
+    global _line_grid_cache
+    cached_lines, cached_grid = _line_grid_cache
+    if cached_lines is lines:
+        return cached_grid
+
+    grid = {}
+    for idx, line in enumerate(lines):
+        points = line.get("points")
+        if points is None or len(points) == 0:
+            continue
+        min_row, min_col, max_row, max_col = (
+            math.floor(v / TRAFFIC_GRID_CELL_DEG) for v in (line.get("bbox") or _latlng_bbox(points))
+        )
+        for row in range(min_row, max_row + 1):
+            for col in range(min_col, max_col + 1):
+                grid.setdefault((row, col), []).append(idx)
+    _line_grid_cache = (lines, grid)
+    return grid
+
+
+def _lines_near_route_grid(route_points, lines, margin_m):
+    """
+    _lines_near_route for many lines: sample the route every half cell, widen the cells
+    it passes through by margin_m, and keep the lines listed in those cells.
+    Lines come back in their original order so nearest-line ties resolve the same way.
+    """
+    grid = _line_grid(lines)
+    cell_m = TRAFFIC_GRID_CELL_DEG * METERS_PER_DEGREE_LAT
+    sampled = _sample_points_on_route(route_points, step_m=cell_m / 2)
+    if len(sampled) == 0:
+        sampled = [list(point) for point in route_points]
+
+    if np is not None:
+        sampled = np.asarray(sampled, dtype=np.float64)
+        route_cells = np.unique(np.floor(sampled / TRAFFIC_GRID_CELL_DEG).astype(np.int64), axis=0).tolist()
+        max_abs_lat = float(np.abs(sampled[:, 0]).max())
+    else:
+        route_cells = {
+            (math.floor(lat / TRAFFIC_GRID_CELL_DEG), math.floor(lng / TRAFFIC_GRID_CELL_DEG))
+            for lat, lng in sampled
+        }
+        max_abs_lat = max(abs(lat) for lat, _ in sampled)
+
+    # Samples sit within a quarter cell of the route; 10% slack as in the bbox check.
+    reach_m = 1.1 * margin_m + cell_m / 4
+    cos_lat = max(math.cos(math.radians(max_abs_lat + reach_m / METERS_PER_DEGREE_LAT)), 0.01)
+    row_reach = math.ceil(reach_m / cell_m)
+    col_reach = math.ceil(reach_m / (cell_m * cos_lat))
+
+    near_idx = set()
+    for row, col in route_cells:
+        for d_row in range(-row_reach, row_reach + 1):
+            for d_col in range(-col_reach, col_reach + 1):
+                near_idx.update(grid.get((row + d_row, col + d_col), ()))
+    return [lines[idx] for idx in sorted(near_idx)]
+
+
+def _lines_near_route(route_points, lines, margin_m):
+    """
+    Lines whose bounding box comes within margin_m of the route's bounding box.
+    Anything else is farther than margin_m from every route segment, so distance
+    checks can skip it. Lines without a precomputed "bbox" get one here.
+    From TRAFFIC_GRID_MIN_LINES lines on, the grid lookup narrows this further.
+    """
+    if len(lines) >= TRAFFIC_GRID_MIN_LINES and len(route_points) >= 2:
+        return _lines_near_route_grid(route_points, lines, margin_m)
+
+    min_lat, min_lng, max_lat, max_lng = _latlng_bbox(route_points)
+    # 10% slack covers the projection drift between the route and a line's latitude.
+    lat_margin = 1.1 * margin_m / METERS_PER_DEGREE_LAT
+    cos_lat = max(math.cos(math.radians(max(abs(min_lat), abs(max_lat)) + lat_margin)), 0.01)
+    lng_margin = 1.1 * margin_m / (METERS_PER_DEGREE_LAT * cos_lat)
+    near = []
+    for line in lines:
+        points = line.get("points")
+        if points is None or len(points) == 0:
+            continue
+        line_min_lat, line_min_lng, line_max_lat, line_max_lng = line.get("bbox") or _latlng_bbox(points)
+        if (
+            line_min_lat <= max_lat + lat_margin and line_max_lat >= min_lat - lat_margin
+            and line_min_lng <= max_lng + lng_margin and line_max_lng >= min_lng - lng_margin
+        ):
+            near.append(line)
+    return near
+
 
-    return sorted(list(blocking_ids))
+def _active_traffic_version():
+    # Any create, edit, (de)activation or delete of an active segment changes one of these.
+    return tuple(db.session.query(
+        func.max(TrafficSegment.updated_at),
+        func.count(TrafficSegment.id),
+        func.coalesce(func.sum(TrafficSegment.id), 0)
+    ).filter(TrafficSegment.is_active.is_(True)).one())
 
 
 def _load_active_traffic_segments():
-    rows = TrafficSegment.query.filter_by(is_active=True).all()
+    """
+    (version, parsed active traffic segments), rebuilt only when the table's version changes.
+    The returned list is shared between requests and must not be mutated.
+    """
+    global _traffic_segments_cache
+    version = _active_traffic_version()
+    cached_version, cached_segments = _traffic_segments_cache
+    if version == cached_version:
+        return cached_version, cached_segments
+
+    segments = _parse_traffic_segments(TrafficSegment.query.filter_by(is_active=True).all())
+    _traffic_segments_cache = (version, segments)
+    return version, segments
+
+
+def _parse_traffic_segments(rows):
     parsed = []
     for row in rows:
         try:
@@ -599,19 +1299,102 @@ def _load_active_traffic_segments():
             latlng = [[c[1], c[0]] for c in coords if isinstance(c, list) and len(c) == 2]
             if len(latlng) < 2:
                 continue
+            jam_level = (row.jam_level or "MEDIUM").strip().upper()
+            jam_level = "HIGH" if jam_level == "BLOCKED" else jam_level
             parsed.append({
                 "id": row.id,
-                "jam_level": (
-                    "HIGH" if (row.jam_level or "MEDIUM").strip().upper() == "BLOCKED"
-                    else (row.jam_level or "MEDIUM").strip().upper()
-                ),
-                "points": latlng
+                "jam_level": jam_level,
+                "level_idx": JAM_LEVEL_INDEX.get(jam_level, -1),
+                "points": latlng,
+                # Parsed once here so every route scored against it skips the conversion.
+                "points_array": np.asarray(latlng, dtype=np.float64) if np is not None else None,
+                "bbox": _latlng_bbox(latlng)
             })
         except Exception:
             continue
     return parsed
 
 
+def _traffic_distance_matrix(route, traffic_segments):
+    """
+    Distances from every segment of route (a [lat, lng] array) to every traffic line,
+    all projected around the route's mid latitude. Rows are traffic lines, columns
+    are route segments.
+    """
+    lat0 = _route_projection_lat(route)
+    route_xy = _project_latlng(route, lat0)
+    return np.vstack([
+        _route_to_polyline_distances_m(
+            route_xy,
+            _project_latlng(
+                traffic["points"] if traffic.get("points_array") is None else traffic["points_array"],
+                lat0
+            )
+        )
+        for traffic in traffic_segments
+    ])
+
+
+def _traffic_level_indices(traffic_segments):
+    """JAM_LEVELS index of each traffic line (-1 for unknown levels) as an array."""
+    return np.array([
+        traffic["level_idx"] if "level_idx" in traffic else JAM_LEVEL_INDEX.get(traffic["jam_level"], -1)
+        for traffic in traffic_segments
+    ], dtype=np.int64)
+
+
+def _traffic_result(blocked, penalty_seconds, hit_counts, overlap_m):
+    """evaluate_route_traffic_penalty's dict shape from per-level index sequences."""
+    return {
+        "blocked": blocked,
+        "penalty_seconds": penalty_seconds,
+        "jam_hit_counts": {level: int(hit_counts[idx]) for idx, level in enumerate(JAM_LEVELS)},
+        "jam_overlap_m": {level: float(overlap_m[idx]) for idx, level in enumerate(JAM_LEVELS)}
+    }
+
+
+def _score_route_traffic_vec(
+    distances,
+    level_idx,
+    segment_lengths_m,
+    proximity_threshold_m,
+    blocked_threshold_m
+):
+    """
+    NumPy form of the evaluate_route_traffic_penalty scan with the same rules:
+    each route segment takes the level of the nearest traffic line within the
+    proximity threshold (first line wins ties), and the first segment near a
+    BLOCKED line counts as blocked and ends the scan.
+    distances comes from _traffic_distance_matrix, level_idx from
+    _traffic_level_indices; segment_lengths_m is an array.
+    """
+    blocked_at = None
+    blocked_rows = level_idx == BLOCKED_LEVEL_INDEX
+    if blocked_rows.any():
+        blocked_hits = (distances[blocked_rows] <= blocked_threshold_m).any(axis=0)
+        if blocked_hits.any():
+            blocked_at = int(np.argmax(blocked_hits))
+
+    scanned = distances[:, :blocked_at]
+    near = np.where(scanned <= proximity_threshold_m, scanned, np.inf)
+    hit_segments = np.flatnonzero(np.isfinite(near.min(axis=0)))
+    hit_levels = level_idx[near.argmin(axis=0)[hit_segments]]
+    known = hit_levels >= 0
+    hit_levels = hit_levels[known]
+    hit_lengths = segment_lengths_m[hit_segments[known]]
+
+    hit_counts = np.bincount(hit_levels, minlength=len(JAM_LEVELS))
+    # bincount returns ints when there is nothing to weight, so pin the dtype
+    overlap_m = np.bincount(hit_levels, weights=hit_lengths, minlength=len(JAM_LEVELS)).astype(np.float64)
+    penalty_seconds = float(np.dot(overlap_m, JAM_SEC_PER_METER_BY_INDEX))
+
+    if blocked_at is not None:
+        hit_counts[BLOCKED_LEVEL_INDEX] += 1
+        overlap_m[BLOCKED_LEVEL_INDEX] += segment_lengths_m[blocked_at]
+
+    return _traffic_result(blocked_at is not None, penalty_seconds, hit_counts, overlap_m)
+
+
 def evaluate_route_traffic_penalty(
     route_points,
     traffic_segments,
@@ -622,44 +1405,59 @@ def evaluate_route_traffic_penalty(
     Estimate route penalty in seconds by checking route segment midpoints against
     manually drawn traffic segments.
     """
-    if not route_points or len(route_points) < 2 or not traffic_segments:
+    if route_points is None or len(route_points) < 2 or not traffic_segments:
         return {
             "blocked": False,
             "penalty_seconds": 0.0,
             "jam_hit_counts": {"LOW": 0, "MEDIUM": 0, "HIGH": 0, "BLOCKED": 0}
         }
 
-    # Extra delay per meter near each jam type.
-    # Example: HIGH => 0.35 sec/m (~350 sec / km additional delay).
-    jam_sec_per_meter = {
-        "LOW": 0.06,
-        "MEDIUM": 0.16,
-        "HIGH": 0.35,
-        "BLOCKED": 0.0
-    }
+    # Lines too far from the route to reach either threshold cannot change the result.
+    traffic_segments = _lines_near_route(
+        route_points, traffic_segments, max(proximity_threshold_m, blocked_threshold_m)
+    )
+    if not traffic_segments:
+        return {
+            "blocked": False,
+            "penalty_seconds": 0.0,
+            "jam_hit_counts": {"LOW": 0, "MEDIUM": 0, "HIGH": 0, "BLOCKED": 0},
+            "jam_overlap_m": {"LOW": 0.0, "MEDIUM": 0.0, "HIGH": 0.0, "BLOCKED": 0.0}
+        }
+
+    if np is not None:
+        route = np.asarray(route_points, dtype=np.float64)
+        return _score_route_traffic_vec(
+            _traffic_distance_matrix(route, traffic_segments),
+            _traffic_level_indices(traffic_segments),
+            _route_segment_lengths_m(route),
+            proximity_threshold_m,
+            blocked_threshold_m
+        )
 
     penalty_seconds = 0.0
     blocked = False
-    jam_hit_counts = {"LOW": 0, "MEDIUM": 0, "HIGH": 0, "BLOCKED": 0}
-    jam_overlap_m = {"LOW": 0.0, "MEDIUM": 0.0, "HIGH": 0.0, "BLOCKED": 0.0}
+    hit_counts = [0] * len(JAM_LEVELS)
+    overlap_m = [0.0] * len(JAM_LEVELS)
+    level_idx = [
+        traffic["level_idx"] if "level_idx" in traffic else JAM_LEVEL_INDEX.get(traffic["jam_level"], -1)
+        for traffic in traffic_segments
+    ]
 
     for idx in range(len(route_points) - 1):
         start = route_points[idx]
         end = route_points[idx + 1]
         segment_length_m = haversine_m(start[0], start[1], end[0], end[1])
 
-        closest_level_for_segment = None
+        closest_level_for_segment = -1
         closest_level_distance_m = float("inf")
-        for traffic in traffic_segments:
+        for traffic, level in zip(traffic_segments, level_idx):
             dist_m = _route_segment_to_polyline_distance_m(start, end, traffic["points"])
-            level = traffic["jam_level"]
 
             # Blocked is strict: if route segment comes near blocked segment, reject route.
-            if level == "BLOCKED" and dist_m <= blocked_threshold_m:
-                jam_hit_counts["BLOCKED"] += 1
-                jam_overlap_m["BLOCKED"] += segment_length_m
+            if level == BLOCKED_LEVEL_INDEX and dist_m <= blocked_threshold_m:
+                hit_counts[BLOCKED_LEVEL_INDEX] += 1
+                overlap_m[BLOCKED_LEVEL_INDEX] += segment_length_m
                 blocked = True
-                closest_level_for_segment = "BLOCKED"
                 break
 
             if dist_m <= proximity_threshold_m:
@@ -671,19 +1469,79 @@ def evaluate_route_traffic_penalty(
         if blocked:
             break
 
-        if closest_level_for_segment in jam_sec_per_meter:
-            if closest_level_for_segment in jam_hit_counts:
-                jam_hit_counts[closest_level_for_segment] += 1
-            if closest_level_for_segment in jam_overlap_m:
-                jam_overlap_m[closest_level_for_segment] += segment_length_m
-            penalty_seconds += segment_length_m * jam_sec_per_meter[closest_level_for_segment]
+        if closest_level_for_segment >= 0:
+            hit_counts[closest_level_for_segment] += 1
+            overlap_m[closest_level_for_segment] += segment_length_m
+            penalty_seconds += segment_length_m * JAM_SEC_PER_METER_BY_INDEX[closest_level_for_segment]
 
-    return {
-        "blocked": blocked,
-        "penalty_seconds": penalty_seconds,
-        "jam_hit_counts": jam_hit_counts,
-        "jam_overlap_m": jam_overlap_m
-    }
+    return _traffic_result(blocked, penalty_seconds, hit_counts, overlap_m)
+
+
+def evaluate_routes_traffic_penalty(
+    routes_points,
+    traffic_segments,
+    proximity_threshold_m=75.0,
+    blocked_threshold_m=120.0
+):
+    """
+    evaluate_route_traffic_penalty for every candidate route of one dispatch.
+    With NumPy the candidates are concatenated, up to TRAFFIC_BATCH_MAX_POINTS points
+    per batch, so each traffic line costs one distance-kernel call per batch instead
+    of one per route. A batch shares one projection origin (its mid latitude).
+    """
+    if np is None or not traffic_segments:
+        return [
+            evaluate_route_traffic_penalty(points, traffic_segments, proximity_threshold_m, blocked_threshold_m)
+            for points in routes_points
+        ]
+
+    results = [None] * len(routes_points)
+    batches = [[]]
+    batch_points = 0
+    for idx, points in enumerate(routes_points):
+        if points is None or len(points) < 2:
+            results[idx] = evaluate_route_traffic_penalty(
+                points, traffic_segments, proximity_threshold_m, blocked_threshold_m
+            )
+            continue
+        if batches[-1] and batch_points + len(points) > TRAFFIC_BATCH_MAX_POINTS:
+            batches.append([])
+            batch_points = 0
+        batches[-1].append(idx)
+        batch_points += len(points)
+
+    for batch in batches:
+        if not batch:
+            continue
+        routes = [np.asarray(routes_points[idx], dtype=np.float64) for idx in batch]
+        stacked = np.concatenate(routes)
+        lines = _lines_near_route(stacked, traffic_segments, max(proximity_threshold_m, blocked_threshold_m))
+        if not lines:
+            for idx in batch:
+                results[idx] = {
+                    "blocked": False,
+                    "penalty_seconds": 0.0,
+                    "jam_hit_counts": {"LOW": 0, "MEDIUM": 0, "HIGH": 0, "BLOCKED": 0},
+                    "jam_overlap_m": {"LOW": 0.0, "MEDIUM": 0.0, "HIGH": 0.0, "BLOCKED": 0.0}
+                }
+            continue
+
+        # Columns joining one route's last point to the next route's first are skipped.
+        distances = _traffic_distance_matrix(stacked, lines)
+        segment_lengths_m = _route_segment_lengths_m(stacked)
+        level_idx = _traffic_level_indices(lines)
+        start = 0
+        for idx, route in zip(batch, routes):
+            end = start + len(route) - 1
+            results[idx] = _score_route_traffic_vec(
+                distances[:, start:end],
+                level_idx,
+                segment_lengths_m[start:end],
+                proximity_threshold_m,
+                blocked_threshold_m
+            )
+            start = end + 1
+    return results
 
 
 def route_jam_severity_rank(jam_hit_counts, jam_overlap_m=None):
@@ -721,6 +1579,31 @@ def route_jam_severity_rank(jam_hit_counts, jam_overlap_m=None):
     return 1
 
 
+def route_combined_costs(durations, congestion_scores, traffic_weight=0.55, duration_weight=0.45):
+    """
+    Weighted sum of min-max normalized congestion and duration per candidate.
+    A column with no spread normalizes to 0. Lower is better.
+    """
+    if np is not None:
+        columns = np.array([congestion_scores, durations], dtype=np.float64)
+        lo = columns.min(axis=1, keepdims=True)
+        span = columns.max(axis=1, keepdims=True) - lo
+        # Where span is 0 every value equals lo, so dividing by 1 gives the 0 norm.
+        norms = (columns - lo) / np.where(span > 0, span, 1.0)
+        return (traffic_weight * norms[0] + duration_weight * norms[1]).tolist()
+
+    def norm(values):
+        lo, hi = min(values), max(values)
+        if hi <= lo:
+            return [0.0] * len(values)
+        return [(value - lo) / (hi - lo) for value in values]
+
+    return [
+        (traffic_weight * cong_norm) + (duration_weight * dur_norm)
+        for cong_norm, dur_norm in zip(norm(congestion_scores), norm(durations))
+    ]
+
+
 def route_congestion_score(jam_overlap_m=None):
     """
     Convert overlap meters into a normalized congestion score.
@@ -761,9 +1644,27 @@ def add_unit():
 
     db.session.add(unit)
     db.session.commit()
+    _invalidate_listing_cache()
 
     return jsonify({"message": "Unit added", "unit_id": unit.unit_id})
 
+def _send_dispatch_side_effects(broadcasts, sms_request):
+    """
+    Emit the dispatch broadcasts, then send the reporter tracking SMS.
+    Runs as a Socket.IO background task after the dispatch is committed.
+    """
+    for event, payload, room in broadcasts:
+        socketio.emit(event, payload, room=room)
+
+    if not sms_request:
+        return
+    try:
+        sms_sent, sms_message = SMSService().send_assigned_tracking_message(**sms_request)
+    except Exception as e:
+        sms_sent, sms_message = False, str(e)
+    status = "sent" if sms_sent else "not sent"
+    print(f"📱 Tracking SMS for Emergency #{sms_request['request_id']} {status}: {sms_message}")
+
 # -------------------------
 # Dispatch emergency (nearest available unit)
 # -------------------------
@@ -771,7 +1672,7 @@ def add_unit():
 @authority_required()
 def dispatch_emergency(emergency_id):
     _ensure_public_tracking_links_table()
-    emergency = Emergency.query.get(emergency_id)
+    emergency = db.session.get(Emergency, emergency_id, options=[joinedload(Emergency.reporter_contact)])
 
     if not emergency:
         return jsonify({"error": "Emergency not found"}), 404
@@ -779,68 +1680,101 @@ def dispatch_emergency(emergency_id):
     if emergency.status != "PENDING" and emergency.status != "APPROVED":
         return jsonify({"error": f"Emergency already {emergency.status}"}), 400
 
-    # Get available units of same service type
+    # Read now: the commits below expire loaded attributes, which would re-query the contact.
+    reporter_phone = emergency.reporter_contact.reporter_phone if emergency.reporter_contact else None
+
+    # Get available units of same service type near the emergency
     # Note: emergency.emergency_type should now be in uppercase format
-    units = Unit.query.filter_by(
-        service_type=emergency.emergency_type,
-        status="AVAILABLE"
-    ).all()
+    units = _query_dispatch_units(emergency.emergency_type, emergency.latitude, emergency.longitude)
+    if not units:
+        # Rare path: load every available unit so the error reports the nearest distance.
+        units = Unit.query.filter_by(
+            service_type=emergency.emergency_type,
+            status="AVAILABLE"
+        ).all()
     
     print(f"🚨 Dispatch attempt for Emergency #{emergency.request_id} (Type: {emergency.emergency_type}) - Found {len(units)} available units")
 
     if not units:
         return jsonify({"error": "No available units"}), 404
 
+    # Straight-line distance never exceeds road distance, so units beyond the cap
+    # cannot qualify and are dropped before any OSRM call. Nearest go first.
+    units = [u for u in units if u.latitude is not None and u.longitude is not None]
+    straight_line_m = haversine_m_vec(
+        emergency.latitude,
+        emergency.longitude,
+        [u.latitude for u in units],
+        [u.longitude for u in units],
+    )
+    nearby = sorted(
+        (float(d), idx) for idx, d in enumerate(straight_line_m) if d <= MAX_DISTANCE_METERS
+    )
+    if not nearby:
+        return jsonify({
+            "error": "No available units within 50 km",
+            "nearest_distance_m": float(min(straight_line_m)) if units else None
+        }), 400
+    units = [units[idx] for _, idx in nearby]
+
     # Load active manual traffic simulation lines.
-    traffic_segments = _load_active_traffic_segments()
+    traffic_version, traffic_segments = _load_active_traffic_segments()
     # BLOCKED level removed: treat any legacy BLOCKED entries as HIGH during load.
     blocked_segments = []
+    # The candidate and rescue passes check the same geometries with the same thresholds,
+    # so each route is decoded and analyzed against the blocked lines only once.
+    decoded_by_geometry = {}
+    blocking_ids_by_geometry = {}
+
+    def decoded_route(geometry):
+        if geometry not in decoded_by_geometry:
+            decoded_by_geometry[geometry] = decode_polyline(geometry)
+        return decoded_by_geometry[geometry]
+
+    def blocking_ids_for(geometry, points):
+        if geometry not in blocking_ids_by_geometry:
+            blocking_ids_by_geometry[geometry] = _analyze_route_vs_blocked(
+                points,
+                blocked_segments,
+                blocked_threshold_m=90.0,
+                sampled_point_threshold_m=100.0
+            )[1]
+        return blocking_ids_by_geometry[geometry]
 
     # Step 1: Always pick the nearest available unit (within 50km cap).
     # Step 2: Optimize route alternatives for that selected nearest unit.
     unit_candidates = []
     nearest_raw_distance = None
 
-    for u in units:
-        try:
-            # Keep nearest-unit selection fast and stable.
-            # Use single distance/duration lookup per unit here.
-            dist, dur = osrm_route_distance_duration(
-                u.latitude,
-                u.longitude,
-                emergency.latitude,
-                emergency.longitude,
-            )
-            if dist is None:
-                continue
-
-            if nearest_raw_distance is None or dist < nearest_raw_distance:
-                nearest_raw_distance = dist
+    # One OSRM table request covers every unit; per-unit routing is the fallback and may
+    # stop early, so route_results can be shorter than units (zip below truncates).
+    unit_coords = [(u.latitude, u.longitude) for u in units]
+    try:
+        route_results = osrm_table_distances(unit_coords, emergency.latitude, emergency.longitude)
+    except Exception as e:
+        print(f"⚠️ OSRM table lookup failed, routing units one by one: {e}")
+        route_results = osrm_route_distances_nearest_first(
+            unit_coords,
+            [straight_m for straight_m, _ in nearby],
+            emergency.latitude,
+            emergency.longitude,
+        )
 
-            if dist <= MAX_DISTANCE_METERS:
-                unit_candidates.append({
-                    "unit": u,
-                    "distance": dist,
-                    "duration": dur
-                })
-        except Exception:
-            # OSRM failed for this candidate, use haversine fallback.
-            euclid = distance(
-                emergency.latitude,
-                emergency.longitude,
-                u.latitude,
-                u.longitude,
-            )
+    for u, (straight_m, _), (dist, dur) in zip(units, nearby, route_results):
+        if dist is None:
+            # OSRM failed for this candidate, use the haversine distance computed above.
+            dist = straight_m
+            dur = None
 
-            if nearest_raw_distance is None or euclid < nearest_raw_distance:
-                nearest_raw_distance = euclid
+        if nearest_raw_distance is None or dist < nearest_raw_distance:
+            nearest_raw_distance = dist
 
-            if euclid <= MAX_DISTANCE_METERS:
-                unit_candidates.append({
-                    "unit": u,
-                    "distance": euclid,
-                    "duration": None
-                })
+        if dist <= MAX_DISTANCE_METERS:
+            unit_candidates.append({
+                "unit": u,
+                "distance": dist,
+                "duration": dur
+            })
 
     if not unit_candidates:
         return jsonify({
@@ -877,6 +1811,8 @@ def dispatch_emergency(emergency_id):
         blocking_segment_ids_all = set()
         checked_route_count = 0
         blocked_route_count = 0
+        routes_to_score = []
+        traffic_eval_by_geometry = {}
 
         for route in alt_routes:
             checked_route_count += 1
@@ -891,21 +1827,40 @@ def dispatch_emergency(emergency_id):
             if fallback_shortest is None or dur < fallback_shortest["duration"]:
                 fallback_shortest = {"distance": dist, "duration": dur, "geometry": geometry}
 
-            decoded_points = polyline.decode(geometry)
+            try:
+                decoded_points = decoded_route(geometry)
+            except ValueError:
+                # One malformed alternate should not fail the whole dispatch.
+                continue
 
             # Hard block exclusion: never allow blocked-simulation overlap.
-            route_blocking_ids = _get_route_blocking_segment_ids(
-                decoded_points,
-                blocked_segments,
-                blocked_threshold_m=90.0,
-                sampled_point_threshold_m=100.0
-            )
+            route_blocking_ids = blocking_ids_for(geometry, decoded_points)
             if route_blocking_ids:
                 blocking_segment_ids_all.update(route_blocking_ids)
                 blocked_route_count += 1
                 continue
 
-            traffic_eval = evaluate_route_traffic_penalty(decoded_points, traffic_segments)
+            routes_to_score.append((dist, dur, geometry, decoded_points))
+
+        # Routes scored by an earlier dispatch against the same traffic version are reused;
+        # the rest are traffic-scored in one batched pass. Cached results are read-only.
+        with _traffic_eval_cache_lock:
+            for _, _, geometry, _ in routes_to_score:
+                cached_eval = _traffic_eval_cache.get((traffic_version, geometry))
+                if cached_eval is not None:
+                    traffic_eval_by_geometry[geometry] = cached_eval
+        unscored = [route for route in routes_to_score if route[2] not in traffic_eval_by_geometry]
+        if unscored:
+            new_evals = evaluate_routes_traffic_penalty(
+                [decoded_points for _, _, _, decoded_points in unscored],
+                traffic_segments
+            )
+            with _traffic_eval_cache_lock:
+                for (_, _, geometry, _), traffic_eval in zip(unscored, new_evals):
+                    traffic_eval_by_geometry[geometry] = _traffic_eval_cache[(traffic_version, geometry)] = traffic_eval
+
+        for dist, dur, geometry, decoded_points in routes_to_score:
+            traffic_eval = traffic_eval_by_geometry[geometry]
             if traffic_eval["blocked"]:
                 continue
 
@@ -926,7 +1881,8 @@ def dispatch_emergency(emergency_id):
                 "traffic_score": traffic_score,
                 "jam_rank": jam_rank,
                 "jam_hit_counts": traffic_eval["jam_hit_counts"],
-                "jam_overlap_m": traffic_eval.get("jam_overlap_m", {})
+                "jam_overlap_m": traffic_eval.get("jam_overlap_m", {}),
+                "congestion_score": route_congestion_score(traffic_eval.get("jam_overlap_m"))
             }
 
             non_blocked_candidates.append(candidate_route)
@@ -937,68 +1893,32 @@ def dispatch_emergency(emergency_id):
             min_rank = min(c.get("jam_rank", 3) for c in non_blocked_candidates)
             ranked_candidates = [c for c in non_blocked_candidates if c.get("jam_rank", 3) == min_rank]
 
-            durations = [c["duration"] for c in non_blocked_candidates]
-            congestion_scores = [route_congestion_score(c.get("jam_overlap_m")) for c in non_blocked_candidates]
-            ranked_durations = [c["duration"] for c in ranked_candidates]
-            ranked_congestion_scores = [route_congestion_score(c.get("jam_overlap_m")) for c in ranked_candidates]
-
-            min_dur, max_dur = min(durations), max(durations)
-            min_cong, max_cong = min(congestion_scores), max(congestion_scores)
-            min_rank_dur, max_rank_dur = min(ranked_durations), max(ranked_durations)
-            min_rank_cong, max_rank_cong = min(ranked_congestion_scores), max(ranked_congestion_scores)
-
-            traffic_weight = 0.55
-            duration_weight = 0.45
-
-            def norm(value, lo, hi):
-                if hi <= lo:
-                    return 0.0
-                return (value - lo) / (hi - lo)
-
-            for idx, candidate in enumerate(ranked_candidates):
-                dur_norm = norm(candidate["duration"], min_rank_dur, max_rank_dur)
-                cong = ranked_congestion_scores[idx]
-                cong_norm = norm(cong, min_rank_cong, max_rank_cong)
-                candidate["combined_cost"] = (traffic_weight * cong_norm) + (duration_weight * dur_norm)
-                candidate["congestion_score"] = cong
-
-            # Final selection from ranked candidates by combined cost.
-            ordered_candidates = sorted(
+            combined_costs = route_combined_costs(
+                [c["duration"] for c in ranked_candidates],
+                [c["congestion_score"] for c in ranked_candidates]
+            )
+            for candidate, combined_cost in zip(ranked_candidates, combined_costs):
+                candidate["combined_cost"] = combined_cost
+
+            # Final selection from ranked candidates by combined cost. Every candidate here
+            # already passed the blocked-line check above, so it is not repeated.
+            selected = min(
                 ranked_candidates,
                 key=lambda c: (c["combined_cost"], c["traffic_score"])
             )
-            selected = None
-            for candidate in ordered_candidates:
-                candidate_blocking_ids = _get_route_blocking_segment_ids(
-                    candidate.get("polyline_points") or [],
-                    blocked_segments,
-                    blocked_threshold_m=90.0,
-                    sampled_point_threshold_m=100.0
-                )
-                if candidate_blocking_ids:
-                    blocking_segment_ids_all.update(candidate_blocking_ids)
-                    blocked_route_count += 1
-                    continue
-                selected = candidate
-                break
-            if selected is None:
-                # All class-ranked candidates still intersect blocked paths.
-                # Fall through to blocked handling below.
-                non_blocked_candidates = []
 
             # Preference tweak:
             # If the shortest candidate is LOW/default traffic and near-optimal by combined cost,
             # select it to keep responses naturally fast in low-jam conditions.
-            if selected is not None:
-                shortest_candidate = min(non_blocked_candidates, key=lambda c: c["duration"])
-                if shortest_candidate.get("jam_rank", 3) <= 1:
-                    selected_cost = selected.get("combined_cost", 1.0)
-                    shortest_cost = shortest_candidate.get("combined_cost", 1.0)
-                    # within 8% cost gap, prefer shortest low-traffic route
-                    if shortest_cost <= (selected_cost + 0.08):
-                        selected = shortest_candidate
-
-                best.update(selected)
+            shortest_candidate = min(non_blocked_candidates, key=lambda c: c["duration"])
+            if shortest_candidate.get("jam_rank", 3) <= 1:
+                selected_cost = selected.get("combined_cost", 1.0)
+                shortest_cost = shortest_candidate.get("combined_cost", 1.0)
+                # within 8% cost gap, prefer shortest low-traffic route
+                if shortest_cost <= (selected_cost + 0.08):
+                    selected = shortest_candidate
+
+            best.update(selected)
         elif fallback_shortest is not None:
             # Rescue pass:
             # Re-check all alternatives with tighter blocked thresholds to identify
@@ -1012,16 +1932,16 @@ def dispatch_emergency(emergency_id):
                     continue
                 if dist > MAX_DISTANCE_METERS:
                     continue
-                decoded_points = polyline.decode(geometry)
-                rescue_block_ids = _get_route_blocking_segment_ids(
-                    decoded_points,
-                    blocked_segments,
-                    blocked_threshold_m=90.0,
-                    sampled_point_threshold_m=100.0
-                )
+                try:
+                    decoded_points = decoded_route(geometry)
+                except ValueError:
+                    continue
+                rescue_block_ids = blocking_ids_for(geometry, decoded_points)
                 if rescue_block_ids:
                     continue
-                traffic_eval = evaluate_route_traffic_penalty(decoded_points, traffic_segments)
+                traffic_eval = traffic_eval_by_geometry.get(geometry)
+                if traffic_eval is None:
+                    traffic_eval = evaluate_route_traffic_penalty(decoded_points, traffic_segments)
                 jam_rank = route_jam_severity_rank(
                     traffic_eval.get("jam_hit_counts", {}),
                     traffic_eval.get("jam_overlap_m")
@@ -1063,23 +1983,26 @@ def dispatch_emergency(emergency_id):
     full_duration = best.get("duration")
     waypoints_json = None
     polyline_positions = None
+    route_positions = None
     waypoint_count = 0
 
     if route_geometry:
         try:
-            waypoints = polyline.decode(route_geometry)
-            if len(waypoints) > 245:
-                step = len(waypoints) / 245
-                waypoints = [waypoints[int(i * step)] for i in range(245)]
-            waypoints_json = json.dumps([[lat, lng] for lat, lng in waypoints])
-            polyline_positions = json.dumps(waypoints)
+            # Candidates carry their decoded points, so the selected route is not decoded again.
+            waypoints, waypoints_json = waypoints_to_json(
+                best.get("polyline_points") or decode_polyline(route_geometry)
+            )
+            # One encode serves both columns; they hold the same [lat, lng] array.
+            polyline_positions = waypoints_json
+            route_positions = waypoints
             waypoint_count = len(waypoints)
         except Exception as e:
             print(f"⚠️ Failed to decode selected route geometry for Emergency #{emergency.request_id}: {e}")
 
     # 🔧 CRITICAL: Ensure fresh route progress for new emergency dispatch
-    # Clear any existing route calculations for this unit (from previous emergencies)
-    RouteCalculation.deactivate_routes_for_unit(nearest_unit.unit_id)
+    # Clear any existing route calculations for this unit (from previous emergencies);
+    # the deactivation commits with the dispatch below.
+    RouteCalculation.deactivate_routes_for_unit(nearest_unit.unit_id, commit=False)
     
     # Update statuses
     nearest_unit.status = "DISPATCHED"
@@ -1093,7 +2016,7 @@ def dispatch_emergency(emergency_id):
     route_calc = RouteCalculation(
         unit_id=nearest_unit.unit_id,
         emergency_id=emergency.request_id,
-        osrm_response=json.dumps({
+        osrm_response=dumps_compact({
             "full_route_distance": full_distance,
             "full_route_duration": full_duration,
             "original_distance": best["distance"],
@@ -1117,17 +2040,15 @@ def dispatch_emergency(emergency_id):
     )
     
     db.session.add(route_calc)
-    db.session.commit()
 
     # Reporter SMS: generate/store tracking link only if reporter phone exists.
-    sms_sent = False
+    sms_request = None
     sms_message = "No reporter phone for this emergency"
     tracking_token = None
     tracking_url = None
-    reporter_contact = EmergencyReporterContact.query.filter_by(emergency_id=emergency.request_id).first()
-    if reporter_contact and reporter_contact.reporter_phone:
+    if reporter_phone:
         tracking_token = _build_tracking_token(emergency.request_id)
-        tracking_url = f"{_normalized_frontend_base_url()}/track/{tracking_token}"
+        tracking_url = f"{FRONTEND_BASE_URL}/track/{tracking_token}"
         tracking_link = PublicTrackingLink.query.filter_by(tracking_token=tracking_token).first()
         if tracking_link:
             tracking_link.emergency_id = emergency.request_id
@@ -1141,18 +2062,22 @@ def dispatch_emergency(emergency_id):
                 tracking_url=tracking_url,
                 is_active=True
             ))
-        db.session.commit()
 
+    # Route deactivation, unit and emergency status, route calculation and tracking link commit together.
+    db.session.commit()
+    _invalidate_listing_cache()
+
+    if reporter_phone:
         driver = _resolve_unit_driver(nearest_unit.unit_id)
-        sms_service = SMSService()
-        sms_sent, sms_message = sms_service.send_assigned_tracking_message(
-            to_phone=reporter_contact.reporter_phone,
-            request_id=emergency.request_id,
-            tracking_url=tracking_url,
-            unit_plate=nearest_unit.unit_vehicle_number,
-            driver_name=driver.get("name") if driver else None,
-            driver_phone=driver.get("phone") if driver else None
-        )
+        sms_request = {
+            "to_phone": reporter_phone,
+            "request_id": emergency.request_id,
+            "tracking_url": tracking_url,
+            "unit_plate": nearest_unit.unit_vehicle_number,
+            "driver_name": driver.get("name") if driver else None,
+            "driver_phone": driver.get("phone") if driver else None
+        }
+        sms_message = "Tracking SMS queued for delivery"
 
     # Send notifications
     create_emergency_notification(emergency, 'assigned')
@@ -1169,7 +2094,7 @@ def dispatch_emergency(emergency_id):
         'assigned_unit': emergency.assigned_unit,
         'created_at': emergency.created_at.isoformat() if emergency.created_at else None,
         # Phase 1: Include cached route positions for polyline
-        'route_positions': json.loads(polyline_positions) if polyline_positions else None,
+        'route_positions': route_positions,
         'waypoint_count': waypoint_count,
         'route_calculation_id': route_calc.id
     }
@@ -1183,64 +2108,48 @@ def dispatch_emergency(emergency_id):
         'emergency_id': emergency.request_id
     }
     
-    # Broadcast emergency update to all clients
-    socketio.emit('emergency_updated', {
-        'action': 'assigned',
-        'emergency': emergency_data,
-        'unit': unit_data,
-        'route_info': {
-            'positions': emergency_data['route_positions'],
-            'waypoint_count': waypoint_count,
-            'distance': full_distance,
-            'duration': full_duration
-        },
-        'route_progress_reset': {
-            'unit_id': nearest_unit.unit_id,
-            'emergency_id': emergency.request_id,
-            'reset_reason': 'new_emergency_dispatch',
-            'fresh_start': True,
-            'timestamp': datetime.utcnow().isoformat()
-        }
-    })
-    
-    # Broadcast to unit tracking room
-    socketio.emit('emergency_update', {
+    # Payload parts shared by all three dispatch broadcasts
+    route_info = {
+        'positions': route_positions,
+        'waypoint_count': waypoint_count,
+        'distance': full_distance,
+        'duration': full_duration
+    }
+    route_progress_reset = {
+        'unit_id': nearest_unit.unit_id,
+        'emergency_id': emergency.request_id,
+        'reset_reason': 'new_emergency_dispatch',
+        'fresh_start': True,
+        'timestamp': datetime.utcnow().isoformat()
+    }
+    assigned_payload = {
         'action': 'assigned',
         'emergency': emergency_data,
         'unit': unit_data,
-        'route_info': {
-            'positions': emergency_data['route_positions'],
-            'waypoint_count': waypoint_count,
-            'distance': full_distance,
-            'duration': full_duration
-        },
-        'route_progress_reset': {
-            'unit_id': nearest_unit.unit_id,
-            'emergency_id': emergency.request_id,
-            'reset_reason': 'new_emergency_dispatch',
-            'fresh_start': True,
-            'timestamp': datetime.utcnow().isoformat()
-        }
-    }, room='unit_tracking')
-    
-    # Update unit status
-    socketio.emit('unit_status_update', {
-        'unit_id': nearest_unit.unit_id,
-        'status': 'DISPATCHED',
-        'emergency_id': emergency.request_id,
-        'assigned_emergency': emergency_data,
-        'route_info': {
-            'positions': emergency_data['route_positions'],
-            'waypoint_count': waypoint_count
-        },
-        'route_progress_reset': {
+        'route_info': route_info,
+        'route_progress_reset': route_progress_reset
+    }
+
+    broadcasts = [
+        # Broadcast emergency update to all clients
+        ('emergency_updated', assigned_payload, None),
+        # Broadcast to unit tracking room
+        ('emergency_update', assigned_payload, 'unit_tracking'),
+        # Update unit status
+        ('unit_status_update', {
             'unit_id': nearest_unit.unit_id,
+            'status': 'DISPATCHED',
             'emergency_id': emergency.request_id,
-            'reset_reason': 'new_emergency_dispatch',
-            'fresh_start': True,
-            'timestamp': datetime.utcnow().isoformat()
-        }
-    })
+            'assigned_emergency': emergency_data,
+            'route_info': {
+                'positions': route_positions,
+                'waypoint_count': waypoint_count
+            },
+            'route_progress_reset': route_progress_reset
+        }, None)
+    ]
+    # Everything is committed; broadcasts and the reporter SMS don't hold up the response.
+    socketio.start_background_task(_send_dispatch_side_effects, broadcasts, sms_request)
     
     print(f"🔄 Fresh dispatch: Emergency #{emergency.request_id} dispatched to Unit {nearest_unit.unit_id} with {waypoint_count} cached waypoints - route progress reset to 0%")
 
@@ -1251,12 +2160,12 @@ def dispatch_emergency(emergency_id):
         "distance_m": full_distance,
         "eta_s": full_duration,
         "waypoint_count": waypoint_count,
-        "route_positions": emergency_data['route_positions'],
+        "route_positions": route_positions,
         "route_calculation_id": route_calc.id,
         "routing_source": "osrm_full_geometry" if waypoint_count > 0 else "euclidean_fallback",
         "public_tracking_token": tracking_token,
         "public_tracking_url": tracking_url,
-        "reporter_sms_sent": sms_sent,
+        "reporter_sms_sent": False,
         "reporter_sms_message": sms_message
     })
 
@@ -1266,20 +2175,21 @@ def dispatch_emergency(emergency_id):
 @authority_bp.route("/authority/complete/<int:emergency_id>", methods=["POST"])
 @authority_required()
 def complete_emergency(emergency_id):
-    emergency = Emergency.query.get(emergency_id)
+    emergency = db.session.get(Emergency, emergency_id)
     if not emergency:
         return jsonify({"error": "Emergency not found"}), 404
     if emergency.status != "ASSIGNED":
         return jsonify({"error": "Emergency not assigned yet"}), 400
 
     # Release unit
-    unit = Unit.query.get(emergency.assigned_unit)
+    unit = db.session.get(Unit, emergency.assigned_unit)
     if unit:
         unit.status = "AVAILABLE"
         unit.last_updated = datetime.utcnow()
 
     emergency.status = "COMPLETED"
     db.session.commit()
+    _invalidate_listing_cache()
 
     # Send notifications
     create_emergency_notification(emergency, 'completed')
@@ -1309,31 +2219,26 @@ def complete_emergency(emergency_id):
         'longitude': unit.longitude
     }
     
-    # Broadcast emergency completion to all clients
-    socketio.emit('emergency_updated', {
+    # Payload parts shared by the completion broadcasts
+    reset_timestamp = datetime.utcnow().isoformat()
+    route_reset_info = {
+        'emergency_id': emergency.request_id,
+        'unit_id': unit.unit_id,
+        'routes_cleared': routes_cleared,
+        'reset_timestamp': reset_timestamp
+    }
+    completed_payload = {
         'action': 'completed',
         'emergency': emergency_data,
         'unit': unit_data,
-        'route_reset_info': {
-            'emergency_id': emergency.request_id,
-            'unit_id': unit.unit_id,
-            'routes_cleared': routes_cleared,
-            'reset_timestamp': datetime.utcnow().isoformat()
-        }
-    })
+        'route_reset_info': route_reset_info
+    }
+
+    # Broadcast emergency completion to all clients
+    socketio.emit('emergency_updated', completed_payload)
     
     # Broadcast to unit tracking room
-    socketio.emit('emergency_update', {
-        'action': 'completed',
-        'emergency': emergency_data,
-        'unit': unit_data,
-        'route_reset_info': {
-            'emergency_id': emergency.request_id,
-            'unit_id': unit.unit_id,
-            'routes_cleared': routes_cleared,
-            'reset_timestamp': datetime.utcnow().isoformat()
-        }
-    }, room='unit_tracking')
+    socketio.emit('emergency_update', completed_payload, room='unit_tracking')
     
     # Update unit status back to available
     socketio.emit('unit_status_update', {
@@ -1341,12 +2246,7 @@ def complete_emergency(emergency_id):
         'status': 'AVAILABLE',
         'emergency_id': emergency.request_id,
         'completed_emergency': emergency_data,
-        'route_reset_info': {
-            'emergency_id': emergency.request_id,
-            'unit_id': unit.unit_id,
-            'routes_cleared': routes_cleared,
-            'reset_timestamp': datetime.utcnow().isoformat()
-        }
+        'route_reset_info': route_reset_info
     })
     
     # Send specific route progress reset event
@@ -1355,7 +2255,7 @@ def complete_emergency(emergency_id):
         'emergency_id': emergency.request_id,
         'reset_reason': 'emergency_completed',
         'routes_cleared': routes_cleared,
-        'timestamp': datetime.utcnow().isoformat(),
+        'timestamp': reset_timestamp,
         'ready_for_new_assignment': True
     }, room='unit_tracking')
     
@@ -1370,49 +2270,39 @@ def complete_emergency(emergency_id):
 # -------------------------
 @authority_bp.route("/authority/units", methods=["GET"])
 @authority_required()
+@_cached_listing
 def get_units():
     page_arg = request.args.get("page")
     per_page_arg = request.args.get("per_page")
 
     # Backward compatibility: return full array when pagination is not requested.
     if page_arg is None and per_page_arg is None:
-        units = Unit.query.all()
-        data = []
-        for u in units:
-            data.append({
-                "unit_id": u.unit_id,
-                "unit_vehicle_number": u.unit_vehicle_number,
-                "service_type": u.service_type,
-                "status": u.status,
-                "latitude": u.latitude,
-                "longitude": u.longitude,
-                "last_updated": u.last_updated
-            })
-        return jsonify(data)
+        rows = db.session.execute(
+            select(*_UNIT_LIST_COLUMNS).execution_options(yield_per=UNIT_LIST_STREAM_BATCH_SIZE)
+        )
+        return current_app.response_class(
+            stream_with_context(_stream_json_array(rows, _UNIT_LIST_FIELDS)),
+            mimetype="application/json"
+        )
 
     page = request.args.get("page", default=1, type=int)
     per_page = request.args.get("per_page", default=10, type=int)
     page = max(1, page)
     per_page = max(1, min(per_page, 100))
 
-    query = Unit.query.order_by(Unit.unit_id.asc())
-    total = query.count()
+    # COUNT(*) OVER () returns the total with the page rows in one round-trip. Only a page
+    # past the end comes back empty; it is then clamped to the last page with a separate count.
+    rows = db.session.execute(_unit_page_stmt(page, per_page)).all()
+    if rows:
+        total = rows[0][-1]
+    else:
+        total = db.session.query(func.count(Unit.unit_id)).scalar()
     total_pages = max(1, math.ceil(total / per_page)) if total else 1
-    page = min(page, total_pages)
-    offset = (page - 1) * per_page
-
-    units = query.offset(offset).limit(per_page).all()
-    data = []
-    for u in units:
-        data.append({
-            "unit_id": u.unit_id,
-            "unit_vehicle_number": u.unit_vehicle_number,
-            "service_type": u.service_type,
-            "status": u.status,
-            "latitude": u.latitude,
-            "longitude": u.longitude,
-            "last_updated": u.last_updated
-        })
+    if page > total_pages:
+        page = total_pages
+        if total:
+            rows = db.session.execute(_unit_page_stmt(page, per_page)).all()
+    data = [dict(zip(_UNIT_LIST_FIELDS, row)) for row in rows]
 
     return jsonify({
         "data": data,
@@ -1424,24 +2314,36 @@ def get_units():
         "has_prev": page > 1
     })
 
+def _unit_page_stmt(page, per_page):
+    # The trailing column is the total row count; zip with _UNIT_LIST_FIELDS drops it.
+    return (
+        select(*_UNIT_LIST_COLUMNS, func.count().over())
+        .order_by(Unit.unit_id.asc())
+        .offset((page - 1) * per_page)
+        .limit(per_page)
+    )
+
+def _stream_json_array(rows, fields):
+    """
+    Yield a JSON array of row objects chunk by chunk, encoded the same way as jsonify.
+    Keeps memory flat for the unpaginated listing however many rows there are.
+    """
+    dumps = current_app.json.dumps
+    separator = ""
+    yield "["
+    for row in rows:
+        yield separator + dumps(dict(zip(fields, row)))
+        separator = ","
+    yield "]\n"
+
 # -------------------------
 # Get all emergencies (dashboard view)
 # -------------------------
 @authority_bp.route("/authority/emergencies", methods=["GET"])
 @authority_required()
+@_cached_listing
 def get_emergencies():
-    emergencies = Emergency.query.all()
-    data = []
-    for e in emergencies:
-        data.append({
-            "request_id": e.request_id,
-            "emergency_type": e.emergency_type,
-            "latitude": e.latitude,
-            "longitude": e.longitude,
-            "status": e.status,
-            "approved_by": e.approved_by,
-            "assigned_unit": e.assigned_unit,
-            "created_at": e.created_at
-        })
+    rows = db.session.query(*_EMERGENCY_LIST_COLUMNS).all()
+    data = [dict(zip(_EMERGENCY_LIST_FIELDS, row)) for row in rows]
     
     return jsonify(data)
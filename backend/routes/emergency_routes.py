@@ -1,4 +1,3 @@
-import os
 import json
 from flask import Blueprint, jsonify, request
 from models import Emergency, Unit, PublicTrackingLink, db
@@ -21,31 +20,22 @@ TRACKING_TOKEN_SALT = "public-emergency-tracking-v1"
 TRACKING_TOKEN_MAX_AGE_SECONDS = 7 * 24 * 60 * 60  # 7 days
 
 
-def _tracking_serializer():
-    return URLSafeTimedSerializer(SECRET_KEY, salt=TRACKING_TOKEN_SALT)
-
-
-def _build_tracking_token(request_id):
-    return _tracking_serializer().dumps({"request_id": int(request_id)})
+_TRACKING_SERIALIZER = URLSafeTimedSerializer(SECRET_KEY, salt=TRACKING_TOKEN_SALT)
+# Listings fetch plain column tuples rather than full ORM objects.
+_EMERGENCY_LIST_COLUMNS = (
+    Emergency.request_id, Emergency.emergency_type, Emergency.latitude, Emergency.longitude,
+    Emergency.status, Emergency.approved_by, Emergency.assigned_unit, Emergency.created_at
+)
+_EMERGENCY_LIST_FIELDS = tuple(column.key for column in _EMERGENCY_LIST_COLUMNS)
 
 
 def _decode_tracking_token(token):
-    return _tracking_serializer().loads(token, max_age=TRACKING_TOKEN_MAX_AGE_SECONDS)
-
-
-def _normalized_frontend_base_url():
-    base = (os.getenv('FRONTEND_BASE_URL') or '').strip() or 'http://127.0.0.1:3000'
-    # Avoid ERR_SSL_PROTOCOL_ERROR in local dev when browser tries https://localhost
-    if base.startswith('https://localhost') or base.startswith('https://127.0.0.1'):
-        base = base.replace('https://', 'http://', 1)
-    if 'localhost' in base:
-        base = base.replace('localhost', '127.0.0.1')
-    return base.rstrip('/')
+    return _TRACKING_SERIALIZER.loads(token, max_age=TRACKING_TOKEN_MAX_AGE_SECONDS)
 
 
 def _ensure_public_tracking_links_table():
     try:
-        PublicTrackingLink.__table__.create(bind=db.engine, checkfirst=True)
+        PublicTrackingLink.ensure_table()
     except Exception:
         # Avoid breaking emergency creation/read due schema drift.
         pass
@@ -55,22 +45,15 @@ def _resolve_unit_driver(unit_id):
     if not unit_id:
         return None
 
-    candidates = User.query.filter_by(role='unit').all()
-    for user in candidates:
-        org = (user.organization or "").strip()
-        if not org:
-            continue
-        normalized = org
-        if normalized.upper().startswith("UNIT_ID:"):
-            normalized = normalized.split(":", 1)[1].strip()
-        if normalized.isdigit() and int(normalized) == int(unit_id):
-            full_name = " ".join(part for part in [user.first_name, user.last_name] if part).strip() or user.email
-            return {
-                "name": full_name,
-                "phone": user.phone,
-                "email": user.email
-            }
-    return None
+    user = User.find_unit_contact(unit_id)
+    if not user:
+        return None
+    full_name = " ".join(part for part in [user.first_name, user.last_name] if part).strip() or user.email
+    return {
+        "name": full_name,
+        "phone": user.phone,
+        "email": user.email
+    }
 
 @emergency_bp.route('/emergencies', methods=['GET'])
 def get_emergencies():
@@ -79,20 +62,8 @@ def get_emergencies():
 
     # Backward compatibility: return full array when pagination is not requested.
     if page_arg is None and per_page_arg is None:
-        emergencies = Emergency.query.all()
-        output = []
-        for e in emergencies:
-            output.append({
-                'request_id': e.request_id,
-                'emergency_type': e.emergency_type,
-                'latitude': e.latitude,
-                'longitude': e.longitude,
-                'status': e.status,
-                'approved_by': e.approved_by,
-                'assigned_unit': e.assigned_unit,
-                'created_at': e.created_at
-            })
-        return jsonify(output)
+        rows = db.session.query(*_EMERGENCY_LIST_COLUMNS).all()
+        return jsonify([dict(zip(_EMERGENCY_LIST_FIELDS, row)) for row in rows])
 
     page = request.args.get("page", default=1, type=int)
     per_page = request.args.get("per_page", default=10, type=int)
@@ -105,19 +76,8 @@ def get_emergencies():
     page = min(page, total_pages)
     offset = (page - 1) * per_page
 
-    emergencies = query.offset(offset).limit(per_page).all()
-    output = []
-    for e in emergencies:
-        output.append({
-            'request_id': e.request_id,
-            'emergency_type': e.emergency_type,
-            'latitude': e.latitude,
-            'longitude': e.longitude,
-            'status': e.status,
-            'approved_by': e.approved_by,
-            'assigned_unit': e.assigned_unit,
-            'created_at': e.created_at
-        })
+    rows = query.with_entities(*_EMERGENCY_LIST_COLUMNS).offset(offset).limit(per_page).all()
+    output = [dict(zip(_EMERGENCY_LIST_FIELDS, row)) for row in rows]
 
     return jsonify({
         "data": output,
@@ -1,9 +1,10 @@
 from flask import Blueprint, request, jsonify
 from flask_socketio import emit, join_room, leave_room
 from models import db, Unit, UnitLocation, LocationHistory, RouteCalculation, Emergency
+from extensions import routing_session
+from utils.json_provider import loads_bytes
 from datetime import datetime, timedelta
 import json
-import requests
 
 location_bp = Blueprint('location', __name__)
 
@@ -400,11 +401,11 @@ def calculate_route():
             'annotations': True
         }
         
-        response = requests.get(osrm_url, params=osrm_params, timeout=30)
-        osrm_response = response.json()
+        response = routing_session.get(osrm_url, params=osrm_params, timeout=30)
         
         if response.status_code != 200:
             return jsonify({'error': 'Failed to calculate route'}), 500
+        osrm_response = loads_bytes(response.content)
         
         # Extract route data
         if not osrm_response.get('routes'):
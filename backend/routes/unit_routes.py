@@ -119,6 +119,13 @@ def point_to_segment_distance(point, segment_start, segment_end):
 
 unit_bp = Blueprint('unit_bp', __name__)
 
+# The unit listing fetches plain column tuples rather than full ORM objects.
+_UNIT_LIST_COLUMNS = (
+    Unit.unit_id, Unit.unit_vehicle_number, Unit.service_type, Unit.status,
+    Unit.latitude, Unit.longitude, Unit.last_updated
+)
+_UNIT_LIST_FIELDS = tuple(column.key for column in _UNIT_LIST_COLUMNS)
+
 
 def _get_user_unit_id(user):
     """
@@ -154,20 +161,8 @@ def unit_required():
 
 @unit_bp.route('/units', methods=['GET'])
 def get_units():
-    units = Unit.query.all()
-    output = []
-    for u in units:
-        output.append({
-            'unit_id': u.unit_id,
-            'unit_vehicle_number': u.unit_vehicle_number,
-            'service_type': u.service_type,
-            'latitude': u.latitude,
-            'longitude': u.longitude,
-            'status': u.status,
-            'last_updated': u.last_updated
-        })
-    
-    return jsonify(output)
+    rows = db.session.query(*_UNIT_LIST_COLUMNS).all()
+    return jsonify([dict(zip(_UNIT_LIST_FIELDS, row)) for row in rows])
 
 @unit_bp.route('/units/vehicle-number/<string:vehicle_number>', methods=['DELETE'])
 def delete_unit_by_vehicle_number(vehicle_number):
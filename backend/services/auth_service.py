@@ -1,13 +1,18 @@
 import re
 import secrets
 import os
+from collections import namedtuple
 from datetime import datetime, timedelta
 from flask import current_app
 from flask_jwt_extended import create_access_token, create_refresh_token
 from werkzeug.security import check_password_hash
+from sqlalchemy import update
 from models import db, User
 from utils.validators import validate_email_format, validate_password_strength
 
+# Column-only view of a user with the fields needed to mint tokens
+TokenUser = namedtuple('TokenUser', ['id', 'email', 'role', 'is_active', 'is_verified', 'is_approved'])
+
 class AuthService:
     """
     Authentication service for EROS system
@@ -117,13 +122,53 @@ class AuthService:
         except Exception as e:
             return 'auth_system_error', f"Authentication failed: {str(e)}", None
     
+    @staticmethod
+    def record_login_fast(user_id, update_last_login=True):
+        """
+        Record a successful login with a single UPDATE and commit
+        
+        Args:
+            user_id (int): User ID
+            update_last_login (bool): False only clears the failed-login counters
+        """
+        values = {'failed_login_attempts': 0, 'locked_until': None}
+        if update_last_login:
+            values['last_login'] = datetime.utcnow()
+        db.session.execute(
+            update(User)
+            .where(User.id == user_id)
+            .values(**values)
+        )
+        db.session.commit()
+    
+    @staticmethod
+    def get_user_for_token(user_id):
+        """
+        Fetch only the columns needed to issue tokens for a user
+        
+        Args:
+            user_id (int): User ID
+            
+        Returns:
+            TokenUser or None
+        """
+        row = db.session.query(
+            User.id,
+            User.email,
+            User.role,
+            User.is_active,
+            User.is_verified,
+            User.is_approved
+        ).filter(User.id == int(user_id)).first()
+        return TokenUser(*row) if row else None
+    
     @staticmethod
     def generate_tokens(user):
         """
         Generate JWT access and refresh tokens for user
         
         Args:
-            user (User): User object
+            user (User or TokenUser): User object or column-only user view
             
         Returns:
             dict: Dictionary containing access_token and refresh_token
@@ -171,22 +216,40 @@ class AuthService:
         Returns:
             tuple: (success: bool, message: str)
         """
+        success, message, _user = AuthService.verify_and_get_user(token)
+        return success, message
+    
+    @staticmethod
+    def verify_and_get_user(token):
+        """
+        Verify user's email and return the verified user from a single lookup
+        
+        Authority users also get their admin approval token in the same commit.
+        
+        Args:
+            token (str): Email verification token
+            
+        Returns:
+            tuple: (success: bool, message: str, user: User or None)
+        """
         try:
             # Find user by verification token
             user = User.find_by_verification_token(token)
             
             if not user:
-                return False, "Invalid or expired verification token"
+                return False, "Invalid or expired verification token", None
             
             # Verify email
             if user.verify_email(token):
+                if user.role == 'authority':
+                    user.generate_approval_token()
                 user.save()
-                return True, "Email verified successfully"
+                return True, "Email verified successfully", user
             else:
-                return False, "Verification token has expired"
+                return False, "Verification token has expired", None
             
         except Exception as e:
-            return False, f"Email verification failed: {str(e)}"
+            return False, f"Email verification failed: {str(e)}", None
     
     @staticmethod
     def resend_verification_email(user):
@@ -0,0 +1,48 @@
+import json
+from datetime import datetime
+from decimal import Decimal
+
+from flask import Flask, jsonify
+
+from utils.json_provider import OrjsonProvider, OrjsonSocketJSON, dumps_compact, loads_bytes
+
+
+def _make_app():
+    app = Flask(__name__)
+    app.json = OrjsonProvider(app)
+    return app
+
+
+def test_response_matches_default_provider_output():
+    payload = {'success': True, 'b': [1, 2], 'a': 'x', 'when': datetime(2024, 1, 1, 10, 0, 0)}
+    with Flask(__name__).app_context():
+        expected = jsonify(payload).get_data()
+    with _make_app().app_context():
+        assert jsonify(payload).get_data() == expected
+
+
+def test_unsupported_types_fall_back_to_default_encoder():
+    with _make_app().app_context():
+        assert jsonify({'amount': Decimal('1.50')}).get_json() == {'amount': '1.50'}
+
+
+def test_loads_round_trips_dumps():
+    app = _make_app()
+    assert app.json.loads(app.json.dumps({'id': 1, 'name': 'unit'})) == {'id': 1, 'name': 'unit'}
+
+
+def test_socket_json_matches_compact_stdlib_output():
+    payload = {'unit_id': 4, 'route_info': {'positions': [[27.7, 85.3]], 'distance': 1234.5}}
+    encoded = OrjsonSocketJSON.dumps(payload, separators=(',', ':'))
+    assert encoded == json.dumps(payload, separators=(',', ':'))
+    assert OrjsonSocketJSON.loads(encoded) == payload
+
+
+def test_loads_bytes_parses_utf8_body():
+    body = json.dumps({'routes': [{'geometry': 'abc', 'distance': 12.5}], 'code': 'Ok'}).encode('utf-8')
+    assert loads_bytes(body) == {'routes': [{'geometry': 'abc', 'distance': 12.5}], 'code': 'Ok'}
+
+
+def test_dumps_compact_matches_compact_stdlib_output():
+    waypoints = [[27.7172, 85.324], [27.71805, 85.32611]]
+    assert dumps_compact(waypoints) == json.dumps(waypoints, separators=(',', ':'))
@@ -0,0 +1,21 @@
+import polyline
+import pytest
+
+from utils.polyline_codec import decode_polyline, encode_polyline
+
+
+def test_decode_matches_polyline_package():
+    points = [(27.7172, 85.324), (27.71805, 85.32611), (27.72001, 85.3199), (-33.8688, 151.2093)]
+    encoded = polyline.encode(points)
+    assert decode_polyline(encoded) == polyline.decode(encoded)
+
+
+def test_encode_matches_polyline_package():
+    points = [(27.7172, 85.324), (27.71805, 85.32611), (-33.8688, 151.2093)]
+    assert encode_polyline(points) == polyline.encode(points)
+
+
+def test_decode_rejects_truncated_polyline():
+    # "@@@" ends halfway through a coordinate pair
+    with pytest.raises(ValueError):
+        decode_polyline("@@@")
@@ -0,0 +1,96 @@
+import json
+import os
+import random
+from types import SimpleNamespace
+
+import pytest
+
+os.environ.setdefault('JWT_SECRET_KEY', 'test-secret-key-that-is-long-enough-123')
+os.environ.setdefault('DATABASE_URL', 'postgresql+psycopg2://u:p@localhost/db')
+
+import routes.authority_routes as authority_routes  # noqa: E402
+
+
+def _random_walk(rng, start, steps, spread):
+    lat, lng = start
+    points = [[lat, lng]]
+    for _ in range(steps):
+        lat += rng.uniform(-spread, spread)
+        lng += rng.uniform(-spread, spread)
+        points.append([lat, lng])
+    return points
+
+
+def _traffic_lines(rng, count):
+    rows = []
+    for idx in range(count):
+        points = _random_walk(rng, (27.70 + rng.random() * 0.03, 85.30 + rng.random() * 0.03), rng.randint(1, 6), 0.002)
+        rows.append(SimpleNamespace(
+            id=idx + 1,
+            jam_level=rng.choice(["LOW", "MEDIUM", "HIGH"]),
+            geometry=json.dumps({"type": "LineString", "coordinates": [[lng, lat] for lat, lng in points]})
+        ))
+    return authority_routes._parse_traffic_segments(rows)
+
+
+def _routes(rng, count):
+    return [
+        _random_walk(rng, (27.70 + rng.random() * 0.03, 85.30 + rng.random() * 0.03), rng.randint(2, 60), 0.0008)
+        for _ in range(count)
+    ]
+
+
+def _assert_same_eval(actual, expected):
+    assert actual["blocked"] == expected["blocked"]
+    assert actual["jam_hit_counts"] == expected["jam_hit_counts"]
+    assert actual["penalty_seconds"] == pytest.approx(expected["penalty_seconds"], rel=1e-9, abs=1e-9)
+    assert actual.get("jam_overlap_m") == pytest.approx(expected.get("jam_overlap_m"), rel=1e-9, abs=1e-9)
+
+
+def _scalar_evals(monkeypatch, routes, lines):
+    with monkeypatch.context() as patch:
+        patch.setattr(authority_routes, "np", None)
+        return [authority_routes.evaluate_route_traffic_penalty(route, lines) for route in routes]
+
+
+@pytest.mark.parametrize("seed", range(8))
+def test_vectorized_route_scoring_matches_scalar_loop(monkeypatch, seed):
+    rng = random.Random(seed)
+    lines = _traffic_lines(rng, 20)
+    routes = _routes(rng, 4)
+
+    vectorized = [authority_routes.evaluate_route_traffic_penalty(route, lines) for route in routes]
+
+    for actual, expected in zip(vectorized, _scalar_evals(monkeypatch, routes, lines)):
+        _assert_same_eval(actual, expected)
+
+
+@pytest.mark.parametrize("seed", range(8))
+def test_batched_scoring_matches_single_route_scoring(monkeypatch, seed):
+    rng = random.Random(seed)
+    lines = _traffic_lines(rng, 20)
+    routes = _routes(rng, 6) + [[], [[27.71, 85.31]]]
+
+    batched = authority_routes.evaluate_routes_traffic_penalty(routes, lines)
+
+    assert len(batched) == len(routes)
+    singles = [authority_routes.evaluate_route_traffic_penalty(route, lines) for route in routes]
+    for actual, expected in zip(batched, singles):
+        _assert_same_eval(actual, expected)
+    for actual, expected in zip(batched, _scalar_evals(monkeypatch, routes, lines)):
+        _assert_same_eval(actual, expected)
+
+
+@pytest.mark.parametrize("line_count", [authority_routes.TRAFFIC_GRID_MIN_LINES - 1, authority_routes.TRAFFIC_GRID_MIN_LINES, 80])
+@pytest.mark.parametrize("seed", range(4))
+def test_batched_scoring_matches_single_route_scoring_around_grid_threshold(monkeypatch, line_count, seed):
+    rng = random.Random(seed)
+    lines = _traffic_lines(rng, line_count)
+    routes = _routes(rng, 6)
+
+    batched = authority_routes.evaluate_routes_traffic_penalty(routes, lines)
+
+    for route, actual in zip(routes, batched):
+        _assert_same_eval(actual, authority_routes.evaluate_route_traffic_penalty(route, lines))
+    for actual, expected in zip(batched, _scalar_evals(monkeypatch, routes, lines)):
+        _assert_same_eval(actual, expected)
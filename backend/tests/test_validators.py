@@ -1,4 +1,5 @@
 from utils.validators import (
+    required_fields_checker,
     validate_email_format,
     validate_password_strength,
     validate_required_fields,
@@ -25,3 +26,21 @@ def test_validate_required_fields_returns_missing_fields():
     is_valid, missing = validate_required_fields({"email": "a@b.com"}, ["email", "password"])
     assert is_valid is False
     assert missing == ["password"]
+
+
+def test_required_fields_checker_matches_validate_required_fields():
+    check = required_fields_checker("token", "new_password")
+    assert check({"token": "abc", "new_password": "x"}) == (True, [])
+    assert check({"token": "", "other": 1}) == (False, ["token", "new_password"])
+
+
+def test_validate_email_format_rejects_missing_domain_without_library_call():
+    assert validate_email_format("student@") is False
+
+
+def test_validate_password_strength_requires_special_character():
+    assert validate_password_strength("StrongPass123") is False
+
+
+def test_validate_password_strength_ignores_non_ascii_letters():
+    assert validate_password_strength("ÄÖÜpass123!") is False
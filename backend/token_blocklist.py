@@ -1,19 +1,139 @@
+import logging
+import threading
+import time
+import uuid
+from datetime import datetime, timedelta
+from extensions import get_redis
 from models import db, RevokedToken
 
+try:
+    from redis.exceptions import WatchError
+except Exception:
+    WatchError = None
 
-def revoke_token(jti):
+logger = logging.getLogger('auth')
+
+REDIS_KEY_PREFIX = "jwt:blk:"
+# Bumped whenever a revocation may be missing from Redis (a failed SETEX).
+REDIS_GENERATION_KEY = "jwt:blk:gen"
+# Holds the generation a complete rebuild from revoked_tokens was made at. Missing keys are
+# only trusted while it equals the current generation; a Redis restart or flush drops it.
+# This assumes Redis does not evict individual keys (maxmemory-policy noeviction).
+REDIS_EPOCH_KEY = "jwt:blk:epoch"
+REDIS_REBUILD_LOCK_KEY = "jwt:blk:rebuild"
+REDIS_REBUILD_LOCK_SECONDS = 30
+DEFAULT_REVOCATION_TTL_SECONDS = 30 * 24 * 60 * 60  # longest token lifetime (refresh)
+_LOCAL_PRUNE_THRESHOLD = 10_000
+
+# jti -> expiry (epoch seconds) for tokens revoked or seen revoked by this process
+_revoked_jtis = {}
+_revoked_lock = threading.Lock()
+
+
+def _remember_revoked(token_id, expires_at):
+    now = time.time()
+    with _revoked_lock:
+        if len(_revoked_jtis) >= _LOCAL_PRUNE_THRESHOLD:
+            for stale_id in [key for key, exp in _revoked_jtis.items() if exp <= now]:
+                del _revoked_jtis[stale_id]
+        _revoked_jtis[token_id] = expires_at
+
+
+def _sync_redis_blocklist(client):
+    """Copy unexpired revocations from revoked_tokens into Redis, then mark Redis complete.
+
+    One worker rebuilds at a time. The epoch is only set if no revocation failed to reach
+    Redis while the rows were being read; otherwise the next reader rebuilds again.
+    """
+    lock_token = uuid.uuid4().hex
+    if not client.set(REDIS_REBUILD_LOCK_KEY, lock_token, nx=True, ex=REDIS_REBUILD_LOCK_SECONDS):
+        return
+    try:
+        with client.pipeline() as pipe:
+            pipe.watch(REDIS_GENERATION_KEY)
+            generation = int(pipe.get(REDIS_GENERATION_KEY) or 0)
+            cutoff = datetime.utcnow() - timedelta(seconds=DEFAULT_REVOCATION_TTL_SECONDS)
+            rows = db.session.query(RevokedToken.jti, RevokedToken.revoked_at).filter(
+                RevokedToken.revoked_at > cutoff
+            ).all()
+            pipe.multi()
+            for token_id, revoked_at in rows:
+                ttl = int((revoked_at - cutoff).total_seconds())
+                pipe.setex(f"{REDIS_KEY_PREFIX}{token_id}", max(ttl, 1), 1)
+            pipe.set(REDIS_EPOCH_KEY, generation)
+            try:
+                pipe.execute()
+            except WatchError:
+                logger.info("Token blocklist rebuild raced a failed revocation; retrying on next check")
+                return
+        logger.info("Rebuilt Redis token blocklist with %d revocation(s)", len(rows))
+    finally:
+        if client.get(REDIS_REBUILD_LOCK_KEY) in (lock_token, lock_token.encode()):
+            client.delete(REDIS_REBUILD_LOCK_KEY)
+
+
+def revoke_token(jti, exp=None):
     if not jti:
         return
     token_id = str(jti)
+    now = time.time()
+    expires_at = float(exp) if exp else now + DEFAULT_REVOCATION_TTL_SECONDS
+    _remember_revoked(token_id, expires_at)
+
+    # The DB row is written first so a Redis rebuild always includes this revocation.
     exists = RevokedToken.query.filter_by(jti=token_id).first()
-    if exists:
+    if not exists:
+        db.session.add(RevokedToken(jti=token_id))
+        db.session.commit()
+
+    client = get_redis()
+    if client is None:
         return
-    db.session.add(RevokedToken(jti=token_id))
-    db.session.commit()
+    try:
+        client.setex(f"{REDIS_KEY_PREFIX}{token_id}", max(int(expires_at - now), 1), 1)
+    except Exception as e:
+        logger.warning("Could not write token revocation to Redis: %s", e)
+        # Other workers must not trust Redis without this key: bumping the generation sends
+        # them to the DB until a rebuild that started after it completes. If that fails too,
+        # logout fails.
+        client.incr(REDIS_GENERATION_KEY)
 
 
 def is_token_revoked(jti):
     if not jti:
         return False
     token_id = str(jti)
-    return RevokedToken.query.filter_by(jti=token_id).first() is not None
+    if token_id in _revoked_jtis:
+        return True
+
+    # Redis carries revocations from other workers; the DB is the fallback without it.
+    client = get_redis()
+    ttl = None
+    complete = False
+    if client is not None:
+        try:
+            pipe = client.pipeline(transaction=False)
+            pipe.ttl(f"{REDIS_KEY_PREFIX}{token_id}")
+            pipe.get(REDIS_EPOCH_KEY)
+            pipe.get(REDIS_GENERATION_KEY)
+            ttl, epoch, generation = pipe.execute()
+            complete = epoch is not None and int(epoch) == int(generation or 0)
+        except Exception:
+            ttl = None
+        # TTL is -2 when the key does not exist and -1 when it has no expiry.
+        if ttl is not None and ttl != -2:
+            _remember_revoked(token_id, time.time() + (ttl if ttl >= 0 else DEFAULT_REVOCATION_TTL_SECONDS))
+            return True
+        # A missing key is only final while the epoch shows Redis has not lost keys.
+        if ttl == -2 and complete:
+            return False
+
+    revoked = RevokedToken.query.filter_by(jti=token_id).first() is not None
+    if revoked:
+        _remember_revoked(token_id, time.time() + DEFAULT_REVOCATION_TTL_SECONDS)
+    if ttl == -2:
+        try:
+            _sync_redis_blocklist(client)
+        except Exception as e:
+            logger.warning("Could not rebuild Redis token blocklist: %s", e)
+    return revoked
@@ -0,0 +1,90 @@
+import json
+
+from flask.json.provider import DefaultJSONProvider
+
+try:
+    import orjson
+except Exception:
+    orjson = None
+
+
+def loads_bytes(data):
+    """Parse a UTF-8 JSON body such as requests' resp.content, with orjson when it is installed"""
+    if orjson is None:
+        return json.loads(data)
+    return orjson.loads(data)
+
+
+def dumps_compact(obj):
+    """Serialize to a compact JSON str (no spaces after separators), with orjson when it is installed"""
+    if orjson is not None:
+        try:
+            return orjson.dumps(obj).decode('utf-8')
+        except TypeError:
+            pass
+    return json.dumps(obj, separators=(',', ':'))
+
+
+class OrjsonProvider(DefaultJSONProvider):
+    """
+    Flask JSON provider that serializes with orjson when it is installed
+
+    Output matches Flask's default provider: keys are sorted, dates go
+    through Flask's RFC 822 formatter, and anything orjson rejects falls
+    back to the stdlib encoder.
+    """
+
+    _options = (
+        orjson.OPT_SORT_KEYS | orjson.OPT_NON_STR_KEYS | orjson.OPT_PASSTHROUGH_DATETIME
+        if orjson else 0
+    )
+
+    def dumps(self, obj, **kwargs):
+        if orjson is None or kwargs:
+            return super().dumps(obj, **kwargs)
+        try:
+            return orjson.dumps(obj, default=self.default, option=self._options).decode('utf-8')
+        except TypeError:
+            return super().dumps(obj)
+
+    def loads(self, s, **kwargs):
+        if orjson is None or kwargs:
+            return super().loads(s, **kwargs)
+        return orjson.loads(s)
+
+    def response(self, *args, **kwargs):
+        # Debug mode (or compact=False) keeps the indented stdlib output.
+        if orjson is None or self.compact is False or (self.compact is None and self._app.debug):
+            return super().response(*args, **kwargs)
+
+        obj = self._prepare_response_obj(args, kwargs)
+        try:
+            body = orjson.dumps(obj, default=self.default, option=self._options | orjson.OPT_APPEND_NEWLINE)
+        except TypeError:
+            return super().response(*args, **kwargs)
+        return self._app.response_class(body, mimetype=self.mimetype)
+
+
+class OrjsonSocketJSON:
+    """
+    Drop-in for the json module used by python-socketio packets
+
+    Socket.IO encodes with compact separators, which is orjson's only
+    output format. Other keyword arguments and payloads orjson rejects
+    go through the stdlib encoder.
+    """
+
+    @staticmethod
+    def dumps(obj, **kwargs):
+        if orjson is not None and kwargs.keys() <= {'separators'}:
+            try:
+                return orjson.dumps(obj).decode('utf-8')
+            except TypeError:
+                pass
+        return json.dumps(obj, **kwargs)
+
+    @staticmethod
+    def loads(s, **kwargs):
+        if orjson is None or kwargs:
+            return json.loads(s, **kwargs)
+        return orjson.loads(s)
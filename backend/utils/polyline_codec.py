@@ -0,0 +1,39 @@
+import polyline
+
+try:
+    from pypolyline.cutil import decode_polyline as _rust_decode_polyline
+    from pypolyline.cutil import encode_coordinates as _rust_encode_coordinates
+except Exception:
+    _rust_decode_polyline = None
+    _rust_encode_coordinates = None
+
+# OSRM and OpenRouteService encode polylines with 5 decimal places
+POLYLINE_PRECISION = 5
+
+
+def decode_polyline(geometry):
+    """
+    Decode an encoded polyline into (lat, lng) tuples.
+
+    Uses the Rust-backed pypolyline decoder when it is installed and the
+    pure-Python polyline package otherwise; both give the same points.
+    Malformed input raises ValueError with either backend.
+    """
+    try:
+        if _rust_decode_polyline is None:
+            return polyline.decode(geometry, POLYLINE_PRECISION)
+        # pypolyline returns [lng, lat] pairs
+        return [(lat, lng) for lng, lat in _rust_decode_polyline(geometry, POLYLINE_PRECISION)]
+    except (RuntimeError, IndexError, TypeError) as e:
+        # pypolyline raises RuntimeError, the polyline package IndexError on truncated input
+        raise ValueError(f"Invalid encoded polyline: {e}") from e
+
+
+def encode_polyline(points):
+    """
+    Encode (lat, lng) points into a polyline string, the inverse of decode_polyline.
+    """
+    if _rust_encode_coordinates is None:
+        return polyline.encode(points, POLYLINE_PRECISION)
+    # pypolyline takes [lng, lat] pairs and returns bytes
+    return _rust_encode_coordinates([[lng, lat] for lat, lng in points], POLYLINE_PRECISION).decode('ascii')
@@ -2,6 +2,15 @@ import re
 import email_validator
 from email_validator import validate_email, EmailNotValidError
 
+# Precompiled patterns shared by the validators below
+_EMAIL_RE = re.compile(r'[^@\s]+@[^@\s]+\.[^@\s]+')
+_PHONE_STRIP_RE = re.compile(r'[^\d+]')
+_PHONE_RE = re.compile(r'^[\+]?[1-9][\d]{0,15}$')
+_NAME_RE = re.compile(r'^[a-zA-Z\s\-\'\.]+$')
+_TOKEN_RE = re.compile(r'^[a-zA-Z0-9_\-\.]+$')
+_URL_RE = re.compile(r'^https?://[^\s/$.?#].[^\s]*$')
+_PASSWORD_SPECIAL_CHARS = frozenset('!@#$%^&*()_+-=[]{}|;:,.<>?')
+
 def validate_email_format(email):
     """
     Validate email format using email-validator library
@@ -16,6 +25,10 @@ def validate_email_format(email):
         if not email or not isinstance(email, str):
             return False
 
+        # Cheap syntactic reject before the full library check
+        if not _EMAIL_RE.fullmatch(email):
+            return False
+
         # Use email-validator library for robust validation
         valid = validate_email(email)
         return True
@@ -47,24 +60,19 @@ def validate_password_strength(password):
     if len(password) < 8:
         return False
     
-    # Check for uppercase letter
-    if not re.search(r'[A-Z]', password):
-        return False
-    
-    # Check for lowercase letter
-    if not re.search(r'[a-z]', password):
-        return False
-    
-    # Check for digit
-    if not re.search(r'\d', password):
-        return False
-    
-    # Check for special character
-    special_chars = r'[!@#$%^&*()_+\-=\[\]{}|;:,.<>?]'
-    if not re.search(special_chars, password):
-        return False
-    
-    return True
+    # Check character classes in a single pass
+    has_upper = has_lower = has_digit = has_special = False
+    for char in password:
+        if 'A' <= char <= 'Z':
+            has_upper = True
+        elif 'a' <= char <= 'z':
+            has_lower = True
+        elif char.isdecimal():
+            has_digit = True
+        elif char in _PASSWORD_SPECIAL_CHARS:
+            has_special = True
+    
+    return has_upper and has_lower and has_digit and has_special
 
 def validate_phone_number(phone):
     """
@@ -80,15 +88,14 @@ def validate_phone_number(phone):
         return False
     
     # Remove common separators
-    clean_phone = re.sub(r'[^\d+]', '', phone)
+    clean_phone = _PHONE_STRIP_RE.sub('', phone)
     
     # Check if it's a valid phone number (7-15 digits)
     if len(clean_phone) < 7 or len(clean_phone) > 15:
         return False
     
     # Basic pattern check
-    phone_pattern = r'^[\+]?[1-9][\d]{0,15}$'
-    return bool(re.match(phone_pattern, clean_phone))
+    return bool(_PHONE_RE.match(clean_phone))
 
 def validate_name(name, min_length=2, max_length=100):
     """
@@ -113,8 +120,7 @@ def validate_name(name, min_length=2, max_length=100):
         return False
     
     # Check for valid characters (letters, spaces, hyphens, apostrophes)
-    name_pattern = r'^[a-zA-Z\s\-\'\.]+$'
-    return bool(re.match(name_pattern, clean_name))
+    return bool(_NAME_RE.match(clean_name))
 
 def validate_role(role):
     """
@@ -143,8 +149,7 @@ def validate_token(token):
         return False
     
     # Basic token validation (alphanumeric and some special chars)
-    token_pattern = r'^[a-zA-Z0-9_\-\.]+$'
-    return bool(re.match(token_pattern, token))
+    return bool(_TOKEN_RE.match(token))
 
 def validate_url(url):
     """
@@ -159,8 +164,7 @@ def validate_url(url):
     if not url or not isinstance(url, str):
         return False
     
-    url_pattern = r'^https?://[^\s/$.?#].[^\s]*$'
-    return bool(re.match(url_pattern, url))
+    return bool(_URL_RE.match(url))
 
 def sanitize_input(input_str):
     """
@@ -236,6 +240,24 @@ def validate_required_fields(data, required_fields):
     
     return len(missing_fields) == 0, missing_fields
 
+def required_fields_checker(*required_fields):
+    """
+    Build a validator bound to a fixed set of required fields
+    
+    Args:
+        *required_fields (str): Required field names
+        
+    Returns:
+        callable: check(data) -> (is_valid: bool, missing_fields: list)
+    """
+    fields = tuple(required_fields)
+    
+    def check(data):
+        missing_fields = [field for field in fields if not data.get(field)]
+        return not missing_fields, missing_fields
+    
+    return check
+
 def validate_email_domain(email):
     """
     Check if email domain is allowed (optional feature)